@@ -0,0 +1,309 @@
+
+import os
+import os.path
+import random
+import sys
+import time
+import timeit
+
+# The current directory is needed to resolve the processors and www folders
+current_dir = os.path.abspath(os.path.dirname(__file__))
+
+def generate(log_path, players=64, days=3, games=8, events=3000, seed=1):
+    '''
+    Writes a synthetic game log with random kills, vehicle use, teamwork and
+    chat. Every day starts the server again and plays the given number of
+    games. The same seed always produces the same log, so the log can be used
+    to compare the performance of two versions of the code.
+
+    Args:
+        log_path (string): The log file to write.
+        players (int): The number of players that connect every day.
+        days (int): The number of server starts.
+        games (int): The number of games played every day.
+        events (int): The number of random player actions in each game.
+        seed (int): The seed of the random number generator.
+
+    Returns:
+        None
+    '''
+
+    sys.path.insert(0, current_dir)
+    import models
+
+    rand = random.Random(seed)
+    kits = sorted(models.kits.registry, key=lambda kit: kit.id)
+    vehicles = sorted([vehicle for vehicle in models.vehicles.registry
+            if vehicle.slot_ids], key=lambda vehicle: vehicle.id)
+    map_ids = sorted(game_map.id for game_map in models.maps.registry)
+    names = ['Player %02i' % index for index in range(players)]
+
+    log_file = open(log_path, 'w')
+    try:
+        def write(tick, *values):
+            log_file.write(';'.join(['%05i' % tick] + [str(value)
+                    for value in values]) + '\n')
+
+        def pos():
+            return '%.1f,%.1f,%.1f,%.1f' % (rand.uniform(-500, 500),
+                    rand.uniform(0, 300), rand.uniform(-500, 500),
+                    rand.uniform(-180, 180))
+
+        for day in range(days):
+            tick = 0
+            write(tick, 'SS', 'start', '2012-06-%02i_10-00-00' % (day + 1))
+            write(tick, 'GS', 'pre', 'None', 1200, 0)
+            for index, name in enumerate(names):
+                write(tick, 'CN', _get_address(index), name)
+
+            for game in range(games):
+                map_id = rand.choice(map_ids)
+                tick += 5
+                write(tick, 'GS', 'pre', map_id, 1200, 0)
+                write(tick, 'RS', 0)
+                write(tick, 'GS', 'play', map_id, 1200, 0)
+
+                # Each player has a team, a kit, whether they are alive and a vehicle
+                name_to_state = dict()
+                for index, name in enumerate(names):
+                    team = 'us' if index % 2 else 'ch'
+                    kit = rand.choice([kit for kit in kits
+                            if kit.id.startswith(team)] or kits)
+                    name_to_state[name] = [team, kit, False, None]
+
+                for index in range(4):
+                    write(tick, 'CP', 4001 + index, pos(), 'top',
+                            rand.choice(['us', 'ch', 'None']))
+
+                for event in range(events):
+                    if rand.random() < 0.3:
+                        tick += 1
+                    tick = _write_action(write, pos, rand, names, name_to_state,
+                            vehicles, tick, event)
+
+                write(tick, 'WN', 'us', 3)
+                write(tick, 'LS', 'ch', 3)
+                write(tick, 'GS', 'end', map_id, 1200, 0)
+
+            for index, name in enumerate(names):
+                write(tick, 'DC', _get_address(index), name)
+    finally:
+        log_file.close()
+
+def ingest(log_path):
+    '''
+    Processes the given log file without starting the web server and measures
+    the time spent, the time spent updating player places, the memory used by
+    the statistics objects and the peak memory of the process. This must be
+    called in a fresh process.
+
+    Args:
+        log_path (string): The log file to ingest.
+
+    Returns:
+        metrics (dict): The measurements of the ingestion.
+    '''
+
+    os.chdir(current_dir)
+    sys.path.insert(0, current_dir)
+
+    import cherrypy
+    import plugin
+    import regression
+    import processors.core.player_scores
+
+    # Measure the place updates of the player scores processor separately
+    place_time = [0.0]
+    processor_class = processors.core.player_scores.Processor
+    for name in ('_update_place', '_update_place_overall'):
+        if hasattr(processor_class, name):
+            setattr(processor_class, name, _timed(getattr(processor_class, name),
+                    place_time))
+
+    # Keep the manager console output away from the measurements
+    stdout = sys.stdout
+    stderr = sys.stderr
+    sys.stdout = sys.stderr = regression._ErrorCounter()
+    try:
+        start_time = time.time()
+        stats_plugin = plugin.StatsPlugin(cherrypy.engine)
+        stats_plugin.log_file_path = log_path
+        stats_plugin.debug_enabled = False
+        stats_plugin.start()
+        stats_plugin.main()
+        ingest_time = time.time() - start_time
+        errors = sys.stdout.count
+    finally:
+        sys.stdout = stdout
+        sys.stderr = stderr
+
+    from stats import stat_mgr
+    stats_count = 0
+    stats_bytes = 0
+    seen = set()
+    for model_to_stats in stat_mgr.type_to_stats.itervalues():
+        for model_stats in model_to_stats.itervalues():
+            stats_count += 1
+            stats_bytes += _get_stats_size(model_stats, seen)
+
+    return {
+        'lines': stat_mgr.get_stats().lines,
+        'errors': errors,
+        'ingest_ms': int(round(ingest_time * 1000)),
+        'place_ms': int(round(place_time[0] * 1000)),
+        'stats_count': stats_count,
+        'stats_kb': stats_bytes / 1024,
+        'peak_kb': regression._get_peak_memory()
+    }
+
+def geometry(targets=600, repeat=20):
+    '''
+    Compares the batch distance function of the stats manager with calling the
+    single pair function in a loop, for one position and for many positions.
+
+    Args:
+        targets (int): The number of positions to compare with.
+        repeat (int): The number of times each comparison is timed.
+
+    Returns:
+        results (list): A list of the origin count, the loop time in
+                milliseconds and the batch time in milliseconds.
+    '''
+
+    sys.path.insert(0, current_dir)
+    from stats import stat_mgr
+
+    rand = random.Random(1)
+    positions = [[rand.uniform(-500, 500), rand.uniform(0, 300),
+            rand.uniform(-500, 500), rand.uniform(-180, 180)]
+            for index in range(targets)]
+
+    results = list()
+    for origins in (positions[:1], positions[:90]):
+        loop_time = min(timeit.repeat(lambda: [[stat_mgr.dist_3d(origin, target)
+                for target in positions] for origin in origins],
+                number=1, repeat=repeat))
+        batch_time = min(timeit.repeat(lambda: stat_mgr.dist_3d_all(
+                origins, positions), number=1, repeat=repeat))
+        results.append([len(origins), loop_time * 1000, batch_time * 1000])
+    return results
+
+def _get_address(index):
+    return '10.0.%i.%i' % (index / 200, index % 200 + 1)
+
+def _get_stats_size(model_stats, seen):
+
+    # Count the statistics object and the breakdowns it holds for other models
+    size = _get_object_size(model_stats, seen)
+    for key in ('enemies', 'kits', 'maps', 'players', 'teams', 'vehicles',
+            'weapons'):
+        value = getattr(model_stats, key, None)
+        if isinstance(value, dict):
+            size += sys.getsizeof(value)
+            for item_value in value.itervalues():
+                size += _get_object_size(item_value, seen)
+        elif value is not None and hasattr(value, '__len__'):
+            size += sys.getsizeof(value)
+    return size
+
+def _get_object_size(value, seen):
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if hasattr(value, '__dict__'):
+        size += sys.getsizeof(value.__dict__)
+    return size
+
+def _timed(function, total):
+    def run(*args, **kwargs):
+        start_time = time.time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            total[0] += time.time() - start_time
+    return run
+
+def _write_action(write, pos, rand, names, name_to_state, vehicles, tick, event):
+    name = rand.choice(names)
+    team, kit, alive, vehicle = name_to_state[name]
+
+    # Dead players spawn before doing anything else
+    if not alive:
+        write(tick, 'SP', name, pos(), team)
+        write(tick, 'KP', name, pos(), kit.id)
+        write(tick, 'WP', name, pos(), rand.choice(kit.weapon_ids))
+        name_to_state[name][2] = True
+        if rand.random() < 0.1:
+            write(tick, 'SQ', name, '%s_%i' % (team, rand.randint(1, 6)))
+        return tick
+
+    action = rand.random()
+    if action < 0.25:
+        victim = rand.choice(names)
+        victim_state = name_to_state[victim]
+        if victim == name or not victim_state[2]:
+            return tick
+
+        weapon_id = rand.choice(kit.weapon_ids)
+        write(tick, 'KL', victim, pos(), name, pos(), weapon_id,
+                vehicle.id if vehicle else 'None')
+        write(tick, 'SC', name, 2)
+        write(tick, 'AC', name, weapon_id, rand.randint(1, 20),
+                rand.randint(20, 60))
+        write(tick, 'DT', victim, pos())
+        write(tick, 'KD', victim, pos(), victim_state[1].id)
+        if victim_state[3]:
+            write(tick, 'VX', victim, pos(), victim_state[3].id,
+                    sorted(victim_state[3].slot_ids)[0])
+            victim_state[3] = None
+        victim_state[2] = False
+    elif action < 0.45:
+        write(tick, 'WP', name, pos(), rand.choice(kit.weapon_ids))
+    elif action < 0.55:
+        if vehicle:
+            write(tick, 'VX', name, pos(), vehicle.id,
+                    sorted(vehicle.slot_ids)[0])
+            name_to_state[name][3] = None
+        else:
+            vehicle = rand.choice(vehicles)
+            write(tick, 'VE', name, pos(), vehicle.id,
+                    sorted(vehicle.slot_ids)[0], 'False')
+            name_to_state[name][3] = vehicle
+    elif action < 0.65:
+        other = rand.choice(names)
+        if other != name and name_to_state[other][2]:
+            write(tick, rand.choice(['HL', 'RV', 'AM']), other, pos(), name,
+                    pos())
+            write(tick, 'SC', name, 1)
+    elif action < 0.7:
+        write(tick, 'AS', name, pos(), 'driver')
+    elif action < 0.75:
+        write(tick, 'CH', 'global', name, 'hello there %i' % event)
+    elif action < 0.8:
+        write(tick, 'SC', name, rand.choice([-1, 1, 2, 3]))
+    else:
+        write(tick, 'AC', name, rand.choice(kit.weapon_ids),
+                rand.randint(0, 5), rand.randint(5, 30))
+    return tick
+
+# Generate synthetic logs and measure how the code performs on them
+# Usage: benchmark.py generate log_path [players days games events]
+#        benchmark.py ingest log_path
+#        benchmark.py geometry
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if len(args) >= 2 and args[0] == 'generate':
+        generate(args[1], *[int(arg) for arg in args[2:]])
+    elif len(args) == 2 and args[0] == 'ingest':
+        metrics = ingest(os.path.abspath(args[1]))
+        for key in sorted(metrics):
+            print '%-12s %10s' % (key, metrics[key])
+    elif len(args) == 1 and args[0] == 'geometry':
+        print '%-8s %10s %10s' % ('Origins', 'Loop ms', 'Batch ms')
+        for origins, loop_time, batch_time in geometry():
+            print '%-8i %10.2f %10.2f' % (origins, loop_time, batch_time)
+    else:
+        print 'Usage: benchmark.py generate|ingest|geometry'
+        sys.exit(1)
@@ -0,0 +1,278 @@
+
+import collections
+
+class Streak(object):
+    '''
+    Counts how many times in a row the same value was added for each key,
+    such as the consecutive kills of a player against the same victim.
+    '''
+
+    def __init__(self):
+        self.key_to_value = dict()
+        self.key_to_count = dict()
+
+    def add(self, key, value=None):
+        '''
+        Adds a value for the given key, which extends the streak when it matches
+        the previous value of the key or starts a new streak otherwise.
+
+        Args:
+            key (object): The key the value belongs to, such as a player.
+            value (object): The value to compare with the previous value.
+
+        Returns:
+            count (int): The length of the current streak of the key.
+        '''
+
+        if key in self.key_to_value and self.key_to_value[key] == value:
+            count = self.key_to_count[key] + 1
+        else:
+            count = 1
+        self.key_to_value[key] = value
+        self.key_to_count[key] = count
+        return count
+
+    def get(self, key):
+        '''
+        Gets the length of the current streak of the given key.
+
+        Args:
+            key (object): The key to look up.
+
+        Returns:
+            count (int): The length of the streak or 0 when there is none.
+        '''
+
+        return self.key_to_count.get(key, 0)
+
+    def reset(self, key):
+        '''
+        Ends the current streak of the given key.
+
+        Args:
+            key (object): The key to reset.
+
+        Returns:
+            None
+        '''
+
+        self.key_to_value.pop(key, None)
+        self.key_to_count.pop(key, None)
+
+class Window(object):
+    '''
+    Counts the events of each key that happened within a sliding window of
+    ticks. Only the ticks of the events inside the window are kept, so events
+    are dropped as the window moves past them.
+    '''
+
+    def __init__(self, ticks):
+        self.ticks = ticks
+        self.key_to_ticks = dict()
+
+    def add(self, key, tick):
+        '''
+        Adds an event for the given key.
+
+        Args:
+            key (object): The key the event belongs to, such as a player.
+            tick (int): The tick at which the event happened.
+
+        Returns:
+            count (int): The number of events of the key within the window.
+        '''
+
+        count = self.get(key, tick)
+        if not count:
+            self.key_to_ticks[key] = collections.deque()
+        self.key_to_ticks[key].append(tick)
+        return count + 1
+
+    def get(self, key, tick):
+        '''
+        Gets the number of events of the given key within the window that ends
+        at the given tick.
+
+        Args:
+            key (object): The key to look up.
+            tick (int): The current tick.
+
+        Returns:
+            count (int): The number of events of the key within the window.
+        '''
+
+        if not key in self.key_to_ticks:
+            return 0
+
+        # Drop all the events when the game clock restarted with a new server
+        ticks = self.key_to_ticks[key]
+        if ticks and tick < ticks[-1]:
+            del self.key_to_ticks[key]
+            return 0
+
+        # Drop the events that are no longer within the window
+        while ticks and tick - ticks[0] > self.ticks:
+            ticks.popleft()
+        return len(ticks)
+
+    def reset(self, key):
+        '''
+        Drops all the events of the given key.
+
+        Args:
+            key (object): The key to reset.
+
+        Returns:
+            None
+        '''
+
+        self.key_to_ticks.pop(key, None)
+
+class Intervals(object):
+    '''
+    Keeps the running count, sum and sum of squares of the ticks between
+    consecutive events of each key, which is enough to calculate the mean and
+    variance of the time between events.
+    '''
+
+    def __init__(self):
+        self.key_to_stats = dict()
+
+    def add(self, key, tick):
+        '''
+        Adds an event for the given key.
+
+        Args:
+            key (object): The key the event belongs to, such as a player.
+            tick (int): The tick at which the event happened.
+
+        Returns:
+            interval (int): The ticks since the previous event of the key or
+                    None for the first event since the game clock last
+                    restarted.
+        '''
+
+        if not key in self.key_to_stats:
+            self.key_to_stats[key] = IntervalStats(tick)
+            return None
+
+        # Start over from events after the game clock restarted with a new server
+        stats = self.key_to_stats[key]
+        interval = tick - stats.last_tick
+        stats.last_tick = tick
+        stats.count += 1
+        if interval < 0:
+            return None
+
+        stats.total += interval
+        stats.total_squares += interval * interval
+        return interval
+
+    def get(self, key):
+        '''
+        Gets the interval statistics of the given key.
+
+        Args:
+            key (object): The key to look up.
+
+        Returns:
+            stats (IntervalStats): The statistics or None when the key has no
+                    events.
+        '''
+
+        return self.key_to_stats.get(key)
+
+    def merge(self, other):
+        '''
+        Combines the statistics of another instance, such as one that processed
+        the log of a different server, into this instance.
+
+        Args:
+            other (Intervals): The intervals to combine with.
+
+        Returns:
+            None
+        '''
+
+        for key, other_stats in other.key_to_stats.iteritems():
+            if key in self.key_to_stats:
+                stats = self.key_to_stats[key]
+                stats.count += other_stats.count
+                stats.total += other_stats.total
+                stats.total_squares += other_stats.total_squares
+            else:
+                stats = IntervalStats(other_stats.last_tick)
+                stats.count = other_stats.count
+                stats.total = other_stats.total
+                stats.total_squares = other_stats.total_squares
+                self.key_to_stats[key] = stats
+
+class IntervalStats(object):
+    '''
+    Holds the running interval statistics of a single key. The count includes
+    the first event, which has no interval.
+    '''
+
+    __slots__ = ('last_tick', 'count', 'total', 'total_squares')
+
+    def __init__(self, tick):
+        self.last_tick = tick
+        self.count = 1
+        self.total = 0
+        self.total_squares = 0
+
+class LastSeen(object):
+    '''
+    Remembers the tick of the latest event of each key to measure the time
+    since that event.
+    '''
+
+    def __init__(self):
+        self.key_to_tick = dict()
+
+    def add(self, key, tick):
+        '''
+        Adds an event for the given key.
+
+        Args:
+            key (object): The key the event belongs to, such as a player.
+            tick (int): The tick at which the event happened.
+
+        Returns:
+            elapsed (int): The ticks since the previous event of the key or
+                    None for the first event.
+        '''
+
+        elapsed = self.get_elapsed(key, tick)
+        self.key_to_tick[key] = tick
+        return elapsed
+
+    def get_elapsed(self, key, tick):
+        '''
+        Gets the ticks since the latest event of the given key.
+
+        Args:
+            key (object): The key to look up.
+            tick (int): The current tick.
+
+        Returns:
+            elapsed (int): The ticks since the latest event or None when the key
+                    has no events since the game clock last restarted.
+        '''
+
+        # Events from before the game clock restarted with a new server do not count
+        if key in self.key_to_tick and tick >= self.key_to_tick[key]:
+            return tick - self.key_to_tick[key]
+
+    def reset(self, key):
+        '''
+        Forgets the latest event of the given key.
+
+        Args:
+            key (object): The key to reset.
+
+        Returns:
+            None
+        '''
+
+        self.key_to_tick.pop(key, None)
@@ -534,6 +534,13 @@ class DeathEvent(BaseEvent):
         self.player = model_mgr.get_player_by_name(values[0])
         self.player_pos = event_mgr.parse_pos(values[1])
 
+        # Shared context that is filled in by the context processor
+        self.game = None
+        self.map = None
+        self.player_kit = None
+        self.player_team = None
+        self.player_weapon = None
+
         event_mgr.get_history(self.player).add_event(self)
 event_mgr.add_event_class(DeathEvent)
 
@@ -637,6 +644,18 @@ class KillEvent(BaseEvent):
                 and (self.victim.team_id == self.attacker.team_id))
         self.valid_kill = (self.suicide == False and self.team_kill == False)
 
+        # Shared context that is filled in by the context processor
+        self.game = None
+        self.map = None
+        self.attacker_kit = None
+        self.attacker_team = None
+        self.attacker_vehicle = None
+        self.victim_team = None
+        self.victim_vehicle = None
+        self.distance = None
+        self.attacker_airborne = False
+        self.victim_airborne = False
+
         event_mgr.get_history(self.victim).add_event(self)
         event_mgr.get_history(self.attacker).add_event(self)
         event_mgr.get_history(self.weapon).add_event(self)
@@ -744,6 +763,12 @@ class ScoreEvent(BaseEvent):
         self.player = model_mgr.get_player_by_name(values[0])
         self.value = int(values[1])
 
+        # Shared context that is filled in by the context processor
+        self.game = None
+        self.map = None
+        self.player_kit = None
+        self.player_team = None
+
         event_mgr.get_history(self.player).add_event(self)
 event_mgr.add_event_class(ScoreEvent)
 
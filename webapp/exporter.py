@@ -36,7 +36,12 @@ def _get_awards_urls(queue):
 def _get_games_urls(queue):
     index = _export_url('games', 'index.json', True)
     for model in index:
+        base_dir = BASE_DIR + '/games/' +  model['id']
+        if not os.path.exists(base_dir):
+            os.makedirs(base_dir)
+
         queue.put(('games', model['id'] + '.json'))
+        queue.put(('games/' + model['id'], 'timeline.json'))
         queue.put(('replays', model['id'] + '.json'))
 
 def _get_kits_urls(queue):
@@ -64,6 +69,7 @@ def _get_players_urls(queue):
 
         queue.put(('players/' + model['id'], 'statistics.json'))
         queue.put(('players/' + model['id'], 'enemies.json'))
+        queue.put(('players/' + model['id'], 'games.json'))
         queue.put(('players/' + model['id'], 'kits.json'))
         queue.put(('players/' + model['id'], 'maps.json'))
         queue.put(('players/' + model['id'], 'teams.json'))
@@ -15,13 +15,17 @@ class ControlPoint(object):
         self.status = None
         self.team_id = None
         self.trigger_id = None
+        self.generation = 0
 
         self.reset()
 
         ControlPoint.counter += 1
 
     def __repr__(self):
-        return self.__dict__
+
+        # Leave out the bookkeeping of the model manager
+        return dict((key, value) for key, value in self.__dict__.iteritems()
+                if key != 'generation')
 
     def reset(self):
         self.active = False
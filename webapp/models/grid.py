@@ -0,0 +1,207 @@
+
+import heapq
+import math
+
+class Grid(object):
+    '''
+    Indexes the positions of models in uniform square cells on the ground
+    plane. Proximity lookups only visit the cells around the given position
+    instead of every model, so they take about constant time when the models
+    are spread across the map.
+    '''
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.cell_to_models = dict()
+        self.model_to_cell = dict()
+        self.model_to_pos = dict()
+
+    def __contains__(self, model):
+        return model in self.model_to_pos
+
+    def __len__(self):
+        return len(self.model_to_pos)
+
+    def clear(self):
+        '''
+        Removes all the models from the grid.
+
+        Args:
+            None
+
+        Returns:
+            None
+        '''
+
+        self.cell_to_models.clear()
+        self.model_to_cell.clear()
+        self.model_to_pos.clear()
+
+    def get_near(self, pos, radius):
+        '''
+        Gets the models that are closer to the given position than the given
+        radius in 3-dimensional space.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a].
+            radius (float): The distance to search within.
+
+        Returns:
+            models (list): The models that are within the radius.
+        '''
+
+        results = list()
+        for model, model_pos in self._get_candidates(pos, radius):
+            if dist_3d(pos, model_pos) < radius:
+                results.append(model)
+        return results
+
+    def get_nearest(self, pos, count):
+        '''
+        Gets the models that are closest to the given position in
+        3-dimensional space.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a].
+            count (int): The maximum number of models to get.
+
+        Returns:
+            models (list): The closest models ordered by distance.
+        '''
+
+        if count <= 0:
+            return []
+
+        center_x, center_y = self._get_cell(pos)
+        candidates = list()
+        visited = 0
+        ring = 0
+        while visited < len(self.model_to_pos):
+            for cell in _get_ring(center_x, center_y, ring):
+                if cell in self.cell_to_models:
+                    for model in self.cell_to_models[cell]:
+                        candidates.append((dist_3d(pos, self.model_to_pos[model]), model))
+                        visited += 1
+
+            # Models outside of the visited rings are at least this far away
+            if len(candidates) >= count:
+                nearest = heapq.nsmallest(count, candidates, key=lambda c: c[0])
+                if nearest[-1][0] <= ring * self.cell_size:
+                    return [model for distance, model in nearest]
+            ring += 1
+
+        nearest = heapq.nsmallest(count, candidates, key=lambda c: c[0])
+        return [model for distance, model in nearest]
+
+    def get_pos(self, model):
+        '''
+        Gets the indexed position of the given model.
+
+        Args:
+            model (object): The model to look up.
+
+        Returns:
+            pos (array): The position of the model or None when the model is not
+                    in the grid.
+        '''
+
+        return self.model_to_pos.get(model)
+
+    def remove(self, model):
+        '''
+        Removes the given model from the grid if it is present.
+
+        Args:
+            model (object): The model to remove.
+
+        Returns:
+            None
+        '''
+
+        if not model in self.model_to_cell:
+            return
+
+        cell = self.model_to_cell.pop(model)
+        del self.model_to_pos[model]
+
+        models = self.cell_to_models[cell]
+        models.discard(model)
+        if not models:
+            del self.cell_to_models[cell]
+
+    def set_pos(self, model, pos):
+        '''
+        Adds the given model to the grid or moves it to the given position.
+
+        Args:
+            model (object): The model to index.
+            pos (array): Array of points in the form [x, z, y, a].
+
+        Returns:
+            None
+        '''
+
+        cell = self._get_cell(pos)
+        self.model_to_pos[model] = pos
+
+        # Only move the model when it changed cells
+        old_cell = self.model_to_cell.get(model)
+        if old_cell == cell:
+            return
+
+        if old_cell != None:
+            models = self.cell_to_models[old_cell]
+            models.discard(model)
+            if not models:
+                del self.cell_to_models[old_cell]
+
+        if not cell in self.cell_to_models:
+            self.cell_to_models[cell] = set()
+        self.cell_to_models[cell].add(model)
+        self.model_to_cell[model] = cell
+
+    def _get_candidates(self, pos, radius):
+        min_x, min_y = self._get_cell([pos[0] - radius, 0, pos[2] - radius, 0])
+        max_x, max_y = self._get_cell([pos[0] + radius, 0, pos[2] + radius, 0])
+        for x in xrange(min_x, max_x + 1):
+            for y in xrange(min_y, max_y + 1):
+                if (x, y) in self.cell_to_models:
+                    for model in self.cell_to_models[(x, y)]:
+                        yield model, self.model_to_pos[model]
+
+    def _get_cell(self, pos):
+        return (int(math.floor(pos[0] / self.cell_size)),
+                int(math.floor(pos[2] / self.cell_size)))
+
+def dist_3d(pos1, pos2):
+    '''
+    Calculates the distance between the given positions in 3-dimensional space.
+    The positions are not validated, so both must have all four values.
+
+    Args:
+        pos1 (array): Array of points in the form [x, z, y, a].
+        pos2 (array): Array of points in the form [x, z, y, a].
+
+    Returns:
+        distance (float): The distance between two points using the x, y, and z coordinates.
+    '''
+
+    # Formula: sqrt((x2 - x1)^2 + (y2 - y1)^2 + (z2 - z1)^2)
+    x_dist = math.pow(pos2[0] - pos1[0], 2)
+    y_dist = math.pow(pos2[2] - pos1[2], 2)
+    z_dist = math.pow(pos2[1] - pos1[1], 2)
+    return math.sqrt(x_dist + y_dist + z_dist)
+
+def _get_ring(center_x, center_y, ring):
+
+    # The cells on the border of the square with the given distance in cells
+    if ring == 0:
+        yield (center_x, center_y)
+        return
+
+    for x in xrange(center_x - ring, center_x + ring + 1):
+        yield (x, center_y - ring)
+        yield (x, center_y + ring)
+    for y in xrange(center_y - ring + 1, center_y + ring):
+        yield (center_x - ring, y)
+        yield (center_x + ring, y)
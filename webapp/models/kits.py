@@ -19,11 +19,15 @@ class Kit(object):
         self.name = name
         self.desc = desc
         self.weapon_ids = weapon_ids
+        self.ordinal = 0
 
         self.reset()
 
     def __repr__(self):
-        return self.__dict__
+
+        # Leave out the bookkeeping of the model manager
+        return dict((key, value) for key, value in self.__dict__.iteritems()
+                if key != 'ordinal')
 
     def reset(self):
         pass
@@ -0,0 +1,87 @@
+
+import json
+import os
+
+# The model data files are stored next to the model modules
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# Descriptions that were already loaded for each type of model
+_name_to_descriptions = dict()
+
+class Description(object):
+    '''
+    Provides one of the descriptions of a model. Descriptions are long texts
+    that are only needed by a few detail pages, so they are kept in a separate
+    data file that is only read the first time a description of that type of
+    model is requested.
+    '''
+
+    def __init__(self, name, index):
+        self.name = name
+        self.index = index
+
+    def __get__(self, model, model_type):
+        if model == None:
+            return self
+
+        descriptions = get_descriptions(self.name)
+        if model.id in descriptions:
+            return descriptions[model.id][self.index]
+        return ''
+
+def get_descriptions(name):
+    '''
+    Gets the descriptions of every model of the given type.
+
+    Args:
+        name (string): The name of the data file without extension, such as
+                weapons or maps.
+
+    Returns:
+        descriptions (dict): A map of model id to a list of descriptions.
+                Models without any descriptions are not included.
+    '''
+
+    if not name in _name_to_descriptions:
+        _name_to_descriptions[name] = _load(name + '_desc')
+    return _name_to_descriptions[name]
+
+def load_rows(name):
+    '''
+    Loads the values used to register every model of the given type. Each
+    line of the data file holds the tab separated values of one model, lines
+    starting with # are comments.
+
+    Args:
+        name (string): The name of the data file without extension, such as
+                weapons or maps.
+
+    Returns:
+        rows (list): A list of string values for each model.
+    '''
+
+    data_file = open(os.path.join(DATA_DIR, name + '.txt'), 'r')
+    try:
+        return [line.rstrip('\n').split('\t') for line in data_file
+                if line.strip() and not line.startswith('#')]
+    finally:
+        data_file.close()
+
+def _load(name):
+    data_file = open(os.path.join(DATA_DIR, name + '.json'), 'r')
+    try:
+        return _encode(json.load(data_file))
+    finally:
+        data_file.close()
+
+def _encode(value):
+
+    # Use byte strings like the rest of the models
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return dict((_encode(key), _encode(item))
+                for key, item in value.iteritems())
+    return value
@@ -1,6 +1,7 @@
 ﻿
 import control_points
 import games
+import grid
 import kits
 import maps
 import players
@@ -11,41 +12,60 @@ import weapons
 
 class ModelManager(object):
 
+    # Size in meters of the cells used to index player positions
+    PLAYER_CELL_SIZE = 50
+
     def __init__(self):
         self.debug_enabled = False
 
+        # Incremented every time the game models are reset
+        self.generation = 0
+
         self.control_points = set()
         self.id_to_control_point = dict()
         self.addr_to_control_point = dict()
 
         self.games = list()
         self.id_to_game = dict()
+        self.game = games.EMPTY
 
         self.kits = set()
         self.id_to_kit = dict()
+        self.ordinal_to_kit = list()
         self.type_to_kits = dict()
 
         self.maps = set()
         self.id_to_map = dict()
+        self.ordinal_to_map = list()
 
         self.players = set()
         self.id_to_player = dict()
         self.name_to_player = dict()
         self.addr_to_player = dict()
+        self.ordinal_to_player = [players.EMPTY]
+
+        # Player memberships maintained as the game state changes
+        self.connected_players = set()
+        self.team_to_players = dict()
+        self.squad_to_players = dict()
+        self.player_grid = grid.Grid(ModelManager.PLAYER_CELL_SIZE)
 
         self.squads = set()
         self.id_to_squad = dict()
 
         self.teams = set()
         self.id_to_team = dict()
+        self.ordinal_to_team = list()
 
         self.vehicles = set()
         self.id_to_vehicle = dict()
+        self.ordinal_to_vehicle = list()
         self.type_to_vehicles = dict()
         self.group_to_vehicles = dict()
 
         self.weapons = set()
         self.id_to_weapon = dict()
+        self.ordinal_to_weapon = list()
         self.type_to_weapons = dict()
 
     # This method will be called to initialize the manager
@@ -61,6 +81,7 @@ class ModelManager(object):
             if not weapon.weapon_type in self.type_to_weapons:
                 self.type_to_weapons[weapon.weapon_type] = set()
             self.type_to_weapons[weapon.weapon_type].add(weapon)
+        self.ordinal_to_weapon = self._add_ordinals(self.weapons, weapons.EMPTY)
         print 'Weapons registered: ', len(self.weapons)
 
         # Register all the kit models
@@ -75,6 +96,7 @@ class ModelManager(object):
 
             for weapon_id in kit.weapon_ids:
                 assert weapon_id in self.id_to_weapon, 'Missing kit weapon: %s' % weapon_id
+        self.ordinal_to_kit = self._add_ordinals(self.kits, kits.EMPTY)
         print 'Kits registered: ', len(self.kits)
 
         # Register all the map models
@@ -82,6 +104,7 @@ class ModelManager(object):
         for map in self.maps:
             assert not map.id in self.id_to_map, 'Duplicate map ID: %s' % map.id
             self.id_to_map[map.id] = map
+        self.ordinal_to_map = self._add_ordinals(self.maps, maps.EMPTY)
         print 'Maps registered: ', len(self.maps)
 
         # Register all the team models
@@ -89,6 +112,7 @@ class ModelManager(object):
         for team in self.teams:
             assert not team.id in self.id_to_team, 'Duplicate team ID: %s' % team.id
             self.id_to_team[team.id] = team
+        self.ordinal_to_team = self._add_ordinals(self.teams, teams.EMPTY)
         print 'Teams registered: ', len(self.teams)
 
         # Register all the vehicle models
@@ -107,6 +131,7 @@ class ModelManager(object):
 
             for weapon_id in vehicle.weapon_ids:
                 assert weapon_id in self.id_to_weapon, 'Missing vehicle weapon: %s' % weapon_id
+        self.ordinal_to_vehicle = self._add_ordinals(self.vehicles, vehicles.EMPTY)
         print 'Vehicles registered: ', len(self.vehicles)
 
         print 'MODEL MANAGER - STARTED'
@@ -138,11 +163,12 @@ class ModelManager(object):
         # Get a model for the control_point
         if not address in self.addr_to_control_point:
             control_point = control_points.ControlPoint(address, pos)
+            control_point.generation = self.generation
             self.addr_to_control_point[address] = control_point
             self.id_to_control_point[control_point.id] = control_point
             self.control_points.add(control_point)
 
-        return self.addr_to_control_point[address]
+        return self._refresh(self.addr_to_control_point[address])
 
     def add_player(self, address, name):
         '''
@@ -183,10 +209,31 @@ class ModelManager(object):
         # Get a model for the squad
         if not id in self.id_to_squad:
             squad = squads.Squad(id)
+            squad.generation = self.generation
             self.id_to_squad[id] = squad
             self.squads.add(squad)
 
-        return self.id_to_squad[id]
+        return self._refresh(self.id_to_squad[id])
+
+    def end_log(self):
+        '''
+        Ends the live state of the models once a complete log was processed, so
+        the next log does not continue its game. All the players are
+        disconnected, the game models are reset and there is no current game
+        until the next log starts one. The registered models are kept, so
+        players with the same name are the same player in every log.
+
+        Args:
+            None
+
+        Returns:
+            None
+        '''
+
+        for player in list(self.connected_players):
+            self.set_player_connected(player, False)
+        self.reset_models()
+        self.game = games.EMPTY
 
     def get_control_point(self, id):
         '''
@@ -206,7 +253,7 @@ class ModelManager(object):
 
         # Get a model for the control point
         if id in self.id_to_control_point:
-            return self.id_to_control_point[id]
+            return self._refresh(self.id_to_control_point[id])
 
         print 'ERROR - Missing control point reference:', id
         return None
@@ -224,7 +271,7 @@ class ModelManager(object):
             control points (list): Returns a list of control point objects.
         '''
 
-        control_points = list(self.control_points)
+        control_points = [self._refresh(p) for p in self.control_points]
         if active == None:
             return control_points
         return filter(lambda p: p.active == active, control_points)
@@ -243,9 +290,7 @@ class ModelManager(object):
 
         # Handle requests for missing games or the current game
         if not id:
-            if len(self.games) == 0:
-                return games.EMPTY
-            return self.games[-1]
+            return self.game
 
         # Get a model for the game
         if id in self.id_to_game:
@@ -352,6 +397,21 @@ class ModelManager(object):
 
         return list(self.maps)
 
+    def get_nearest_players(self, pos, count):
+        '''
+        Gets the players whose last known position is closest to the given
+        position in the current game.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a].
+            count (int): The maximum number of players to get.
+
+        Returns:
+            players (list): Returns the closest players ordered by distance.
+        '''
+
+        return self.player_grid.get_nearest(pos, count)
+
     def get_player(self, id):
         '''
         Looks up the player object associated with the given id.
@@ -369,7 +429,7 @@ class ModelManager(object):
 
         # Get a model for the player
         if id in self.id_to_player:
-            return self.id_to_player[id]
+            return self._refresh(self.id_to_player[id])
 
         print 'ERROR - Missing player reference:', id
         return None
@@ -391,7 +451,7 @@ class ModelManager(object):
 
         # Get a model for the player
         if name in self.name_to_player:
-            return self.name_to_player[name]
+            return self._refresh(self.name_to_player[name])
 
         print 'ERROR - Missing player reference:', name
         return None
@@ -424,10 +484,28 @@ class ModelManager(object):
             players (list): Returns a list of player objects.
         '''
 
-        players = list(self.players)
         if connected == None:
-            return players
-        return filter(lambda p: p.connected == connected, players)
+            players = self.players
+        elif connected:
+            players = self.connected_players
+        else:
+            players = self.players - self.connected_players
+        return [self._refresh(p) for p in players]
+
+    def get_players_near(self, pos, radius):
+        '''
+        Gets the players whose last known position in the current game is
+        closer to the given position than the given radius.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a].
+            radius (float): The distance in meters to search within.
+
+        Returns:
+            players (list): Returns the nearby players in no particular order.
+        '''
+
+        return self.player_grid.get_near(pos, radius)
 
     def get_squad(self, id):
         '''
@@ -446,7 +524,7 @@ class ModelManager(object):
 
         # Get a model for the squad
         if id in self.id_to_squad:
-            return self.id_to_squad[id]
+            return self._refresh(self.id_to_squad[id])
 
         print 'ERROR - Missing squad reference:', id
         return None
@@ -462,7 +540,23 @@ class ModelManager(object):
             squads (list): Returns a list of squad objects.
         '''
 
-        return list(self.squads)
+        return [self._refresh(s) for s in self.squads]
+
+    def get_squad_players(self, squad):
+        '''
+        Gets the players that are currently members of the given squad.
+
+        Args:
+            squad (Squad): The squad to get players for.
+
+        Returns:
+            players (set): Returns the set of player objects. The set is kept up
+                    to date by the manager so it must not be modified.
+        '''
+
+        if squad in self.squad_to_players:
+            return self.squad_to_players[squad]
+        return frozenset()
 
     def get_team(self, id):
         '''
@@ -481,11 +575,27 @@ class ModelManager(object):
 
         # Get a model for the team
         if id in self.id_to_team:
-            return self.id_to_team[id]
+            return self._refresh(self.id_to_team[id])
 
         print 'ERROR - Missing team reference:', id
         return None
 
+    def get_team_players(self, team):
+        '''
+        Gets the players that are currently members of the given team.
+
+        Args:
+            team (Team): The team to get players for.
+
+        Returns:
+            players (set): Returns the set of player objects. The set is kept up
+                    to date by the manager so it must not be modified.
+        '''
+
+        if team in self.team_to_players:
+            return self.team_to_players[team]
+        return frozenset()
+
     def get_teams(self):
         '''
         Gets a list of all the registered teams.
@@ -497,7 +607,7 @@ class ModelManager(object):
             teams (list): Returns a list of team objects.
         '''
 
-        return list(self.teams)
+        return [self._refresh(t) for t in self.teams]
 
     def get_vehicle(self, id):
         '''
@@ -646,7 +756,11 @@ class ModelManager(object):
     def reset_models(self):
         '''
         Resets all the game models. This is typically only called when the
-        server restarts or a new game starts.
+        server restarts or a new game starts. The control point, player, squad
+        and team models are not reset right away. Instead each model resets
+        itself the first time it is looked up after the reset, so only the
+        models used in the new game pay for it. The other models do not have
+        any game state.
 
         Args:
             None
@@ -655,24 +769,14 @@ class ModelManager(object):
             None
         '''
 
-        for control_point in self.control_points:
-            control_point.reset();
-        for player in self.players:
-            player.reset()
-        for game in self.games:
-            game.reset()
-        for kit in self.kits:
-            kit.reset()
-        for map_obj in self.maps:
-            map_obj.reset()
-        for squad in self.squads:
-            squad.reset()
-        for team in self.teams:
-            team.reset()
-        for vehicle in self.vehicles:
-            vehicle.reset()
-        for weapon in self.weapons:
-            weapon.reset()
+        self.generation += 1
+
+        # Players are added to their teams and squads again as they rejoin
+        self.team_to_players.clear()
+        self.squad_to_players.clear()
+
+        # Positions are only indexed once players move in the new game
+        self.player_grid.clear()
 
     def set_game_status(self, status, map_id, clock_limit, score_limit):
         '''
@@ -698,6 +802,7 @@ class ModelManager(object):
             # Create a new model when the game is starting
             game = games.Game(status, map_id, clock_limit, score_limit)
             self.games.append(game)
+            self.game = game
             self._log('Game started: %s %s' % (game.id, game.map_id))
         else:
             game = self.get_game()
@@ -719,6 +824,75 @@ class ModelManager(object):
         game.ending = (status == games.Game.ENDING)
         return game
 
+    def set_player_connected(self, player, connected):
+        '''
+        Updates the connected flag of the given player.
+
+        Args:
+            player (Player): The player that connected or disconnected.
+            connected (boolean): Indicates whether the player is connected.
+
+        Returns:
+            None
+        '''
+
+        player.connected = connected
+        if connected:
+            self.connected_players.add(player)
+        else:
+            self.connected_players.discard(player)
+            self.player_grid.remove(player)
+
+    def set_player_pos(self, player, pos):
+        '''
+        Updates the position of the given player.
+
+        Args:
+            player (Player): The player that moved.
+            pos (array): Array of points in the form [x, z, y, a].
+
+        Returns:
+            None
+        '''
+
+        player.pos = pos
+        if player != players.EMPTY:
+            self.player_grid.set_pos(player, pos)
+
+    def set_player_squad(self, player, squad):
+        '''
+        Moves the given player from the current squad to the given squad.
+
+        Args:
+            player (Player): The player that changed squads.
+            squad (Squad): The new squad or the empty squad.
+
+        Returns:
+            None
+        '''
+
+        old_squad = self.id_to_squad.get(player.squad_id)
+        self._move_player(self.squad_to_players, player, old_squad, squad,
+                squads.EMPTY)
+        player.squad_id = squad.id if squad != squads.EMPTY else None
+
+    def set_player_team(self, player, team):
+        '''
+        Moves the given player from the current team to the given team.
+
+        Args:
+            player (Player): The player that changed teams.
+            team (Team): The new team or the empty team.
+
+        Returns:
+            None
+        '''
+
+        old_team = self.id_to_team.get(player.team_id)
+        self._move_player(self.team_to_players, player, old_team, team,
+                teams.EMPTY)
+        player.team_id = team.id if team != teams.EMPTY else None
+
     def set_server_status(self, status, time_stamp):
         '''
         Sets the current server status based on the given parameters.
@@ -743,6 +917,12 @@ class ModelManager(object):
             player = self.addr_to_player[address]
         else:
             player = players.Player(address, name)
+            player.generation = self.generation
+
+            # Ordinals follow the registration order of the players
+            player.ordinal = len(self.ordinal_to_player)
+            self.ordinal_to_player.append(player)
+        self._refresh(player)
 
         # Make sure the player model is up to date
         player.address = address
@@ -763,6 +943,38 @@ class ModelManager(object):
         self.players.add(player)
         return player
 
+    def _refresh(self, model):
+
+        # Reset models that were not used since the last reset
+        if model.generation != self.generation:
+            model.generation = self.generation
+            model.reset()
+        return model
+
+    def _move_player(self, model_to_players, player, old_model, model, empty):
+
+        # Remove the player from the previous group
+        if old_model and old_model in model_to_players:
+            group = model_to_players[old_model]
+            group.discard(player)
+            if not group:
+                del model_to_players[old_model]
+
+        # Add the player to the new group
+        if model and model != empty:
+            if not model in model_to_players:
+                model_to_players[model] = set()
+            model_to_players[model].add(player)
+
+    def _add_ordinals(self, models, empty):
+
+        # Number the models densely so statistics can be stored in arrays
+        # The empty model always takes the first slot
+        ordinal_to_model = [empty] + sorted(models, key=lambda m: m.id)
+        for ordinal, model in enumerate(ordinal_to_model):
+            model.ordinal = ordinal
+        return ordinal_to_model
+
     def _log(self, value):
         if self.debug_enabled:
             print value
@@ -1,5 +1,59 @@
 ﻿
 import os
+import time
+
+class PhotoCatalog(object):
+    '''
+    Keeps the names of the available player photos so that resetting a player
+    does not need to probe the file system. The directory is scanned again
+    when its modification time changes, which is checked at most once per
+    refresh interval, so new photos still appear without a restart.
+    '''
+
+    # Minimum number of seconds between checks of the directory
+    REFRESH_INTERVAL = 1.0
+
+    def __init__(self, path):
+        self.path = path
+        self.names = frozenset()
+        self.mtime = None
+        self.checked = None
+
+    def __contains__(self, name):
+        self.refresh()
+        return name in self.names
+
+    def refresh(self, force=False):
+        '''
+        Scans the photo directory again if it changed since the last scan.
+
+        Args:
+            force (boolean): Indicates whether the refresh interval should be
+                    ignored.
+
+        Returns:
+            None
+        '''
+
+        now = time.time()
+        if (not force and self.checked != None
+                and now - self.checked < self.REFRESH_INTERVAL):
+            return
+        self.checked = now
+
+        # A missing directory simply has no photos
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+        if mtime == self.mtime:
+            return
+
+        self.names = frozenset(os.listdir(self.path) if mtime != None else ())
+        self.mtime = mtime
+
+# Create a shared catalog of the photos in the web content directory
+photos = PhotoCatalog('www/images/players')
 
 class Player(object):
 
@@ -7,19 +61,24 @@ class Player(object):
 
     def __init__(self, address, name):
         self.id = str(Player.counter)
+        self.ordinal = 0            # Index of the player in statistics arrays
         self.address = address      # Player's IP address
         self.name = name            # Player's current name
 
         self.aliases = set()        # Set of all names used by the player
         self.bot = False            # Flag when player is a bot
         self.connected = False      # Flag when player is connected
+        self.generation = 0         # Model reset when the values were set
 
         self.reset();
 
         Player.counter += 1
 
     def __repr__(self):
-        return self.__dict__
+
+        # Leave out the bookkeeping of the model manager
+        return dict((key, value) for key, value in self.__dict__.iteritems()
+                if not key in ('ordinal', 'generation'))
 
     def reset(self):
         self.commander = False      # Flag when player is commander
@@ -40,10 +99,10 @@ class Player(object):
 
         # Update the photo paths for the player
         self.photo_s = 'images/players/' + self.id + '-small.png'
-        if not os.path.isfile('www/' + self.photo_s):
+        if not self.id + '-small.png' in photos:
             self.photo_s = 'images/players/missing-small.png'
         self.photo_m = 'images/players/' + self.id + '-medium.jpg'
-        if not os.path.isfile('www/' + self.photo_m):
+        if not self.id + '-medium.jpg' in photos:
             self.photo_m = 'images/players/missing-medium.png'
 
 EMPTY = Player('', '')
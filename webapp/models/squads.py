@@ -5,11 +5,15 @@ class Squad(object):
         self.id = id
 
         self.player_ids = set()
+        self.generation = 0
 
         self.reset()
 
     def __repr__(self):
-        return self.__dict__
+
+        # Leave out the bookkeeping of the model manager
+        return dict((key, value) for key, value in self.__dict__.iteritems()
+                if key != 'generation')
 
     def reset(self):
         self.team_id = None
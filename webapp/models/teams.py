@@ -11,11 +11,16 @@ class Team(object):
 
         self.squad_ids = set()
         self.player_ids = set()
+        self.ordinal = 0
+        self.generation = 0
 
         self.reset()
 
     def __repr__(self):
-        return self.__dict__
+
+        # Leave out the bookkeeping of the model manager
+        return dict((key, value) for key, value in self.__dict__.iteritems()
+                if not key in ('ordinal', 'generation'))
 
     def reset(self):
         self.commander_id = None
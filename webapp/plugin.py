@@ -7,7 +7,8 @@ import cherrypy
 
 from events import event_mgr
 from models import model_mgr
-from stats import stat_mgr
+from stats import StatManager, stat_mgr
+from timer import timer_mgr
 
 class StatsPlugin(cherrypy.process.plugins.SimplePlugin):
 
@@ -16,6 +17,8 @@ class StatsPlugin(cherrypy.process.plugins.SimplePlugin):
 
         self.log_file_path = None
         self.log_file = None
+        self.merge_file_paths = list()
+        self.merge_managers = list()
         self.activated = False
         self.start_time = int(round(time.time() * 1000))
 
@@ -31,6 +34,12 @@ class StatsPlugin(cherrypy.process.plugins.SimplePlugin):
         event_mgr.start()
         stat_mgr.start()
 
+        # Process the finished logs of other servers into separate managers
+        for merge_file_path in self.merge_file_paths:
+            manager = StatManager()
+            self.ingest(merge_file_path, manager)
+            self.merge_managers.append(manager)
+
         # Build a path to the log file
         if not self.log_file_path:
             raise Exception('Stats log file not configured')
@@ -73,6 +82,12 @@ class StatsPlugin(cherrypy.process.plugins.SimplePlugin):
             self.activated = True
             print 'Log lines read: ', count
 
+            # Combine the statistics of the other servers before post processing
+            for manager in self.merge_managers:
+                print 'Merging stats manager: ', manager.overview_stats.lines
+                stat_mgr.merge(manager)
+            self.merge_managers = list()
+
             print 'Executing post processors...'
             stat_mgr.post_process()
 
@@ -95,7 +110,56 @@ class StatsPlugin(cherrypy.process.plugins.SimplePlugin):
 
         print 'STATS PLUGIN - STOPPED'
 
-    def _load_processor_modules(self, parent_package):
+    def ingest(self, log_file_path, manager):
+        '''
+        Processes a complete log file into the given stats manager instead of
+        the shared one. A new set of processors is registered with the manager
+        and updates only its statistics, so the statistics and award results of
+        the log can be merged into another manager afterwards. The model manager is shared, which means
+        players with the same name are the same player in every manager. Its
+        live state is reset afterwards, so the next log starts without any
+        connected players or current game.
+
+        Args:
+            log_file_path (string): The log file to process.
+            manager (StatManager): A new stats manager to hold the results.
+
+        Returns:
+            None
+        '''
+
+        print 'Ingesting stats log file: ', log_file_path
+        try:
+            log_file = open(log_file_path, 'r')
+        except IOError:
+            raise Exception('Unable to open stats log file: ' + log_file_path)
+
+        try:
+            self._load_processor_modules('processors', manager)
+            manager.start()
+
+            count = 0
+            for line in log_file:
+                line = line.strip()
+                if len(line) > 0:
+                    self._process(line, manager)
+                    count += 1
+            print 'Log lines read: ', count
+
+            # Keep the values of the last game in case it never ended properly
+            if manager.game:
+                manager.snapshot_stats(manager.game)
+            manager.stop()
+
+            # Running timers, the event history and the game state must not carry
+            # over to the next log
+            timer_mgr.reset_timers()
+            event_mgr.reset_history()
+            model_mgr.end_log()
+        finally:
+            log_file.close()
+
+    def _load_processor_modules(self, parent_package, manager=stat_mgr):
  
         # Loop over all the sub-modules in the parent package
         package_path = parent_package.replace('.', '/')
@@ -107,11 +171,11 @@ class StatsPlugin(cherrypy.process.plugins.SimplePlugin):
 
             # Recursively load any sub-packages or load the processor class in the current module
             if ispkg:
-                self._load_processor_modules(full_module)
+                self._load_processor_modules(full_module, manager)
             else:
-                self._load_processor_module(processor_module)
+                self._load_processor_module(processor_module, manager)
 
-    def _load_processor_module(self, processor_module):
+    def _load_processor_module(self, processor_module, manager):
 
         # Attempt to get the constructor definition
         processor_class = None
@@ -134,15 +198,15 @@ class StatsPlugin(cherrypy.process.plugins.SimplePlugin):
             return
 
         # Register the processor for stats purposes
-        stat_mgr.add_processor(processor)
+        manager.add_processor(processor)
 
-    def _process(self, line):
+    def _process(self, line, manager=stat_mgr):
 
         # Parse the log line into a into a type-safe event
         event = event_mgr.create_event(line)
 
         # Process the event into useable statistics
-        stat_mgr.process_event(event)
+        manager.process_event(event)
 
 # Register this class with the plugin engine
 cherrypy.engine.statsplugin = StatsPlugin(cherrypy.engine)
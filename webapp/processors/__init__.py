@@ -10,9 +10,21 @@ class BaseProcessor(object):
         self.priority = 100
         self.enabled = True
 
+        # Whether the stats manager passes each event to the processor callbacks
+        self.dispatched = True
+
+        # The stats manager the processor is registered with and updates
+        self.stat_mgr = None
+
+        # Incremented every time the state other processors read may have changed
+        self.revision = 0
+
     def start(self):
         pass
 
+    def merge(self, other):
+        pass
+
     def post_process(self):
         pass
 
@@ -1,9 +1,11 @@
 ﻿
 import collections
+import copy
 
 import models
 
 from processors import BaseProcessor
+from stats import merge_values
 
 class AwardProcessor(BaseProcessor):
 
@@ -20,6 +22,22 @@ class AwardProcessor(BaseProcessor):
         self.notes = notes
         self.results = collections.Counter()
 
+        # Cache the result rows until an event may have changed the results
+        self.dirty = True
+        self.rows = None
+        self.revisions = None
+
+        # Ids of the processors whose state the results are read from
+        self.depends = ()
+
+        # Whether the results are timers that keep running with the game clock
+        self.live = False
+
+        # Only the events the award handles can change its results
+        self.callbacks = set(callback for callback in dir(BaseProcessor)
+                if callback.startswith('on_') and getattr(self.__class__, callback).im_func
+                != getattr(BaseProcessor, callback).im_func)
+
     def get_results(self):
         '''
         Gets the results calculated by this award implementation. By default, the results consist of
@@ -35,7 +53,46 @@ class AwardProcessor(BaseProcessor):
             results (list): A list of lists to represent a table of result values.
         '''
 
-        return self._dict_to_rows(self.results)
+        # Merging, post processing and the processors the results are read from
+        # can change the results without any events
+        revisions = self._get_revisions()
+        if revisions != self.revisions:
+            self.revisions = revisions
+            self.dirty = True
+
+        if self.dirty:
+            self.rows = self._dict_to_rows(self.results)
+            self.dirty = False
+
+        # Callers may change the list they get without affecting the cached rows
+        return list(self.rows)
+
+    def on_event(self, e):
+        if self.live or e.CALLBACK in self.callbacks:
+            self.dirty = True
+
+    def merge(self, other):
+        '''
+        Combines the results calculated by another instance of this award, such as one that
+        processed the log of a different server, into this award. Values for the same player are
+        combined with the _merge_value function, so the order of merging does not matter.
+
+        Args:
+           other (AwardProcessor): An instance of the same award implementation.
+
+        Returns:
+            None
+        '''
+
+        for player, value in other.results.iteritems():
+            if player in self.results:
+                self.results[player] = self._merge_value(self.results[player], value)
+            else:
+                self.results[player] = copy.copy(value)
+
+    def _get_revisions(self):
+        return tuple([self.stat_mgr.revision] + [self.stat_mgr.get_processor(id).revision
+                for id in self.depends])
 
     def _dict_to_rows(self, values):
         '''
@@ -54,8 +111,10 @@ class AwardProcessor(BaseProcessor):
         if not values: return []
 
         # Create a list of lists, where each row is a player name and value
+        # Players are added in the order they were first seen, so ties keep a
+        # stable order when the rows are sorted
         results = []
-        for player,value in values.iteritems():
+        for player in sorted(values, key=lambda player: player.ordinal):
             if player != models.players.EMPTY:
                 player_tuple = None
                 if self.columns[0].data == Column.PLAYER:
@@ -79,8 +138,13 @@ class AwardProcessor(BaseProcessor):
                 break
 
         # Sort the results if applicable
+        # Array values are objects, so they are sorted by their representation
         if sort_index:
-            results.sort(key=lambda row: row[sort_index], reverse=sort_dir)
+            if self.columns[sort_index].data == Column.ARRAY:
+                results.sort(key=lambda row: row[sort_index].__repr__(),
+                        reverse=sort_dir)
+            else:
+                results.sort(key=lambda row: row[sort_index], reverse=sort_dir)
         return results
 
     def _format_value(self, value):
@@ -100,6 +164,227 @@ class AwardProcessor(BaseProcessor):
         '''
         return value
 
+    def _merge_value(self, value, other_value):
+        '''
+        This function combines two result values for the same player when award results are
+        merged. By default, the values are added together and timers add their elapsed time. If the
+        award keeps the highest or lowest value instead, this method can be overridden to pick it.
+
+        Args:
+           value (object)
+           other_value (object)
+
+        Returns:
+            value (object): The combined value.
+        '''
+        return merge_values(value, other_value)
+
+class RuleAwardProcessor(AwardProcessor):
+    '''
+    Award whose results are described by a rule instead of event callbacks.
+    The rules processor applies the rules of every such award in a single pass
+    over the events, so the award only has to declare what to count.
+    '''
+
+    def __init__(self, name, desc, columns, rule, notes=''):
+        AwardProcessor.__init__(self, name, desc, columns, notes)
+
+        assert rule, 'Rule award processor requires a rule.'
+
+        self.rule = rule
+
+        # Only the rules processor passes events to the award
+        self.dispatched = False
+
+    def apply(self, e):
+        '''
+        Adds the given event to the results when it matches the award rule.
+
+        Args:
+           e (BaseEvent): An event of the type handled by the rule.
+
+        Returns:
+            None
+        '''
+
+        self.rule.apply(self.results, e)
+        self.dirty = True
+
+    def _format_value(self, value):
+        return self.rule.format_value(value)
+
+    def _merge_value(self, value, other_value):
+        return self.rule.merge_value(value, other_value)
+
+class Rule(object):
+    '''
+    Describes an award that combines a value of every matching event of one
+    type for each player. Field names can be dotted to reach the attributes of
+    event models, such as weapon.weapon_type. An event does not match when any
+    model along such a path is missing.
+
+    Args:
+        event_class (class): The type of event handled by the rule.
+        key (string): The field holding the player to give the value to.
+        aggregate (string): How values are combined for each player.
+        value (object): The field or function providing the value of an event.
+                Counts ignore the value, ratios expect a pair of the part and
+                the whole and events without a value are skipped.
+        filters (dict): A map of field to the expected value, a collection of
+                allowed values or a function that tests the field value.
+        where (function): An optional test of the whole event that is run
+                after the filters. Filters and tests must not change any state.
+        distinct (object): An optional field or function of the event. An
+                event that matches all the tests is skipped when this value
+                equals that of the previous matching event, such as repeated
+                chat text. It is read once for every matching event.
+    '''
+
+    # Aggregate constants
+    AVERAGE = 'average'
+    COUNT = 'count'
+    MAX = 'max'
+    RATIO = 'ratio'
+    SUM = 'sum'
+
+    def __init__(self, event_class, key, aggregate=COUNT, value=None,
+            filters=None, where=None, distinct=None):
+
+        assert event_class and event_class.CALLBACK, 'Rule requires an event type.'
+        assert aggregate in (Rule.AVERAGE, Rule.COUNT, Rule.MAX, Rule.RATIO,
+                Rule.SUM), 'Invalid rule aggregate: %s' % aggregate
+        assert aggregate == Rule.COUNT or value, 'Rule aggregate requires a value.'
+
+        self.callback = event_class.CALLBACK
+        self.aggregate = aggregate
+
+        # Compile the field names into functions once
+        self.get_key = _compile_field(key)
+        self.get_value = _compile_field(value) if value else None
+        self.tests = [_compile_filter(field, expected)
+                for field, expected in sorted((filters or dict()).iteritems())]
+        if where:
+            self.tests.append(where)
+        self.get_distinct = _compile_field(distinct) if distinct else None
+
+        # Value of the previous event that matched the tests
+        self.previous = _MISSING
+
+    def apply(self, results, e):
+        '''
+        Combines the value of the given event into the results of its player
+        when the event matches all the filters of the rule.
+
+        Args:
+            results (Counter): A map of player to combined value.
+            e (BaseEvent): An event of the type handled by the rule.
+
+        Returns:
+            None
+        '''
+
+        for test in self.tests:
+            if not test(e):
+                return
+
+        # Skip the events that repeat the previous matching event
+        if self.get_distinct:
+            distinct = self.get_distinct(e)
+            if distinct == self.previous:
+                return
+            self.previous = distinct
+
+        key = self.get_key(e)
+        if key is _MISSING:
+            return
+
+        if self.aggregate == Rule.COUNT:
+            results[key] += 1
+            return
+
+        value = self.get_value(e)
+        if value is _MISSING or value == None:
+            return
+
+        if self.aggregate == Rule.SUM:
+            results[key] += value
+        elif self.aggregate == Rule.MAX:
+            if value > results[key]:
+                results[key] = value
+        else:
+
+            # Keep the totals of the parts and wholes or of the values and events
+            if self.aggregate == Rule.AVERAGE:
+                value = (value, 1)
+            if not key in results:
+                results[key] = [0, 0]
+            results[key][0] += value[0]
+            results[key][1] += value[1]
+
+    def format_value(self, value):
+        '''
+        Converts a combined value into the value shown in the results. Ratios
+        keep both totals so they can be shown as a percentage.
+
+        Args:
+            value (object): A combined value of a player.
+
+        Returns:
+            value (object): The value to show.
+        '''
+
+        if self.aggregate == Rule.AVERAGE:
+            return round(float(value[0]) / value[1]) if value[1] else 0
+        return value
+
+    def merge_value(self, value, other_value):
+        '''
+        Combines two values of the same player from different results.
+
+        Args:
+            value (object): The combined value to merge into.
+            other_value (object): The combined value to merge with.
+
+        Returns:
+            value (object): The combined value.
+        '''
+
+        if self.aggregate == Rule.MAX:
+            return max(value, other_value)
+        return merge_values(value, other_value)
+
+# Marks a field that could not be read because a model along its path is missing
+_MISSING = object()
+
+def _compile_field(field):
+    if callable(field):
+        return field
+
+    names = field.split('.')
+    def get_field(e):
+        value = e
+        for name in names:
+            if value == None:
+                return _MISSING
+            value = getattr(value, name)
+        return value
+    return get_field
+
+def _compile_filter(field, expected):
+    get_field = _compile_field(field)
+
+    if callable(expected):
+        test = expected
+    elif isinstance(expected, (frozenset, list, set, tuple)):
+        test = lambda value: value in expected
+    else:
+        test = lambda value: value == expected
+
+    def run_test(e):
+        value = get_field(e)
+        return value is not _MISSING and test(value)
+    return run_test
+
 class Column(object):
 
     # Data constants
@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 from models.vehicles import HELICOPTER
 
 class Processor(AwardProcessor):
@@ -26,6 +25,6 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        attacker_vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
+        attacker_vehicle = e.attacker_vehicle
         if attacker_vehicle.vehicle_type == HELICOPTER:
             self.results[e.attacker] += 1
@@ -1,5 +1,5 @@
 
-import collections
+from detectors import Window
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 
 class Processor(AwardProcessor):
@@ -9,9 +9,9 @@ class Processor(AwardProcessor):
     teammates within the previous 10 seconds.
 
     Implementation
-    Create a hashmap of players with killers as the keys and victims as the values (array)
-    When an attacker dies their keys are nulled to prevent ballooning.
-    When a kill takes place check the hashmap to determine if that player has killed
+    Keep a sliding window of the last 10 seconds (ticks) of kills for each killer.
+    When an attacker dies their window is dropped to prevent ballooning.
+    When a kill takes place check the windows to determine if that player has killed
     someone who has killed a teammate within the last 10 seconds (ticks). If they have
     then increment their score by the number of teammates the victim has killed in the
     last 10 seconds (ticks). It's easy baby!
@@ -26,26 +26,21 @@ class Processor(AwardProcessor):
                 'Most Kills Against Players that Killed a Teammate',
                 [PLAYER_COL, Column('Kills', Column.NUMBER, Column.DESC)])
         
-        self.last_kill = dict()
-        
+        self.last_kill = Window(10)
+
     def on_death(self, e):
-        if e.player in self.last_kill:
-            del self.last_kill[e.player]
-        
+        self.last_kill.reset(e.player)
+
     def on_kill(self, e):
 
         # Ignore suicides and team kills
         if not e.valid_kill:
             return
             
-        # Update the hash map of events with the current attacker event
-        if e.attacker not in self.last_kill:
-            self.last_kill[e.attacker] = []
-        self.last_kill[e.attacker].append(e)
-            
-        # Check the hash map for if the attacker's victim has killed a teammate recently
-        if e.victim in self.last_kill:
-            for teammate_event in self.last_kill[e.victim]:
-                time_diff = e.elapsed(teammate_event)
-                if time_diff <= 10:
-                    self.results[e.attacker] += 1
+        # Update the window of kills with the current attacker kill
+        self.last_kill.add(e.attacker, e.tick)
+
+        # Check the window for if the attacker's victim has killed a teammate recently
+        kills = self.last_kill.get(e.victim, e.tick)
+        if kills:
+            self.results[e.attacker] += kills
@@ -67,3 +67,6 @@ class Processor(AwardProcessor):
             temp_timer = self.results[e.player]
             self.results[e.player] = self.timers[e.player]
             self.timers[e.player] = temp_timer
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
@@ -35,3 +35,6 @@ class Processor(AwardProcessor):
         self.tempCounter[player] += 1
         self.results[player] = max(self.results[player],
                 self.tempCounter[player])
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
@@ -3,7 +3,6 @@ from processors.awards import AwardProcessor,Column,PLAYER_COL
 from models import players
 from models.vehicles import HELICOPTER
 from models.vehicles import JET
-from models import model_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -36,7 +35,7 @@ class Processor(AwardProcessor):
             return
         
         # Check whether the victim vehicle was an aircraft
-        victim_vehicle = model_mgr.get_vehicle(e.victim.vehicle_id)
+        victim_vehicle = e.victim_vehicle
         if (victim_vehicle.vehicle_type == HELICOPTER
                 or victim_vehicle.vehicle_type == JET):
 
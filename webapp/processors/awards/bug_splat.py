@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 from models.vehicles import HELICOPTER, JET, PARACHUTE
 from models import weapons
 
@@ -30,7 +29,7 @@ class Processor(AwardProcessor):
         if e.weapon != weapons.EMPTY:
             return
 
-        victim_vehicle = model_mgr.get_vehicle(e.victim.vehicle_id)
+        victim_vehicle = e.victim_vehicle
         if victim_vehicle.vehicle_type == PARACHUTE:
             if (e.vehicle.vehicle_type == JET
                     or e.vehicle.vehicle_type == HELICOPTER):
@@ -50,3 +50,6 @@ class Processor(AwardProcessor):
 
         # Store the last kill event so we can adjust based on subsequent assists
         self.last_kill = e
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
@@ -1,23 +1,23 @@
 
-from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import KillEvent
 from models.weapons import ARTILLERY
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This award is given to the player with the most kills against lower ranked players.
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Bully',
+        RuleAwardProcessor.__init__(self, 'Bully',
                 'Most Kills Against Lower Ranked Players',
-                [PLAYER_COL, Column('Kills', Column.NUMBER, Column.DESC)])
+                [PLAYER_COL, Column('Kills', Column.NUMBER, Column.DESC)],
+                Rule(KillEvent, 'attacker',
+                        filters={'weapon.weapon_type': lambda t: t != ARTILLERY},
+                        where=self._is_lower_rank))
 
-    def on_kill(self, e):
-        if e.weapon.weapon_type != ARTILLERY:
-            attacker_stats = stat_mgr.get_player_stats(e.attacker)
-            victim_stats = stat_mgr.get_player_stats(e.victim)
-
-            if attacker_stats.rank >= 3 and victim_stats.rank <= 1:
-                self.results[e.attacker] += 1
+    def _is_lower_rank(self, e):
+        attacker_stats = self.stat_mgr.get_player_stats(e.attacker)
+        victim_stats = self.stat_mgr.get_player_stats(e.victim)
+        return attacker_stats.rank >= 3 and victim_stats.rank <= 1
@@ -1,63 +1,32 @@
 
-import collections
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import KillEvent
 
-from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
-from models.vehicles import AIR
-from stats import stat_mgr
-
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This processor keeps track of the total distance traveled between kills.
 
     Implementation
-    Store position after each kill and add distance between current kill position
-    and last kill position. Reset the position after dying.
+    Read the distance between the current kill position and the last kill
+    position from the shared trajectories. The leg restarts after spawning.
 
     Notes
     Only count kills that occur on the ground.
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Camper',
+        RuleAwardProcessor.__init__(self, 'Camper',
                 'Shortest Avg. Distance Between Kills',
-                [PLAYER_COL, Column('Meters', Column.NUMBER, Column.ASC)])
-
-        # Store the last known position for each player
-        self.player_to_pos = dict()
-        self.distance = collections.Counter()
-        self.kills = collections.Counter()
-
-    def on_kill(self, e):
-
-        # Ignore suicides and team kills
-        if not e.valid_kill:
-            return
-
-        # Ignore empty attackers
-        if not e.attacker in self.player_to_pos:
-            return
-
-        # Ignore aircraft kills
-        vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
-        if vehicle.group == AIR:
-            return
-
-        # Calculate the distance traveled by the attacker to get the kill
-        last_pos = self.player_to_pos[e.attacker]
-        distance = stat_mgr.dist_3d(last_pos, e.attacker_pos)
-
-        # Increment the distance and kills for the attacker
-        self.distance[e.attacker] += round(distance)
-        self.kills[e.attacker] += 1
-        # Display the average
-        self.results[e.attacker] = round(self.distance[e.attacker] / self.kills[e.attacker])
+                [PLAYER_COL, Column('Meters', Column.NUMBER, Column.ASC)],
+                Rule(KillEvent, 'attacker', Rule.AVERAGE, self._get_kill_leg))
 
-        # Store the current position for next time
-        self.player_to_pos[e.attacker] = e.attacker_pos
+        # The kill legs are read from the trajectories
+        self.depends = ('trajectories',)
 
-    def on_spawn(self, e):
+    def _get_kill_leg(self, e):
 
-        # Store the initial player position
-        self.player_to_pos[e.player] = e.player_pos
+        # Only valid ground kills end a leg
+        trajectory = self.stat_mgr.get_processor('trajectories').get_trajectory(e.attacker)
+        if trajectory.kill_leg != None:
+            return round(trajectory.kill_leg)
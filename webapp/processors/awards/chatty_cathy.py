@@ -1,12 +1,13 @@
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import ChatEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This processor keeps track of the most characters typed in chat channels.
 
     Implementation
-	Whenever a chat event is received the text is cached if it's over
+	Whenever a chat event is received the text length is added if it's over
 	one character and not spamming
 
     Notes
@@ -14,16 +15,10 @@ class Processor(AwardProcessor):
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Chatty Cathy', 'Most Text Characters Typed',
-                [PLAYER_COL, Column('Text', Column.NUMBER, Column.DESC)])
-
-	self.previous = ''
-	
-    def on_chat(self, e):
-        if 'server' in e.channel:
-            return
-        if len(e.text) < 2 or e.text == self.previous:
-            return
-
-        self.previous = e.text
-        self.results[e.player] += len(e.text)
+        RuleAwardProcessor.__init__(self, 'Chatty Cathy', 'Most Text Characters Typed',
+                [PLAYER_COL, Column('Text', Column.NUMBER, Column.DESC)],
+                Rule(ChatEvent, 'player', Rule.SUM, lambda e: len(e.text),
+                        filters={
+                                'channel': lambda c: not 'server' in c,
+                                'text': lambda t: len(t) >= 2},
+                        distinct='text'))
@@ -25,6 +25,9 @@ class Processor(AwardProcessor):
         # Setup the results to store timers instead of numbers
         self.results = dict()
 
+        # The timers keep running with the game clock
+        self.live = True
+
     def on_vehicle_enter(self, e):
 
         # Create a timer for the player as needed
@@ -23,6 +23,9 @@ class Processor(AwardProcessor):
         # Setup the results to store timers instead of numbers
         self.results = dict()
 
+        # The timers keep running with the game clock
+        self.live = True
+
     def on_death(self, e):
         if e.player in self.results:
             self.results[e.player].stop(e.tick)
@@ -108,3 +108,6 @@ class Processor(AwardProcessor):
 ##            print 'Willard spawn'
 ##            print e.tick
 ##            print self.timers[e.player]
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
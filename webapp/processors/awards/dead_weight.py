@@ -1,7 +1,6 @@
 
 from models import model_mgr
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -22,7 +21,6 @@ class Processor(AwardProcessor):
     def on_loss(self, e):
 
         # Update the loss count for all the active players on the team
-        for player in model_mgr.get_players(True):
-            if player.team_id == e.team.id:
-                player_stats = stat_mgr.get_player_stats(player)
-                self.results[player] = player_stats.losses
+        for player in model_mgr.get_team_players(e.team):
+            player_stats = self.stat_mgr.get_player_stats(player)
+            self.results[player] = player_stats.losses
@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -22,5 +21,8 @@ class Processor(AwardProcessor):
     def on_death(self, e):
 
         # Get the current maximum death streak from the core stats
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
         self.results[e.player] = player_stats.deaths_streak_max
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
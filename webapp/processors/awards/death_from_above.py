@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 from models.vehicles import AIR
 
 class Processor(AwardProcessor):
@@ -26,7 +25,7 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        attacker_vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
-        victim_vehicle = model_mgr.get_vehicle(e.victim.vehicle_id)
+        attacker_vehicle = e.attacker_vehicle
+        victim_vehicle = e.victim_vehicle
         if attacker_vehicle.group == AIR and victim_vehicle.group != AIR:
             self.results[e.attacker] += 1
@@ -1,6 +1,5 @@
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 from timer import Timer
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -19,7 +18,16 @@ class Processor(AwardProcessor):
         AwardProcessor.__init__(self, 'Endurance', 'Most Time Played',
                 [PLAYER_COL, Column('Time', Column.TIME, Column.DESC)])
 
+        # The play timers of the player stats keep running with the game clock
+        self.live = True
+
     def on_spawn(self, e):
 
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
         self.results[e.player] = player_stats.play_time
+
+    def merge(self, other):
+
+        # The timers are shared with the player stats, which are already merged
+        for player in other.results:
+            self.results[player] = self.stat_mgr.get_player_stats(player).play_time
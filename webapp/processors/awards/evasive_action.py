@@ -1,7 +1,6 @@
 
 from models import model_mgr,weapons
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -22,10 +21,10 @@ class Processor(AwardProcessor):
     def on_accuracy(self, e):
 
         if e.weapon.weapon_type == weapons.COUNTER:
-            player_stats = stat_mgr.get_player_stats(e.player)
+            player_stats = self.stat_mgr.get_player_stats(e.player)
 
             counters = 0
             for weapon in model_mgr.get_weapons(weapons.COUNTER):
                 if weapon in player_stats.weapons:
-                    counters += player_stats.weapons[weapon].bullets_fired
+                    counters += player_stats.weapons.bullets_fired[weapon.ordinal]
             self.results[e.player] = counters
@@ -1,7 +1,6 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 from models.weapons import SOLDIER,ROCKET
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -31,5 +30,5 @@ class Processor(AwardProcessor):
         if e.weapon.group == SOLDIER and e.weapon.weapon_type == ROCKET:
 
             # Check whether the attacker and victim are facing each other
-            if stat_mgr.angle_opp(e.victim_pos, e.attacker_pos):
+            if self.stat_mgr.angle_opp(e.victim_pos, e.attacker_pos):
                 self.results[e.attacker] += 1
@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 from models.vehicles import STATION
 
 class Processor(AwardProcessor):
@@ -38,7 +37,7 @@ class Processor(AwardProcessor):
             self.current[e.victim] = 0
 
         # Check whether the victim was killed by a station
-        attack_vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
+        attack_vehicle = e.attacker_vehicle
         if attack_vehicle.group == STATION:
 
             # Add a station death point update the results with the max
@@ -48,3 +47,6 @@ class Processor(AwardProcessor):
 
             # Reset counter for non turret deaths
             self.current[e.victim] = 0
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
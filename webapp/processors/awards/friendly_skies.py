@@ -67,3 +67,6 @@ class Processor(AwardProcessor):
             temp_timer = self.results[e.attacker]
             self.results[e.attacker] = self.timers[e.attacker]
             self.timers[e.attacker] = temp_timer
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -28,8 +27,14 @@ class Processor(AwardProcessor):
         self._update(e.attacker)
 
     def _update(self, player):
-        player_stats = stat_mgr.get_player_stats(player)
+        player_stats = self.stat_mgr.get_player_stats(player)
         kills = player_stats.kills_total
         ammo = player_stats.bullets_fired
         if kills > 0:
             self.results[player] = round(ammo / kills)
+
+    def merge(self, other):
+
+        # The player stats are merged before the awards
+        for player in set(self.results) | set(other.results):
+            self._update(player)
@@ -26,7 +26,7 @@ class Processor(AwardProcessor):
             return
 
         # Get the commander for the attacker's team
-        team = model_mgr.get_team(e.attacker.team_id)
+        team = e.attacker_team
         commander = model_mgr.get_player(team.commander_id)
 
         # Give a point to the commander
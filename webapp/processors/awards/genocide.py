@@ -2,7 +2,6 @@
 import collections
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 
 class AwardResult(object):
 
@@ -39,7 +38,7 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        team = model_mgr.get_team(e.victim.team_id)
+        team = e.victim_team
 
         if e.attacker not in self.teams:
             self.teams[e.attacker] = collections.Counter()
@@ -52,3 +51,13 @@ class Processor(AwardProcessor):
 
         if counter[team] > result.kills:
             result.kills = counter[team]
+
+    def merge(self, other):
+        for player, counter in other.teams.iteritems():
+            if not player in self.teams:
+                self.teams[player] = collections.Counter()
+            self.teams[player].update(counter)
+
+            # Find the team with the most combined kills
+            team, kills = self.teams[player].most_common(1)[0]
+            self.results[player] = AwardResult(kills, team)
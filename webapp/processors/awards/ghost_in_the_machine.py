@@ -1,7 +1,6 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 from models import model_mgr
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -9,8 +8,8 @@ class Processor(AwardProcessor):
     This processor keeps track of the number of vehicles destroyed near a player
 
     Implementation
-    When a vehicle is destroyed, find the distance of each player's current
-    position to the destroyed vehicle and increment their count if less than 5 meters
+    When a vehicle is destroyed, find the players whose current position is
+    less than 5 meters from the destroyed vehicle and increment their count
 
     Notes
     None.
@@ -23,9 +22,5 @@ class Processor(AwardProcessor):
 
     def on_vehicle_destroy(self, e):
 
-        vpos = e.vehicle_pos
-
-        for player in model_mgr.get_players():
-            dist = stat_mgr.dist_3d(vpos, player.pos)
-            if dist < 5:
-                self.results[player] += 1
+        for player in model_mgr.get_players_near(e.vehicle_pos, 5):
+            self.results[player] += 1
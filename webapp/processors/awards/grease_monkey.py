@@ -1,7 +1,8 @@
 
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import RepairEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This processor keeps track of the number of times a player repairs a vehicle.
@@ -14,9 +15,6 @@ class Processor(AwardProcessor):
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Grease Monkey', 'Most Vehicle Repairs',
-                [PLAYER_COL, Column('Repairs', Column.NUMBER, Column.DESC)])
-
-    def on_repair(self, e):
-
-        self.results[e.giver] += 1
+        RuleAwardProcessor.__init__(self, 'Grease Monkey', 'Most Vehicle Repairs',
+                [PLAYER_COL, Column('Repairs', Column.NUMBER, Column.DESC)],
+                Rule(RepairEvent, 'giver'))
@@ -1,25 +1,21 @@
 
-from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import AccuracyEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This processor is awarded to the player with the highest accuracy.
 
     Implementation
-    Get bullets fired and hit from player stats
+    Add up the bullets hit and fired since the previous accuracy report of the
+    player, which the player scores processor keeps on the event.
 
     Notes
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Hawkeye', 'Highest Weapon Accuracy',
-                [PLAYER_COL, Column('Accuracy', Column.PERCENT, Column.DESC)])
-
-    def on_accuracy(self, e):
-
-        player_stats = stat_mgr.get_player_stats(e.player)
-        hits = player_stats.bullets_hit
-        fired = player_stats.bullets_fired
-        self.results[e.player] = [hits, fired]
+        RuleAwardProcessor.__init__(self, 'Hawkeye', 'Highest Weapon Accuracy',
+                [PLAYER_COL, Column('Accuracy', Column.PERCENT, Column.DESC)],
+                Rule(AccuracyEvent, 'player', Rule.RATIO,
+                        lambda e: (e.bullets_hit_delta, e.bullets_fired_delta)))
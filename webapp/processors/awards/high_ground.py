@@ -1,6 +1,6 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr,vehicles
+from models import vehicles
 
 class Processor(AwardProcessor):
     '''
@@ -29,7 +29,7 @@ class Processor(AwardProcessor):
             return
 
         # Make sure the attacker is not in a vehicle
-        attacker_vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
+        attacker_vehicle = e.attacker_vehicle
         if attacker_vehicle != vehicles.EMPTY:
             return
 
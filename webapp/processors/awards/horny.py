@@ -1,7 +1,6 @@
 
 from models import model_mgr
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -22,11 +21,11 @@ class Processor(AwardProcessor):
     def on_accuracy(self, e):
 
         if e.weapon.id in self.horn_ids:
-            player_stats = stat_mgr.get_player_stats(e.player)
+            player_stats = self.stat_mgr.get_player_stats(e.player)
 
             honks = 0
             for horn_id in self.horn_ids:
                 weapon = model_mgr.get_weapon(horn_id)
                 if weapon in player_stats.weapons:
-                    honks += player_stats.weapons[weapon].bullets_fired
+                    honks += player_stats.weapons.bullets_fired[weapon.ordinal]
             self.results[e.player] = honks
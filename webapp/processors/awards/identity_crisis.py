@@ -19,3 +19,6 @@ class Processor(AwardProcessor):
     def on_spawn(self, e):
 
         self.results[e.player] = len(e.player.aliases)
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
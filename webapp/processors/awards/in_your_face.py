@@ -1,7 +1,6 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 from models.weapons import SOLDIER,PRECISION
-from stats import stat_mgr
 from models import model_mgr
 
 class Processor(AwardProcessor):
@@ -34,5 +33,5 @@ class Processor(AwardProcessor):
         if e.weapon.group == SOLDIER and e.weapon.ammo == PRECISION:
 
             # Check whether the attacker and victim are facing each other
-            if stat_mgr.angle_opp(e.victim.pos, e.attacker.pos):
+            if self.stat_mgr.angle_opp(e.victim.pos, e.attacker.pos):
                 self.results[e.attacker] += 1
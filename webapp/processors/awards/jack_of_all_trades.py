@@ -41,12 +41,22 @@ class Processor(AwardProcessor):
             return #empty kit
 
         self.kitScores[e.player][kit] += e.value
+        self._update(e.player)
+
+    def merge(self, other):
+        for player, kitScores in other.kitScores.iteritems():
+            if player not in self.kitScores:
+                self.kitScores[player] = collections.Counter()
+            self.kitScores[player].update(kitScores)
+            self._update(player)
+
+    def _update(self, player):
 
         #change to use numpy?
         scores = []
         totalScore = 0
-        for kit in self.kitScores[e.player]:
-            score = self.kitScores[e.player][kit]
+        for kit in self.kitScores[player]:
+            score = self.kitScores[player][kit]
             if score < 1:
                 return #ignore if player unable to score a point with each kit
             scores.append(score)
@@ -57,4 +67,4 @@ class Processor(AwardProcessor):
         for score in scores:
             totalDev += (score - avg) * (score - avg)
 
-        self.results[e.player] = round(math.sqrt(totalDev / (len(scores) * 1.0)))
+        self.results[player] = round(math.sqrt(totalDev / (len(scores) * 1.0)))
@@ -1,6 +1,5 @@
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 from events import event_mgr
-from models import model_mgr
 from models.vehicles import ARMOR
 from models.vehicles import TRANSPORT
 
@@ -26,11 +25,11 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        tank_check = model_mgr.get_vehicle(e.victim.vehicle_id)
+        tank_check = e.victim_vehicle
         if tank_check.vehicle_type != ARMOR:
             return
 
-        jeep_check = model_mgr.get_vehicle(e.attacker.vehicle_id)
+        jeep_check = e.attacker_vehicle
         if jeep_check.vehicle_type != TRANSPORT:
             return #may have to exclude some transports? i.e. amphibious
         
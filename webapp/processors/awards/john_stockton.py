@@ -1,6 +1,7 @@
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import AssistEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This processor keeps track of the most assists.
@@ -13,9 +14,6 @@ class Processor(AwardProcessor):
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'John Stockton', 'Most Assists',
-                [PLAYER_COL, Column('Assists', Column.NUMBER, Column.DESC)])
-            
-    def on_assist(self, e):
-
-        self.results[e.player] += 1
+        RuleAwardProcessor.__init__(self, 'John Stockton', 'Most Assists',
+                [PLAYER_COL, Column('Assists', Column.NUMBER, Column.DESC)],
+                Rule(AssistEvent, 'player'))
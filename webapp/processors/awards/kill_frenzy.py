@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -22,5 +21,8 @@ class Processor(AwardProcessor):
     def on_kill(self, e):
 
         # Get the current maximum kill streak from the core stats
-        attacker_stats = stat_mgr.get_player_stats(e.attacker)
+        attacker_stats = self.stat_mgr.get_player_stats(e.attacker)
         self.results[e.attacker] = attacker_stats.kills_streak_max
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 from models.vehicles import AIR
 from models.players import EMPTY
 
@@ -36,7 +35,7 @@ class Processor(AwardProcessor):
             return
 
         # Check whether the victim was in an aircraft
-        v = model_mgr.get_vehicle(e.victim.vehicle_id)
+        v = e.victim_vehicle
         if v.group == AIR:
 
             # Check whether the vehicle was destroyed at the same time
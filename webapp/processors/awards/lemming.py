@@ -1,16 +1,13 @@
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import KillEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Lemming is awarded to the player with the most suicides.
-
     This stat can be tracked using any weapon on any map.
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Lemming', 'Most Suicides',
-                [PLAYER_COL, Column('Suicides', Column.NUMBER, Column.DESC)])
-
-    def on_kill(self, e):
-        if e.suicide:
-            self.results[e.attacker] += 1
+        RuleAwardProcessor.__init__(self, 'Lemming', 'Most Suicides',
+                [PLAYER_COL, Column('Suicides', Column.NUMBER, Column.DESC)],
+                Rule(KillEvent, 'attacker', filters={'suicide': True}))
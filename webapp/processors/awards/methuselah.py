@@ -55,3 +55,16 @@ class Processor(AwardProcessor):
 
         if e.player in self.results:
             self.results[e.player].elapsed = self.totalTime[e.player].elapsed / self.lives[e.player]
+
+    def merge(self, other):
+        for player, timer in other.totalTime.iteritems():
+            if not player in self.totalTime:
+                self.totalTime[player] = Timer(player)
+                self.results[player] = Timer(player)
+            self.totalTime[player].merge(timer)
+        self.lives.update(other.lives)
+
+        # Calculate the average lives again from the combined totals
+        for player in other.totalTime:
+            if self.lives[player]:
+                self.results[player].elapsed = self.totalTime[player].elapsed / self.lives[player]
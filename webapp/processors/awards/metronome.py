@@ -1,4 +1,5 @@
 from processors.awards import AwardProcessor,Column,PLAYER_COL
+from detectors import Intervals
 from math import sqrt
 
 class Processor(AwardProcessor):
@@ -19,10 +20,7 @@ class Processor(AwardProcessor):
                 'Most Consistent Time Between Kills',
                 [PLAYER_COL, Column('Seconds Deviation', Column.NUMBER, Column.ASC)])
 
-        self.last_kill_time = dict()
-        self.kills = dict()
-        self.sum = dict()
-        self.sum_squares = dict()
+        self.intervals = Intervals()
 
     def on_kill(self, e):
 
@@ -30,21 +28,18 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        if not e.attacker in self.last_kill_time.keys():
-            #Set initial values for calculating this award
-            self.last_kill_time[e.attacker] = e.tick
-            self.kills[e.attacker] = 1
-            self.sum[e.attacker] = 0
-            self.sum_squares[e.attacker] = 0
-        else:
-            time_since_last_kill = e.tick - self.last_kill_time[e.attacker]
+        # The first kill only sets the initial values for calculating this award
+        if self.intervals.add(e.attacker, e.tick) != None:
+            self.results[e.attacker] = self._get_deviation(e.attacker)
 
-            self.last_kill_time[e.attacker] = e.tick
-            self.kills[e.attacker] += 1
-            self.sum[e.attacker] += time_since_last_kill
-            self.sum_squares[e.attacker] += time_since_last_kill * time_since_last_kill
+    def merge(self, other):
+        self.intervals.merge(other.intervals)
 
-            mean = self.sum[e.attacker] / self.kills[e.attacker]
-
-            self.results[e.attacker] = round(sqrt((self.sum_squares[e.attacker] / self.kills[e.attacker]) - (mean * mean)))
+        # Calculate the deviations again from the combined sums
+        for player in set(self.results) | set(other.results):
+            self.results[player] = self._get_deviation(player)
 
+    def _get_deviation(self, player):
+        stats = self.intervals.get(player)
+        mean = stats.total / stats.count
+        return round(sqrt((stats.total_squares / stats.count) - (mean * mean)))
@@ -1,7 +1,8 @@
 
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import HealEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This processor keeps track of the most heals given.
@@ -14,9 +15,6 @@ class Processor(AwardProcessor):
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Mother Theresa', 'Most Heals Given',
-                [PLAYER_COL, Column('Heals', Column.NUMBER, Column.DESC)])
-
-    def on_heal(self, e):
-
-        self.results[e.giver] += 1
+        RuleAwardProcessor.__init__(self, 'Mother Theresa', 'Most Heals Given',
+                [PLAYER_COL, Column('Heals', Column.NUMBER, Column.DESC)],
+                Rule(HealEvent, 'giver'))
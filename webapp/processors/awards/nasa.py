@@ -29,3 +29,6 @@ class Processor(AwardProcessor):
         self.results[e.attacker] = round(max(self.results[e.attacker], e.attacker_pos[1]))
 
         self.results[e.victim] = round(max(self.results[e.victim], e.victim_pos[1]))
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
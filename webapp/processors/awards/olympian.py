@@ -1,7 +1,6 @@
 
 from models import model_mgr
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -19,10 +18,18 @@ class Processor(AwardProcessor):
         AwardProcessor.__init__(self, 'Olympian', 'Most Top 3 Awards',
                 [PLAYER_COL, Column('Awards', Column.NUMBER, Column.DESC)])
 
+    def merge(self, other):
+
+        # Medals are counted again when the merged awards are post processed
+        pass
+
     def post_process(self):
 
+        # Count the medals from scratch in case the awards were merged
+        self.results.clear()
+
         # Get a list of all the award processors
-        processors = stat_mgr.get_processors('awards')
+        processors = self.stat_mgr.get_processors('awards')
 
         # Skip the current award
         processors.remove(self)
@@ -1,7 +1,6 @@
 
 from models import weapons
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class AwardResult(object):
 
@@ -37,17 +36,32 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        # Make sure a weapon was used
-        if e.weapon == weapons.EMPTY:
+        # Make sure a known weapon was used
+        if not e.weapon or e.weapon == weapons.EMPTY:
             return
 
-        player_stats = stat_mgr.get_player_stats(e.attacker)
-        weapon_stats = player_stats.weapons[e.weapon]
+        weapon_stats = self.stat_mgr.get_player_stats(e.attacker).weapons
+        kills = weapon_stats.kills[weapon_stats.get_ordinal(e.weapon)]
 
         if not e.attacker in self.results:
-            self.results[e.attacker] = AwardResult(weapon_stats.kills, e.weapon)
+            self.results[e.attacker] = AwardResult(kills, e.weapon)
         result = self.results[e.attacker]
 
-        if weapon_stats.kills > result.kills:
-            result.kills = weapon_stats.kills
+        if kills > result.kills:
+            result.kills = kills
             result.weapon = e.weapon
+
+    def merge(self, other):
+        AwardProcessor.merge(self, other)
+
+        # Kills with the same weapon add up in the merged player stats
+        for player, result in self.results.iteritems():
+            weapon_stats = self.stat_mgr.get_player_stats(player).weapons
+            for weapon in weapon_stats:
+                kills = weapon_stats.kills[weapon.ordinal]
+                if weapon != weapons.EMPTY and kills > result.kills:
+                    result.kills = kills
+                    result.weapon = weapon
+
+    def _merge_value(self, value, other_value):
+        return value if value.kills >= other_value.kills else other_value
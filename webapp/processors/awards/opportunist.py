@@ -43,3 +43,5 @@ class Processor(AwardProcessor):
             self.lastKillTime[e.attacker] = e.tick
             self.count[e.attacker] = 0
             
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
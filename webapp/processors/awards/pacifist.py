@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -19,5 +18,5 @@ class Processor(AwardProcessor):
 
     def on_accuracy(self, e):
 
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
         self.results[e.player] = player_stats.bullets_fired
@@ -1,5 +1,4 @@
 
-import collections
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 
 class AwardResult(object):
@@ -17,8 +16,8 @@ class Processor(AwardProcessor):
     This processor keeps track of kills against specific players.
 
     Implementation
-    Count the number of kills each player has against every other player using
-    a dictionary of counters. Whenever a kill happens, check whether the total
+    Read the kills each player has against every other player from the shared
+    head-to-head statistics. Whenever a kill happens, check whether the total
     kills against that particular victim is the new maximum out of all the
     attacker's victims.
 
@@ -32,28 +31,30 @@ class Processor(AwardProcessor):
                 [PLAYER_COL, Column('Kills', Column.ARRAY, Column.DESC)])
 
         self.results = dict()
-        self.attacker_to_victims = dict()
-        
+
+        # The kills are read from the head-to-head statistics of the scores
+        self.depends = ('scores',)
+
     def on_kill(self, e):
 
         # Ignore suicides and team kills
         if not e.valid_kill:
             return
 
-        # Make sure the attacker is registered
-        if not e.attacker in self.attacker_to_victims:
-            self.attacker_to_victims[e.attacker] = collections.Counter()
-
-        # Increment the kill for the attacker against the victim
-        victims = self.attacker_to_victims[e.attacker]
-        victims[e.victim] += 1
+        # Only the kills against the current victim can be a new maximum
+        kills = self.stat_mgr.player_matrix.get('kills', e.attacker, e.victim)
 
         if not e.attacker in self.results:
-            self.results[e.attacker] = AwardResult(victims[e.victim], e.victim)
+            self.results[e.attacker] = AwardResult(kills, e.victim)
         result = self.results[e.attacker]
 
-        # Check whether total kills for the victim is the new maximum
-        for victim in victims:
-            if victims[victim] > result.kills:
-                result.kills = victims[victim]
-                result.player = victim
+        if kills > result.kills:
+            result.kills = kills
+            result.player = e.victim
+
+    def merge(self, other):
+
+        # The head-to-head statistics are merged before the awards
+        for attacker in set(self.results) | set(other.results):
+            victim, kills = self.stat_mgr.player_matrix.get_max('kills', attacker)
+            self.results[attacker] = AwardResult(kills, victim)
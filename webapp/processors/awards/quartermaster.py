@@ -1,7 +1,8 @@
 
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import AmmoEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This processor keeps track of the most ammo given.
@@ -14,9 +15,6 @@ class Processor(AwardProcessor):
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Quartermaster', 'Most Ammo Given',
-                [PLAYER_COL, Column('Ammo Given', Column.NUMBER, Column.DESC)])
-
-    def on_ammo(self, e):
-
-        self.results[e.giver] += 1
+        RuleAwardProcessor.__init__(self, 'Quartermaster', 'Most Ammo Given',
+                [PLAYER_COL, Column('Ammo Given', Column.NUMBER, Column.DESC)],
+                Rule(AmmoEvent, 'giver'))
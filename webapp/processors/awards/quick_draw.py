@@ -1,5 +1,6 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
+from detectors import LastSeen
 from models.weapons import ASSAULT, CARBINE, PISTOL, SNIPER
 from timer import Timer
 
@@ -24,8 +25,8 @@ class Processor(AwardProcessor):
         # Setup the results to store timers instead of numbers
         self.results = dict()
 
-        # Store the last kill events for each player
-        self.last_kills = dict()
+        # Store the last kill time for each player
+        self.last_kills = LastSeen()
 
     def on_kill(self, e):
 
@@ -39,22 +40,22 @@ class Processor(AwardProcessor):
                 and weapon_type != PISTOL and weapon_type != SNIPER):
             return
 
-        # Store the first kill that happens
-        if not e.attacker in self.last_kills:
-            self.last_kills[e.attacker] = e
+        # Nothing to compare with for the first kill that happens
+        elapsed = self.last_kills.add(e.attacker, e.tick)
+        if elapsed == None:
             return
 
         # Check whether the next consecutive kill is the quickest
-        elapsed = e.elapsed(self.last_kills[e.attacker])
         if not e.attacker in self.results:
             self.results[e.attacker] = Timer(e.attacker)
             self.results[e.attacker].elapsed = elapsed
         elif elapsed < self.results[e.attacker].elapsed:
             self.results[e.attacker].elapsed = elapsed
-        self.last_kills[e.attacker] = e
 
     def on_spawn(self, e):
 
         # Reset the last kill when the player respawns
-        if e.player in self.last_kills:
-            del self.last_kills[e.player]
+        self.last_kills.reset(e.player)
+
+    def _merge_value(self, value, other_value):
+        return min(value, other_value)
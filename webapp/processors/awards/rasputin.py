@@ -30,3 +30,10 @@ class Processor(AwardProcessor):
         self.types[e.victim].add( e.weapon )
 
         self.results[e.victim] = len( self.types[e.victim] )
+
+    def merge(self, other):
+        for player, types in other.types.iteritems():
+            if not player in self.types:
+                self.types[player] = set()
+            self.types[player].update(types)
+            self.results[player] = len( self.types[player] )
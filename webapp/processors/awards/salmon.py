@@ -1,5 +1,4 @@
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -20,6 +19,6 @@ class Processor(AwardProcessor):
         self.spawn_pos[e.player] = e.player_pos
 
     def on_death(self, e):
-        dist = stat_mgr.dist_3d(self.spawn_pos[e.player], e.player_pos)
+        dist = self.stat_mgr.dist_3d(self.spawn_pos[e.player], e.player_pos)
         if dist < 10:
             self.results[e.player] += 1
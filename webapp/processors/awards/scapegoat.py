@@ -1,6 +1,7 @@
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import TeamDamageEvent
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This award is given to the players with the most team damage received.
@@ -10,9 +11,7 @@ class Processor(AwardProcessor):
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Scapegoat',
+        RuleAwardProcessor.__init__(self, 'Scapegoat',
                 'Most Damage Received from Teammates',
-                [PLAYER_COL, Column('Damage', Column.NUMBER, Column.DESC)])
-
-    def on_team_damage(self, e): #add in team kills?
-        self.results[e.victim] += 1
+                [PLAYER_COL, Column('Damage', Column.NUMBER, Column.DESC)],
+                Rule(TeamDamageEvent, 'victim'))
@@ -1,6 +1,6 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-import collections
+from detectors import Streak
 
 class AwardResult(object):
 
@@ -18,10 +18,10 @@ class Processor(AwardProcessor):
     against a single player
 
     Implementation
-    Keep track of last victim for each player (ignoring team kills).
-    If the current victim is the same as the last, increment the temp counter.
-    Otherwise reset it to 1.
-    If the temp counter is greater than the current result, update the result
+    Keep a streak of victims for each player (ignoring team kills).
+    The streak grows while the victim is the same as the last, otherwise it
+    starts again at 1. Team kills end the streak.
+    If the streak is greater than the current result, update the result
     for that player.
     Notes
 	None.
@@ -33,27 +33,18 @@ class Processor(AwardProcessor):
                 [PLAYER_COL, Column('Kills', Column.ARRAY, Column.DESC)])
 
         self.results = dict()
-        self.lastVictim = dict()
-        self.tempCounter = collections.Counter()
+        self.streak = Streak()
 
     def on_kill(self, e):
 
         # Ignore suicides and team kills
         if not e.valid_kill:
-            #set last victim so team kills end streak
-            self.lastVictim[e.attacker] = e.victim
-            return
-
-        if e.attacker not in self.lastVictim:
-            self.lastVictim[e.attacker] = e.victim
 
-        if e.victim == self.lastVictim[e.attacker]:
-            self.tempCounter[e.attacker] += 1
-        else:
-            self.tempCounter[e.attacker] = 1
+            # Team kills end the streak
+            self.streak.reset(e.attacker)
+            return
 
-        kills = self.tempCounter[e.attacker]
-        self.lastVictim[e.attacker] = e.victim
+        kills = self.streak.add(e.attacker, e.victim)
 
         if not e.attacker in self.results:
             self.results[e.attacker] = AwardResult(kills, e.victim)
@@ -62,3 +53,6 @@ class Processor(AwardProcessor):
         if kills > result.kills:
             result.kills = kills
             result.player = e.victim
+
+    def _merge_value(self, value, other_value):
+        return value if value.kills >= other_value.kills else other_value
@@ -1,8 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models.vehicles import AIR
-from models import model_mgr
-from stats import stat_mgr
 from collections import Counter
 
 class Processor(AwardProcessor):
@@ -23,34 +20,39 @@ class Processor(AwardProcessor):
                 'Shortest Avg. Distance Between Deaths',
                 [PLAYER_COL, Column('Distance', Column.NUMBER, Column.ASC)])
 
-        # Store the last known position for each player
-        self.player_to_pos = dict()
+        # The death legs are read from the trajectories
+        self.depends = ('trajectories',)
+
         self.distance = Counter()
         self.deaths = Counter()
 
     def on_death(self, e):
 
-        if not e.player in self.player_to_pos:
-            self.player_to_pos[e.player] = e.player_pos
+        # The first death only starts a leg
+        trajectory = self.stat_mgr.get_processor('trajectories').get_trajectory(e.player)
+        if trajectory.death_leg == None:
             return
 
-        last_pos = self.player_to_pos[e.player]
-        dist = round(stat_mgr.dist_3d(last_pos, e.player_pos))
-        self.distance[e.player] += dist
+        self.distance[e.player] += round(trajectory.death_leg)
 
         self.deaths[e.player] += 1
         
         self.results[e.player] = round(self.distance[e.player] / self.deaths[e.player])
 
-        # Store the current position for next time
-        self.player_to_pos[e.player] = e.player_pos
-
     def on_spawn(self, e):
 
         if not e.player in self.results:
             self.results[e.player] = 99999999999999
 
-    def on_game_event(self, e):
+    def merge(self, other):
+        self.distance.update(other.distance)
+        self.deaths.update(other.deaths)
+
+        # Keep the placeholder for players that never died
+        for player in other.results:
+            if not player in self.results:
+                self.results[player] = other.results[player]
 
-        if e.game.ending:
-            self.player_to_pos.clear()
+        # Calculate the averages again from the combined totals
+        for player in self.deaths:
+            self.results[player] = round(self.distance[player] / self.deaths[player])
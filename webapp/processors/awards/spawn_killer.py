@@ -1,5 +1,4 @@
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -27,6 +26,6 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
         
-        dist = stat_mgr.dist_3d(self.spawn_pos[e.victim], e.victim_pos)
+        dist = self.stat_mgr.dist_3d(self.spawn_pos[e.victim], e.victim_pos)
         if dist < 10:
             self.results[e.attacker] += 1
@@ -46,3 +46,6 @@ class Processor(AwardProcessor):
             
         if self.timers[e.player] < self.results[e.player]:
             self.results[e.player].elapsed = self.timers[e.player].elapsed
+
+    def _merge_value(self, value, other_value):
+        return min(value, other_value)
@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 from models.vehicles import STATION
 
 class Processor(AwardProcessor):
@@ -27,6 +26,6 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        victim_vehicle = model_mgr.get_vehicle(e.victim.vehicle_id)
+        victim_vehicle = e.victim_vehicle
         if victim_vehicle.group == STATION:
             self.results[e.attacker] += 1
@@ -2,7 +2,6 @@
 from processors.awards import AwardProcessor,Column,PLAYER_COL
 from models import players
 from models.vehicles import LAND
-from models import model_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -24,6 +23,6 @@ class Processor(AwardProcessor):
 
     def on_kill(self, e):
         
-        victim_vehicle = model_mgr.get_vehicle(e.victim.vehicle_id)
+        victim_vehicle = e.victim_vehicle
         if victim_vehicle.group == LAND and e.attacker == players.EMPTY:
             self.results[e.victim] += 1
@@ -1,17 +1,17 @@
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import KillEvent
 from models.weapons import MINE
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This award is given to the player with the most deaths by mines as a passenger.
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Titanic',
+        RuleAwardProcessor.__init__(self, 'Titanic',
                 'Most Deaths from Mines as Passenger',
-                [PLAYER_COL, Column('Deaths', Column.NUMBER, Column.DESC)])
-
-    def on_kill(self, e):
-        if e.weapon.weapon_type == MINE and e.victim.passenger:
-            self.results[e.victim] += 1
+                [PLAYER_COL, Column('Deaths', Column.NUMBER, Column.DESC)],
+                Rule(KillEvent, 'victim', filters={
+                        'weapon.weapon_type': MINE,
+                        'victim.passenger': True}))
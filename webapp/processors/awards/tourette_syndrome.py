@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from models import model_mgr
 from models.vehicles import STATION
 
 class Processor(AwardProcessor):
@@ -26,6 +25,6 @@ class Processor(AwardProcessor):
         if not e.valid_kill:
             return
 
-        attack_vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
+        attack_vehicle = e.attacker_vehicle
         if attack_vehicle.group == STATION:
             self.results[e.attacker] += 1
@@ -1,22 +1,20 @@
 
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import KillEvent
 from models.weapons import SOLDIER,EXPLOSIVE
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This award is given to the player with the most explosive weapons.
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Unabomber', 'Most Explosive Kills',
-                [PLAYER_COL, Column('Kills', Column.NUMBER, Column.DESC)])
 
-    def on_kill(self, e):
-
-        #Ignore suicides and team kills
-        if not e.valid_kill:
-            return
-
-        if e.weapon.group == SOLDIER and e.weapon.ammo == EXPLOSIVE:
-            self.results[e.attacker] += 1
+        # Ignore suicides and team kills
+        RuleAwardProcessor.__init__(self, 'Unabomber', 'Most Explosive Kills',
+                [PLAYER_COL, Column('Kills', Column.NUMBER, Column.DESC)],
+                Rule(KillEvent, 'attacker', filters={
+                        'valid_kill': True,
+                        'weapon.group': SOLDIER,
+                        'weapon.ammo': EXPLOSIVE}))
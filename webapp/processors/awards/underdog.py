@@ -1,6 +1,5 @@
 
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 from models.weapons import ARTILLERY
 
 class Processor(AwardProcessor):
@@ -16,8 +15,8 @@ class Processor(AwardProcessor):
 
     def on_kill(self, e):
         if e.weapon.weapon_type != ARTILLERY:
-            attacker_stats = stat_mgr.get_player_stats(e.attacker)
-            victim_stats = stat_mgr.get_player_stats(e.victim)
+            attacker_stats = self.stat_mgr.get_player_stats(e.attacker)
+            victim_stats = self.stat_mgr.get_player_stats(e.victim)
 
             if attacker_stats.rank <= 1 and victim_stats.rank >= 3:
                 self.results[e.attacker] += 1
@@ -1,5 +1,4 @@
 from processors.awards import AwardProcessor,Column,PLAYER_COL
-from stats import stat_mgr
 
 class Processor(AwardProcessor):
     '''
@@ -13,6 +12,15 @@ class Processor(AwardProcessor):
 
         self.results = dict()
 
+        # The spectator timers of the player stats keep running with the game clock
+        self.live = True
+
     def on_spawn(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
         self.results[e.player] = player_stats.spec_time
+
+    def merge(self, other):
+
+        # The timers are shared with the player stats, which are already merged
+        for player in other.results:
+            self.results[player] = self.stat_mgr.get_player_stats(player).spec_time
@@ -1,16 +1,14 @@
-from processors.awards import AwardProcessor,Column,PLAYER_COL
+from processors.awards import RuleAwardProcessor,Rule,Column,PLAYER_COL
+from events import KillEvent
 from models.weapons import MINE
 
-class Processor(AwardProcessor):
+class Processor(RuleAwardProcessor):
     '''
     Overview
     This award is given to the player with the most deaths by mines.
     '''
 
     def __init__(self):
-        AwardProcessor.__init__(self, 'Watch Your Step', 'Most Deaths by Mines',
-                [PLAYER_COL, Column('Deaths', Column.NUMBER, Column.DESC)])
-
-    def on_kill(self, e):
-        if e.weapon.weapon_type == MINE:
-            self.results[e.victim] += 1
+        RuleAwardProcessor.__init__(self, 'Watch Your Step', 'Most Deaths by Mines',
+                [PLAYER_COL, Column('Deaths', Column.NUMBER, Column.DESC)],
+                Rule(KillEvent, 'victim', filters={'weapon.weapon_type': MINE}))
@@ -29,3 +29,6 @@ class Processor(AwardProcessor):
                 self.results[e.player] = min(air_timer, self.results[e.player])
             else:
                 self.results[e.player] = air_timer
+
+    def _merge_value(self, value, other_value):
+        return min(value, other_value)
@@ -34,3 +34,6 @@ class Processor(AwardProcessor):
         self.results[e.player] = max( self.results[e.player], self.tempCounter[e.player] )
 
         self.tempCounter[e.player] = 0
+
+    def _merge_value(self, value, other_value):
+        return max(value, other_value)
@@ -0,0 +1,54 @@
+
+from events import event_mgr
+from models import model_mgr
+from models.vehicles import AIR
+from processors import BaseProcessor
+
+class Processor(BaseProcessor):
+    '''
+    Looks up the context that many processors need for kills, deaths and
+    scores once per event and stores it on the event. This runs right after
+    the logic processor has updated the models, so the values match what the
+    later processors would have looked up themselves.
+    '''
+
+    def __init__(self):
+        BaseProcessor.__init__(self)
+
+        self.priority = 15
+
+    def on_death(self, e):
+        self._add_game(e)
+
+        # Player will no longer have an active kit at this point
+        e.player_kit = event_mgr.get_last_kit(e.player)
+        e.player_team = model_mgr.get_team(e.player.team_id)
+        e.player_weapon = model_mgr.get_weapon(e.player.weapon_id)
+
+    def on_kill(self, e):
+        self._add_game(e)
+
+        # Attacker may be dead and may not have an active kit
+        e.attacker_kit = event_mgr.get_last_kit(e.attacker)
+        e.attacker_team = model_mgr.get_team(e.attacker.team_id)
+        e.attacker_vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
+        e.victim_team = model_mgr.get_team(e.victim.team_id)
+        e.victim_vehicle = model_mgr.get_vehicle(e.victim.vehicle_id)
+
+        # Calculate the kill distance and whether either player was flying
+        e.distance = self.stat_mgr.dist_3d(e.attacker_pos, e.victim_pos)
+        e.attacker_airborne = bool(e.attacker_vehicle
+                and e.attacker_vehicle.group == AIR)
+        e.victim_airborne = bool(e.victim_vehicle
+                and e.victim_vehicle.group == AIR)
+
+    def on_score(self, e):
+        self._add_game(e)
+
+        # Player may be dead and would not have a kit
+        e.player_kit = event_mgr.get_last_kit(e.player)
+        e.player_team = model_mgr.get_team(e.player.team_id)
+
+    def _add_game(self, e):
+        e.game = model_mgr.get_game()
+        e.map = model_mgr.get_map(e.game.map_id)
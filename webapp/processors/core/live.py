@@ -5,7 +5,6 @@ import models
 
 from models import model_mgr
 from processors import BaseProcessor
-from stats import stat_mgr
 
 class Processor(BaseProcessor):
 
@@ -311,14 +310,14 @@ class Processor(BaseProcessor):
         }
 
     def _get_stats_tuple(self, player, attributes=None):
-        player_stats = stat_mgr.get_player_stats(player)
+        player_stats = self.stat_mgr.get_player_stats(player)
 
         if attributes and len(attributes) > 0:
             stats_tuple = {
                 'id': player.id
             }
             for attribute in attributes:
-                stats_tuple[attribute] = player_stats.__dict__[attribute]
+                stats_tuple[attribute] = getattr(player_stats, attribute)
             return stats_tuple
 
         return {
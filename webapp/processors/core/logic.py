@@ -15,13 +15,13 @@ class Processor(BaseProcessor):
     def on_ammo(self, e):
 
         # Update position for the players
-        e.receiver.pos = e.receiver_pos
-        e.giver.pos = e.giver_pos
+        model_mgr.set_player_pos(e.receiver, e.receiver_pos)
+        model_mgr.set_player_pos(e.giver, e.giver_pos)
 
     def on_assist(self, e):
 
         # Update position for the player
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
 
     def on_commander(self, e):
 
@@ -31,7 +31,7 @@ class Processor(BaseProcessor):
     def on_connect(self, e):
 
         # Update the connection flag for the player
-        e.player.connected = True
+        model_mgr.set_player_connected(e.player, True)
         e.player.bot = (e.player.address == None)
 
     def on_control_point(self, e):
@@ -49,13 +49,13 @@ class Processor(BaseProcessor):
 
         # Update the state of the player
         e.player.spawned = False
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
         e.player.wounded = False
 
     def on_disconnect(self, e):
 
         # Update the connected flag for the player
-        e.player.connected = False
+        model_mgr.set_player_connected(e.player, False)
 
         # Reset other model references to the player
         self._update_commander(e.player, models.teams.EMPTY)
@@ -74,14 +74,14 @@ class Processor(BaseProcessor):
     def on_heal(self, e):
 
         # Update position for the players
-        e.receiver.pos = e.receiver_pos
-        e.giver.pos = e.giver_pos
+        model_mgr.set_player_pos(e.receiver, e.receiver_pos)
+        model_mgr.set_player_pos(e.giver, e.giver_pos)
 
     def on_kill(self, e):
 
         # Update position for the players
-        e.victim.pos = e.victim_pos
-        e.attacker.pos = e.attacker_pos
+        model_mgr.set_player_pos(e.victim, e.victim_pos)
+        model_mgr.set_player_pos(e.attacker, e.attacker_pos)
 
     def on_kit_drop(self, e):
     
@@ -89,7 +89,7 @@ class Processor(BaseProcessor):
         e.player.kit_id = None
 
         # Update the position for the player
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
 
     def on_kit_pickup(self, e):
     
@@ -97,12 +97,12 @@ class Processor(BaseProcessor):
         e.player.kit_id = e.kit.id
 
         # Update the position for the player
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
 
     def on_repair(self, e):
 
         # Update position for the player
-        e.giver.pos = e.giver_pos
+        model_mgr.set_player_pos(e.giver, e.giver_pos)
 
     def on_revive(self, e):
 
@@ -110,14 +110,14 @@ class Processor(BaseProcessor):
         e.receiver.wounded = False
 
         # Update position for the players
-        e.receiver.pos = e.receiver_pos
-        e.giver.pos = e.giver_pos
+        model_mgr.set_player_pos(e.receiver, e.receiver_pos)
+        model_mgr.set_player_pos(e.giver, e.giver_pos)
 
     def on_server_status(self, e):
 
         # Disconnect all the registered players
-        for player in model_mgr.get_players():
-            player.connected = False
+        for player in model_mgr.get_players(True):
+            model_mgr.set_player_connected(player, False)
 
         # Reset the game models on server start
         model_mgr.reset_models()
@@ -134,7 +134,7 @@ class Processor(BaseProcessor):
         self._update_team(e.player, e.team)
 
         # Update position for the player
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
 
     def on_squad(self, e):
 
@@ -171,13 +171,13 @@ class Processor(BaseProcessor):
     def on_team_damage(self, e):
 
         # Update position for the players
-        e.victim.pos = e.victim_pos
-        e.attacker.pos = e.attacker_pos
+        model_mgr.set_player_pos(e.victim, e.victim_pos)
+        model_mgr.set_player_pos(e.attacker, e.attacker_pos)
 
     def on_vehicle_destroy(self, e):
 
         # Update position for the player
-        e.attacker.pos = e.attacker_pos
+        model_mgr.set_player_pos(e.attacker, e.attacker_pos)
 
     def on_vehicle_enter(self, e):
 
@@ -206,7 +206,7 @@ class Processor(BaseProcessor):
             e.player.operator = False
 
         # Update position for the player
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
 
     def on_vehicle_exit(self, e):
 
@@ -220,7 +220,7 @@ class Processor(BaseProcessor):
         e.player.operator = False
 
         # Update position for the player
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
 
     def on_weapon(self, e):
 
@@ -228,7 +228,7 @@ class Processor(BaseProcessor):
         e.player.weapon_id = e.weapon.id
 
         # Update position for the player
-        e.player.pos = e.player_pos
+        model_mgr.set_player_pos(e.player, e.player_pos)
 
     def _update_commander(self, player, team):
 
@@ -269,12 +269,8 @@ class Processor(BaseProcessor):
             squad.player_ids.add(player.id)
 
         # Update the squad for the player
-        if squad == models.squads.EMPTY:
-            player.squad_id = None
-            player.squader = False
-        else:
-            player.squad_id = squad.id
-            player.squader = True
+        model_mgr.set_player_squad(player, squad)
+        player.squader = (squad != models.squads.EMPTY)
 
         # Remove the squad leader flag from the player if needed
         if not player.squad_id:
@@ -300,7 +296,4 @@ class Processor(BaseProcessor):
             team.player_ids.add(player.id)
 
         # Update the team for the player
-        if team == models.teams.EMPTY:
-            player.team_id = None
-        else:
-            player.team_id = team.id
+        model_mgr.set_player_team(player, team)
@@ -1,7 +1,6 @@
 ﻿
 from models import model_mgr
 from processors import BaseProcessor
-from stats import stat_mgr
 
 class Processor(BaseProcessor):
 
@@ -11,23 +10,23 @@ class Processor(BaseProcessor):
         self.priority = 20
 
     def on_connect(self, e):
-        players = model_mgr.get_players(True)
+        players = model_mgr.connected_players
 
-        overall_stats = stat_mgr.get_stats()
+        overall_stats = self.stat_mgr.get_stats()
         overall_stats.players = max(overall_stats.players, len(players))
 
     def on_death(self, e):
-        overall_stats = stat_mgr.get_stats()
+        overall_stats = self.stat_mgr.get_stats()
         overall_stats.deaths += 1
 
     def on_event(self, e):
-        overall_stats = stat_mgr.get_stats()
+        overall_stats = self.stat_mgr.get_stats()
         overall_stats.lines += 1
         
     def on_kill(self, e):
-        overall_stats = stat_mgr.get_stats()
+        overall_stats = self.stat_mgr.get_stats()
         overall_stats.kills += 1
 
     def on_score(self, e):
-        overall_stats = stat_mgr.get_stats()
+        overall_stats = self.stat_mgr.get_stats()
         overall_stats.score += e.value
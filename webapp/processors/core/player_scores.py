@@ -1,10 +1,127 @@
 ﻿
+import bisect
 import models
 
 from events import FlagActionEvent, KillEvent, event_mgr
 from processors import BaseProcessor
 from models import model_mgr
-from stats import PlayerItemStats, PlayerWeaponStats, stat_mgr
+
+class Ranking(object):
+    '''
+    Keeps the scores of a group of players sorted so the place of any score can
+    be found with a binary search. Places use competition ranking, which means
+    tied players share the best place and the next place is skipped.
+    '''
+
+    def __init__(self, player_to_score=None):
+        self.player_to_score = dict(player_to_score or {})
+        self.score_to_players = dict()
+        for player, score in self.player_to_score.iteritems():
+            if not score in self.score_to_players:
+                self.score_to_players[score] = set()
+            self.score_to_players[score].add(player)
+        self.scores = sorted(self.player_to_score.itervalues())
+
+    def __contains__(self, player):
+        return player in self.player_to_score
+
+    def __len__(self):
+        return len(self.player_to_score)
+
+    def add(self, player, score):
+        '''
+        Adds the given player to the ranking.
+
+        Args:
+            player (Player): The player to add.
+            score (int): The current score of the player.
+
+        Returns:
+            players (set): The players whose place may have changed, including
+                    the given player.
+        '''
+
+        # Every player with a lower score drops a place
+        changed = self._get_players(None, score)
+        changed.add(player)
+
+        bisect.insort(self.scores, score)
+        self.player_to_score[player] = score
+        if not score in self.score_to_players:
+            self.score_to_players[score] = set()
+        self.score_to_players[score].add(player)
+        return changed
+
+    def get_place(self, score):
+        '''
+        Gets the place that the given score has in the ranking.
+
+        Args:
+            score (int): The score to look up.
+
+        Returns:
+            place (int): One more than the number of higher scores.
+        '''
+
+        return len(self.scores) - bisect.bisect_right(self.scores, score) + 1
+
+    def remove(self, player):
+        '''
+        Removes the given player from the ranking.
+
+        Args:
+            player (Player): The player to remove.
+
+        Returns:
+            players (set): The players whose place may have changed.
+        '''
+
+        score = self.player_to_score.pop(player)
+        del self.scores[bisect.bisect_left(self.scores, score)]
+        self.score_to_players[score].remove(player)
+        if not self.score_to_players[score]:
+            del self.score_to_players[score]
+
+        # Every player with a lower score gains a place
+        return self._get_players(None, score)
+
+    def update(self, player, score):
+        '''
+        Changes the score of a player that is already in the ranking.
+
+        Args:
+            player (Player): The player whose score changed.
+            score (int): The new score of the player.
+
+        Returns:
+            players (set): The players whose place may have changed, including
+                    the given player.
+        '''
+
+        old_score = self.player_to_score[player]
+        if score == old_score:
+            return set([player])
+
+        # Only players passed by the score change move by a place
+        self.remove(player)
+        changed = self._get_players(min(score, old_score),
+                max(score, old_score))
+        self.add(player, score)
+        changed.add(player)
+        return changed
+
+    def _get_players(self, low_score, high_score):
+
+        # Find the players with a score from the low score up to the high score
+        start = 0
+        if low_score != None:
+            start = bisect.bisect_left(self.scores, low_score)
+        end = bisect.bisect_left(self.scores, high_score)
+
+        players = set()
+        for score in set(self.scores[start:end]):
+            players.update(self.score_to_players[score])
+        return players
 
 class Processor(BaseProcessor):
 
@@ -12,26 +129,60 @@ class Processor(BaseProcessor):
         BaseProcessor.__init__(self)
 
         self.priority = 20
-        self.vehicles = dict()
-        self.victims = dict()
+
+        # Rankings used to assign the place values for players
+        self.place_ranking = Ranking()
+        self.place_overall_ranking = Ranking()
+        self.place_changes = set()
+        self.place_reset = True
+        self.trend_players = list()
+
+    def merge(self, other):
+
+        # Calculate the kill ratios again from the combined totals
+        for player in model_mgr.players:
+            player_stats = self.stat_mgr.get_player_stats(player)
+            if player_stats.deaths_total > 0:
+                player_stats.kills_ratio_max = round(
+                        float(player_stats.kills_total)
+                        / float(player_stats.deaths_total), 2)
+                player_stats.kills_ratio_total = player_stats.kills_ratio_max
+            elif player_stats.kills_total > 0:
+                player_stats.kills_ratio_total = 1.0
+
+        # Rank all the players again by their combined total scores
+        ranking = Ranking(dict((p, self.stat_mgr.get_player_stats(p).score_total)
+                for p in model_mgr.players))
+        self.place_overall_ranking = ranking
+        for player, score in ranking.player_to_score.iteritems():
+            player_stats = self.stat_mgr.get_player_stats(player)
+            player_stats.place_overall = ranking.get_place(score)
 
     def on_accuracy(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Update the accuracy for the player
-        # Note that a base value must be used since accuracy is reset on death
-        if not e.weapon in player_stats.weapons:
-            player_stats.weapons[e.weapon] = PlayerWeaponStats()
-        weapon_stats = player_stats.weapons[e.weapon]
-        weapon_stats.bullets_hit = weapon_stats._bullets_hit + e.bullets_hit
-        weapon_stats.bullets_fired = weapon_stats._bullets_fired + e.bullets_fired
+        # Note that only the change is added since accuracy is reset on death
+        hit_delta, fired_delta = player_stats.weapons.add_accuracy(e.weapon,
+                e.bullets_hit, e.bullets_fired)
+
+        # Keep the change on the event for the accuracy awards
+        e.bullets_hit_delta = hit_delta
+        e.bullets_fired_delta = fired_delta
 
         # Update ammo used for the player
-        self._update_ammo(e.player)
+        player_stats.bullets_hit += hit_delta
+        player_stats.bullets_fired += fired_delta
+
+        # Update ammo used with the weapon across all players
+        weapon_stats = self.stat_mgr.get_weapon_stats(e.weapon)
+        if weapon_stats:
+            weapon_stats.bullets_hit += hit_delta
+            weapon_stats.bullets_fired += fired_delta
 
     def on_ammo(self, e):
-        receiver_stats = stat_mgr.get_player_stats(e.receiver)
-        giver_stats = stat_mgr.get_player_stats(e.giver)
+        receiver_stats = self.stat_mgr.get_player_stats(e.receiver)
+        giver_stats = self.stat_mgr.get_player_stats(e.giver)
 
         # Increment supply points for the receiver
         receiver_stats.supplied += 1
@@ -46,7 +197,7 @@ class Processor(BaseProcessor):
         giver_stats.teamwork_total += 1
 
     def on_assist(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Increment assist count for the player
         player_stats.assists += 1
@@ -61,13 +212,13 @@ class Processor(BaseProcessor):
         kill_event = global_history.get_new_event(KillEvent.TYPE)
 
         # Increment the assisted count for the attacker
-        attacker_stats = stat_mgr.get_player_stats(kill_event.attacker)
+        attacker_stats = self.stat_mgr.get_player_stats(kill_event.attacker)
         attacker_stats.assisted += 1
         attacker_stats.assisted_total += 1
 
     def on_commander(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
-        old_player_stats = stat_mgr.get_player_stats(e.old_player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
+        old_player_stats = self.stat_mgr.get_player_stats(e.old_player)
 
         # Update the associated commander timers
         player_stats.commander_time.start(e.tick)
@@ -75,32 +226,16 @@ class Processor(BaseProcessor):
         old_player_stats.commander_time.stop(e.tick)
 
     def on_connect(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Start the spectator timer when the player connects
         player_stats.spec_time.start(e.tick)
 
-    def on_death(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        # Include the player in the next place update
+        self.place_changes.add(e.player)
 
-        # Get the last known kit for the player
-        # Player will no longer have an active kit at this point
-        player_kit = event_mgr.get_last_kit(e.player)
-
-        # Get the team and weapon for the player
-        player_team = model_mgr.get_team(e.player.team_id)
-        player_weapon = model_mgr.get_weapon(e.player.weapon_id)
-
-        # Get the vehicle used by the player
-        vehicle_id = None
-        if e.player in self.vehicles:
-            vehicle_id = self.vehicles[e.player]
-            del self.vehicles[e.player]
-        player_vehicle = model_mgr.get_vehicle(vehicle_id)
-
-        # Get the current game and map
-        current_game = model_mgr.get_game()
-        current_map = model_mgr.get_map(current_game.map_id)
+    def on_death(self, e):
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Increment death count for the player
         player_stats.deaths += 1
@@ -118,39 +253,6 @@ class Processor(BaseProcessor):
         player_stats.kills_ratio_max = round(float(player_stats.kills_total)
                 / float(player_stats.deaths_total), 2)
 
-        # Increment the enemy death count for the player
-        if e.player in self.victims:
-            kill_event = self.victims[e.player]
-            if kill_event and kill_event.valid_kill:
-                if not kill_event.attacker in player_stats.enemies:
-                    player_stats.enemies[kill_event.attacker] = PlayerItemStats()
-                player_stats.enemies[kill_event.attacker].deaths += 1
-
-        # Increment the kit death count for the player
-        if not player_kit in player_stats.kits:
-            player_stats.kits[player_kit] = PlayerItemStats()
-        player_stats.kits[player_kit].deaths += 1
-
-        # Increment the map death count for the player
-        if not current_map in player_stats.maps:
-            player_stats.maps[current_map] = PlayerItemStats()
-        player_stats.maps[current_map].deaths += 1
-
-        # Increment the team death count for the player
-        if not player_team in player_stats.teams:
-            player_stats.teams[player_team] = PlayerItemStats()
-        player_stats.teams[player_team].deaths += 1
-
-        # Increment the vehicle death count for the player
-        if not player_vehicle in player_stats.vehicles:
-            player_stats.vehicles[player_vehicle] = PlayerItemStats()
-        player_stats.vehicles[player_vehicle].deaths += 1
-
-        # Increment the weapon death count for the player
-        if not player_weapon in player_stats.weapons:
-            player_stats.weapons[player_weapon] = PlayerWeaponStats()
-        player_stats.weapons[player_weapon].deaths += 1
-
         # Reset all the temporary accuracy values
         self._update_accuracy(e.player)
 
@@ -164,7 +266,7 @@ class Processor(BaseProcessor):
         player_stats.spec_time.start(e.tick)
 
     def on_disconnect(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Reset all the temporary accuracy values
         self._update_accuracy(e.player)
@@ -176,8 +278,11 @@ class Processor(BaseProcessor):
         player_stats.spec_time.stop(e.tick)
         player_stats.squad_time.stop(e.tick)
 
+        # Exclude the player from the next place update
+        self.place_changes.add(e.player)
+
     def on_flag_action(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Increment flag points for the player
         if e.action_type == FlagActionEvent.CAPTURE:
@@ -203,22 +308,24 @@ class Processor(BaseProcessor):
     def on_game_status(self, e):
 
         # Reset all the temporary accuracy values
+        # Game places must be recalculated since the scores were reset
         if e.game.starting:
             for player in model_mgr.get_players(True):
                 self._update_accuracy(player)
+            self.place_reset = True
 
         # Reset any active timers
         if e.game.ending:
             for player in model_mgr.get_players(True):
-                player_stats = stat_mgr.get_player_stats(player)
+                player_stats = self.stat_mgr.get_player_stats(player)
                 player_stats.commander_time.stop(e.tick)
                 player_stats.leader_time.stop(e.tick)
                 player_stats.play_time.stop(e.tick)
                 player_stats.squad_time.stop(e.tick)
 
     def on_heal(self, e):
-        receiver_stats = stat_mgr.get_player_stats(e.receiver)
-        giver_stats = stat_mgr.get_player_stats(e.giver)
+        receiver_stats = self.stat_mgr.get_player_stats(e.receiver)
+        giver_stats = self.stat_mgr.get_player_stats(e.giver)
 
         # Increment healed points for the receiver
         receiver_stats.healed += 1
@@ -233,22 +340,8 @@ class Processor(BaseProcessor):
         giver_stats.teamwork_total += 1
 
     def on_kill(self, e):
-        self.victims[e.victim] = e
-
-        victim_stats = stat_mgr.get_player_stats(e.victim)
-        attacker_stats = stat_mgr.get_player_stats(e.attacker)
-
-        # Get the last known kit for the attacker
-        # Attacker may be dead and may not have an active kit
-        attacker_kit = event_mgr.get_last_kit(e.attacker)
-
-        # Get the team and vehicle for the attacker
-        attacker_team = model_mgr.get_team(e.attacker.team_id)
-        attacker_vehicle = model_mgr.get_vehicle(e.attacker.vehicle_id)
-
-        # Get the current game and map
-        current_game = model_mgr.get_game()
-        current_map = model_mgr.get_map(current_game.map_id)
+        victim_stats = self.stat_mgr.get_player_stats(e.victim)
+        attacker_stats = self.stat_mgr.get_player_stats(e.attacker)
 
         # Check whether the kill was actually a suicide
         if e.suicide:
@@ -264,19 +357,10 @@ class Processor(BaseProcessor):
             attacker_stats.team_kills_total += 1
             return
 
-        # Store the vehicle of the victim for future use
-        if e.victim.vehicle_id:
-            self.vehicles[e.victim] = e.victim.vehicle_id
-
         # Increment wound count for the victim
         victim_stats.wounds += 1
         victim_stats.wounds_total += 1
 
-        # Increment enemy wound count for the victim
-        if not e.attacker in victim_stats.enemies:
-            victim_stats.enemies[e.attacker] = PlayerItemStats()
-        victim_stats.enemies[e.attacker].wounds += 1
-
         # Increment kill count for the attacker
         attacker_stats.kills += 1
         attacker_stats.kills_total += 1
@@ -305,46 +389,15 @@ class Processor(BaseProcessor):
             attacker_stats.kills_ratio_total = round(float(attacker_stats.kills_total)
                     / float(attacker_stats.deaths_total), 2)
 
-        # Increment the enemy kill count for the attacker
-        if not e.victim in attacker_stats.enemies:
-            attacker_stats.enemies[e.victim] = PlayerItemStats()
-        attacker_stats.enemies[e.victim].kills += 1
-
-        # Increment the kit kill count for the attacker
-        if not attacker_kit in attacker_stats.kits:
-            attacker_stats.kits[attacker_kit] = PlayerItemStats()
-        attacker_stats.kits[attacker_kit].kills += 1
-
-        # Increment the map kill count for the attacker
-        if not current_map in attacker_stats.maps:
-            attacker_stats.maps[current_map] = PlayerItemStats()
-        attacker_stats.maps[current_map].kills += 1
-
-        # Increment the vehicle kill count for the attacker
-        if not attacker_vehicle in attacker_stats.vehicles:
-            attacker_stats.vehicles[attacker_vehicle] = PlayerItemStats()
-        attacker_stats.vehicles[attacker_vehicle].kills += 1
-
-        # Increment the team kill count for the attacker
-        if not attacker_team in attacker_stats.teams:
-            attacker_stats.teams[attacker_team] = PlayerItemStats()
-        attacker_stats.teams[attacker_team].kills += 1
-
-        # Increment the weapon kill count for the attacker
-        if not e.weapon in attacker_stats.weapons:
-            attacker_stats.weapons[e.weapon] = PlayerWeaponStats()
-        attacker_stats.weapons[e.weapon].kills += 1
-
     def on_loss(self, e):
 
         # Increment the loss count for all the active players on the team
-        for player in model_mgr.get_players(True):
-            if player.team_id == e.team.id:
-                player_stats = stat_mgr.get_player_stats(player)
-                player_stats.losses += 1
+        for player in model_mgr.get_team_players(e.team):
+            player_stats = self.stat_mgr.get_player_stats(player)
+            player_stats.losses += 1
 
     def on_repair(self, e):
-        giver_stats = stat_mgr.get_player_stats(e.giver)
+        giver_stats = self.stat_mgr.get_player_stats(e.giver)
 
         # Increment repair points for the giver
         giver_stats.repairs += 1
@@ -355,8 +408,8 @@ class Processor(BaseProcessor):
         giver_stats.teamwork_total += 1
 
     def on_revive(self, e):
-        receiver_stats = stat_mgr.get_player_stats(e.receiver)
-        giver_stats = stat_mgr.get_player_stats(e.giver)
+        receiver_stats = self.stat_mgr.get_player_stats(e.receiver)
+        giver_stats = self.stat_mgr.get_player_stats(e.giver)
 
         # Increment revived points for the receiver
         receiver_stats.revived += 1
@@ -371,18 +424,7 @@ class Processor(BaseProcessor):
         giver_stats.teamwork_total += 1
 
     def on_score(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
-
-        # Get the last known kit for the player
-        # Player may be dead and would not have a kit
-        player_kit = event_mgr.get_last_kit(e.player)
-
-        # Get the current map
-        current_game = model_mgr.get_game()
-        current_map = model_mgr.get_map(current_game.map_id)
-
-        # Get the team for the player
-        player_team = model_mgr.get_team(e.player.team_id)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Increment score count for the player
         player_stats.score += e.value
@@ -398,24 +440,9 @@ class Processor(BaseProcessor):
         elif player_stats.score >= 10:
             player_stats.rank = 1
 
-        # Increment the kit score for the player
-        if not player_kit in player_stats.kits:
-            player_stats.kits[player_kit] = PlayerItemStats()
-        player_stats.kits[player_kit].score += e.value
-
-        # Increment the map score for the player
-        if not current_map in player_stats.maps:
-            player_stats.maps[current_map] = PlayerItemStats()
-        player_stats.maps[current_map].score += e.value
-
-        # Increment the team score for the player
-        if not player_team in player_stats.teams:
-            player_stats.teams[player_team] = PlayerItemStats()
-        player_stats.teams[player_team].score += e.value
-
         # Calculate the overall place of each player
-        self._update_place()
-        self._update_place_overall()
+        self._update_place(e.player)
+        self._update_place_overall(e.player)
 
     def on_server_status(self, e):
 
@@ -425,15 +452,18 @@ class Processor(BaseProcessor):
 
         # Reset any active timers
         for player in model_mgr.get_players():
-            player_stats = stat_mgr.get_player_stats(player)
+            player_stats = self.stat_mgr.get_player_stats(player)
             player_stats.commander_time.stop(e.tick)
             player_stats.leader_time.stop(e.tick)
             player_stats.play_time.stop(e.tick)
             player_stats.spec_time.stop(e.tick)
             player_stats.squad_time.stop(e.tick)
 
+        # Game places must be recalculated since all players disconnected
+        self.place_reset = True
+
     def on_spawn(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Increment the game count when the player first spawns
         if not player_stats.played:
@@ -453,7 +483,7 @@ class Processor(BaseProcessor):
             player_stats.squad_time.start(e.tick)
 
     def on_squad(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
 
         # Update the squad timer for the player
         if e.player.squader:
@@ -462,8 +492,8 @@ class Processor(BaseProcessor):
             player_stats.squad_time.stop(e.tick)
 
     def on_squad_leader(self, e):
-        player_stats = stat_mgr.get_player_stats(e.player)
-        old_player_stats = stat_mgr.get_player_stats(e.old_player)
+        player_stats = self.stat_mgr.get_player_stats(e.player)
+        old_player_stats = self.stat_mgr.get_player_stats(e.old_player)
 
         # Update the associated leader timers
         player_stats.leader_time.start(e.tick)
@@ -472,49 +502,60 @@ class Processor(BaseProcessor):
     def on_win(self, e):
 
         # Increment the win count for all the active players on the team
-        for player in model_mgr.get_players(True):
-            if player.team_id == e.team.id:
-                player_stats = stat_mgr.get_player_stats(player)
-                player_stats.wins += 1
+        for player in model_mgr.get_team_players(e.team):
+            player_stats = self.stat_mgr.get_player_stats(player)
+            player_stats.wins += 1
 
     def _update_accuracy(self, player):
-        player_stats = stat_mgr.get_player_stats(player)
-
-        # Use accuracy accumulated in the current game as the new base
-        for weapon in player_stats.weapons:
-            weapon_stats = player_stats.weapons[weapon]
-            weapon_stats._bullets_hit = weapon_stats.bullets_hit
-            weapon_stats._bullets_fired = weapon_stats.bullets_fired
-
-    def _update_ammo(self, player):
-        player_stats = stat_mgr.get_player_stats(player)
-
-        bullets_fired = 0
-        bullets_hit = 0
-        for weapon in player_stats.weapons:
-            weapon_stats = player_stats.weapons[weapon]
-            bullets_fired += weapon_stats.bullets_fired
-            bullets_hit += weapon_stats.bullets_hit
-        player_stats.bullets_fired = bullets_fired
-        player_stats.bullets_hit = bullets_hit
-
-    def _update_place(self):
-
-        # Sort the players by score
-        players = model_mgr.get_players(True)
-        players.sort(key=lambda p: stat_mgr.get_player_stats(p).score,
-                reverse=True)
-
-        # Assign a place value to each player based on index
-        last_score = None
-        place = None
-        for index, player in enumerate(players):
-            player_stats = stat_mgr.get_player_stats(player)
-
-            # Check whether the place should be incremented
-            if last_score != player_stats.score:
-                last_score = player_stats.score
-                place = index + 1
+        player_stats = self.stat_mgr.get_player_stats(player)
+
+        # Accuracy reported after this point starts from zero again
+        player_stats.weapons.reset_life()
+
+    def _update_place(self, player):
+        ranking = self.place_ranking
+        changed = set()
+
+        # Rebuild the ranking from the connected players after a reset
+        if self.place_reset:
+            self.place_reset = False
+            self.place_changes.clear()
+
+            players = model_mgr.get_players(True)
+            ranking = Ranking(dict((p, self.stat_mgr.get_player_stats(p).score)
+                    for p in players))
+            self.place_ranking = ranking
+            changed.update(players)
+
+        # Add or remove the players that connected since the last update
+        for changed_player in self.place_changes:
+            connected = (changed_player.connected
+                    and changed_player in model_mgr.players)
+            if connected and not changed_player in ranking:
+                player_stats = self.stat_mgr.get_player_stats(changed_player)
+                changed.update(ranking.add(changed_player, player_stats.score))
+            elif not connected and changed_player in ranking:
+                changed.update(ranking.remove(changed_player))
+        self.place_changes.clear()
+
+        # Move the player to the new score
+        if player in ranking:
+            player_stats = self.stat_mgr.get_player_stats(player)
+            changed.update(ranking.update(player, player_stats.score))
+
+        # Players that moved in the last update keep their place this time
+        for trend_player in self.trend_players:
+            if trend_player in ranking and not trend_player in changed:
+                self.stat_mgr.get_player_stats(trend_player).trend = '='
+        self.trend_players = list()
+
+        # Assign a place value to each player that may have moved
+        for changed_player in changed:
+            if not changed_player in ranking:
+                continue
+
+            player_stats = self.stat_mgr.get_player_stats(changed_player)
+            place = ranking.get_place(player_stats.score)
 
             # Update the trend of the player
             if place < player_stats.place:
@@ -525,20 +566,28 @@ class Processor(BaseProcessor):
                 player_stats.trend = '='
             player_stats.place = place
 
-    def _update_place_overall(self):
-
-        # Sort the players by total score
-        players = model_mgr.get_players()
-        players.sort(key=lambda p: stat_mgr.get_player_stats(p).score_total,
-                reverse=True)
-
-        # Assign an overall place value to each player based on index
-        last_score = None
-        place = None
-        for index, player in enumerate(players):
-            player_stats = stat_mgr.get_player_stats(player)
-
-            if last_score != player_stats.score_total:
-                last_score = player_stats.score_total
-                place = index + 1
-            player_stats.place_overall = place
+            if player_stats.trend != '=':
+                self.trend_players.append(changed_player)
+
+    def _update_place_overall(self, player):
+        ranking = self.place_overall_ranking
+        changed = set()
+
+        # Add the players that were registered since the last update
+        if len(ranking) != len(model_mgr.players):
+            for new_player in model_mgr.players:
+                if not new_player in ranking:
+                    player_stats = self.stat_mgr.get_player_stats(new_player)
+                    changed.update(ranking.add(new_player,
+                            player_stats.score_total))
+
+        # Move the player to the new total score
+        if player in ranking:
+            player_stats = self.stat_mgr.get_player_stats(player)
+            changed.update(ranking.update(player, player_stats.score_total))
+
+        # Assign an overall place value to each player that may have moved
+        for changed_player in changed:
+            player_stats = self.stat_mgr.get_player_stats(changed_player)
+            player_stats.place_overall = ranking.get_place(
+                    player_stats.score_total)
@@ -0,0 +1,46 @@
+
+import traceback
+
+from processors import BaseProcessor
+from processors.awards import RuleAwardProcessor
+
+class Processor(BaseProcessor):
+    '''
+    Applies the rules of all the rule based awards in a single pass. Awards are
+    grouped by the type of event their rule handles, so each event is only
+    offered to the awards that can use it. The stats manager does not pass
+    events to the rule based awards itself.
+    '''
+
+    def __init__(self):
+        BaseProcessor.__init__(self)
+
+        self.priority = 90
+        self.callback_to_awards = dict()
+
+    def start(self):
+
+        # Group the rule based awards by event callback
+        for processor in self.stat_mgr.get_processors('awards'):
+            if isinstance(processor, RuleAwardProcessor):
+                callback = processor.rule.callback
+                if not callback in self.callback_to_awards:
+                    self.callback_to_awards[callback] = list()
+                self.callback_to_awards[callback].append(processor)
+
+    def on_event(self, e):
+        if not e.CALLBACK in self.callback_to_awards:
+            return
+
+        for award in self.callback_to_awards[e.CALLBACK]:
+            if not award.enabled:
+                continue
+
+            # Keep applying the other rules when one of them fails
+            try:
+                award.apply(e)
+            except Exception, err:
+                print ('ERROR - Failed to apply award rule: [%i] %s.%s[%s]'
+                        % (e.tick, award.__class__.__module__,
+                        award.__class__.__name__, e.CALLBACK))
+                traceback.print_exc(err)
@@ -0,0 +1,135 @@
+
+from processors import BaseProcessor
+from models import model_mgr
+from stats import (GameItemStats, KitItemStats, MapItemStats, TeamItemStats,
+        VehicleItemStats, WeaponItemStats)
+
+class Fact(object):
+    '''
+    A single kill, death, score or other counted occurrence along with all the
+    dimensions it should be rolled up by. A missing dimension is None.
+    '''
+
+    __slots__ = ('counter', 'value', 'player', 'enemy', 'game', 'kit', 'map',
+            'team', 'vehicle', 'weapon')
+
+    def __init__(self, counter, value, player, enemy=None, game=None, kit=None,
+            map=None, team=None, vehicle=None, weapon=None):
+        self.counter = counter
+        self.value = value
+        self.player = player
+        self.enemy = enemy
+        self.game = game
+        self.kit = kit
+        self.map = map
+        self.team = team
+        self.vehicle = vehicle
+        self.weapon = weapon
+
+class Processor(BaseProcessor):
+    '''
+    Records every kill, death and score once and rolls it up into the game,
+    kit, map, team, vehicle, weapon and player statistics that the services
+    are built from.
+    '''
+
+    def __init__(self):
+        BaseProcessor.__init__(self)
+
+        self.priority = 20
+        self.vehicles = dict()
+        self.victims = dict()
+
+    def on_ammo(self, e):
+        self._add_teamwork(e.giver)
+
+    def on_assist(self, e):
+        self._add_teamwork(e.player)
+
+    def on_death(self, e):
+
+        # Get the vehicle used by the player
+        vehicle_id = None
+        if e.player in self.vehicles:
+            vehicle_id = self.vehicles[e.player]
+            del self.vehicles[e.player]
+
+        # Get the attacker when the player was killed by an enemy
+        enemy = None
+        if e.player in self.victims:
+            kill_event = self.victims[e.player]
+            if kill_event and kill_event.valid_kill:
+                enemy = kill_event.attacker
+
+        self._record(Fact('deaths', 1, e.player, enemy, e.game, e.player_kit,
+                e.map, e.player_team, model_mgr.get_vehicle(vehicle_id),
+                e.player_weapon))
+
+    def on_heal(self, e):
+        self._add_teamwork(e.giver)
+
+    def on_kill(self, e):
+        self.victims[e.victim] = e
+
+        # Ignore suicides and team kills
+        if not e.valid_kill:
+            return
+
+        # Store the vehicle of the victim for future use
+        if e.victim.vehicle_id:
+            self.vehicles[e.victim] = e.victim.vehicle_id
+
+        self._record(Fact('kills', 1, e.attacker, e.victim, e.game,
+                e.attacker_kit, e.map, e.attacker_team, e.attacker_vehicle,
+                e.weapon))
+
+    def on_repair(self, e):
+        self._add_teamwork(e.giver)
+
+    def on_revive(self, e):
+        self._add_teamwork(e.giver)
+
+    def on_score(self, e):
+        self._record(Fact('score', e.value, e.player, None, e.game,
+                e.player_kit, e.map, e.player_team))
+
+    def _add_teamwork(self, player):
+        self._record(Fact('teamwork', 1, player, game=model_mgr.get_game()))
+
+    def _record(self, fact):
+        counter = fact.counter
+        value = fact.value
+
+        # Roll the fact up into the statistics of each model dimension
+        for model, get_stats, item_type in [
+                (fact.game, self.stat_mgr.get_game_stats, GameItemStats),
+                (fact.kit, self.stat_mgr.get_kit_stats, KitItemStats),
+                (fact.map, self.stat_mgr.get_map_stats, MapItemStats),
+                (fact.team, self.stat_mgr.get_team_stats, TeamItemStats),
+                (fact.vehicle, self.stat_mgr.get_vehicle_stats, VehicleItemStats),
+                (fact.weapon, self.stat_mgr.get_weapon_stats, WeaponItemStats)]:
+            if not model:
+                continue
+
+            model_stats = get_stats(model)
+            setattr(model_stats, counter, getattr(model_stats, counter) + value)
+            if not fact.player in model_stats.players:
+                model_stats.players[fact.player] = item_type()
+            item_stats = model_stats.players[fact.player]
+            setattr(item_stats, counter, getattr(item_stats, counter) + value)
+
+        # Roll the fact up into the model breakdowns of the player
+        player_stats = self.stat_mgr.get_player_stats(fact.player)
+        for model, table in [(fact.kit, player_stats.kits),
+                (fact.map, player_stats.maps),
+                (fact.team, player_stats.teams),
+                (fact.vehicle, player_stats.vehicles),
+                (fact.weapon, player_stats.weapons)]:
+            if model:
+                getattr(table, counter)[table.add(model)] += value
+
+        # Roll the fact up into the head-to-head statistics of the player
+        # Wounds of the enemy are read back from these kills
+        if fact.enemy:
+            self.stat_mgr.player_matrix.add(counter, fact.player, fact.enemy, value)
+            self.revision += 1
@@ -0,0 +1,200 @@
+
+import models
+
+from array import array
+from models import model_mgr
+from processors import BaseProcessor
+
+class Timeline(object):
+    '''
+    Holds the score, kills and deaths of every player and team in a game as a
+    series of fixed size tick buckets. Every supported resolution keeps its own
+    buckets, which are filled as events arrive so they never need to be
+    aggregated again when they are read.
+    '''
+
+    COUNTERS = ('deaths', 'kills', 'score')
+
+    # Number of ticks covered by a single bucket at each supported resolution
+    RESOLUTIONS = (30, 60, 300)
+
+    def __init__(self, game, start_tick):
+        self.game = game
+        self.start_tick = start_tick
+        self.last_tick = start_tick
+        self.resolution_to_series = dict((resolution, dict())
+                for resolution in self.RESOLUTIONS)
+
+    def add(self, counter, model, tick, value):
+        '''
+        Adds the given value to the bucket that covers the given tick.
+
+        Args:
+            counter (string): The deaths, kills or score statistic.
+            model (object): The player or team the value belongs to.
+            tick (int): The tick at which the value was recorded.
+            value (int): The amount to add.
+
+        Returns:
+            None
+        '''
+
+        self.last_tick = max(self.last_tick, tick)
+        for resolution, model_to_series in self.resolution_to_series.iteritems():
+            if not model in model_to_series:
+                model_to_series[model] = dict((c, array('i'))
+                        for c in self.COUNTERS)
+            values = model_to_series[model][counter]
+
+            # Buckets are only allocated up to the latest recorded tick
+            index = self.get_index(tick, resolution)
+            if index >= len(values):
+                values.extend([0] * (index + 1 - len(values)))
+            values[index] += value
+
+    def get_index(self, tick, resolution):
+        '''
+        Gets the bucket that covers the given tick.
+
+        Args:
+            tick (int): The tick to look up.
+            resolution (int): The number of ticks covered by each bucket.
+
+        Returns:
+            index (int): The index of the bucket from the start of the game.
+        '''
+
+        return max(tick - self.start_tick, 0) // resolution
+
+    def get_resolution(self, resolution):
+        '''
+        Gets the supported resolution that best matches the requested one.
+
+        Args:
+            resolution (int): The requested number of ticks per bucket. None
+                    indicates the default resolution.
+
+        Returns:
+            resolution (int): The smallest supported resolution that is at
+                    least the requested one, or the largest when none is.
+        '''
+
+        if resolution == None:
+            return self.RESOLUTIONS[1]
+
+        for supported in self.RESOLUTIONS:
+            if supported >= resolution:
+                return supported
+        return self.RESOLUTIONS[-1]
+
+    def get_series(self, model, resolution):
+        '''
+        Gets the running totals of every statistic of the given model.
+
+        Args:
+            model (object): The player or team to get values for.
+            resolution (int): A supported number of ticks per bucket.
+
+        Returns:
+            series (dict): A map of statistic name to a list with the total at
+                    the end of each bucket. Every list covers the full game.
+        '''
+
+        size = self.get_index(self.last_tick, resolution) + 1
+        series = self.resolution_to_series[resolution][model]
+
+        results = dict()
+        for counter in self.COUNTERS:
+            total = 0
+            totals = list()
+            values = series[counter]
+            for index in xrange(size):
+                if index < len(values):
+                    total += values[index]
+                totals.append(total)
+            results[counter] = totals
+        return results
+
+    def get_models(self, resolution):
+        '''
+        Gets the players and teams that have values in the timeline.
+
+        Args:
+            resolution (int): A supported number of ticks per bucket.
+
+        Returns:
+            models (list): The player and team models.
+        '''
+
+        return self.resolution_to_series[resolution].keys()
+
+class Processor(BaseProcessor):
+
+    def __init__(self):
+        BaseProcessor.__init__(self)
+
+        self.priority = 30
+        self.games = dict()
+        self.timeline = None
+
+    def get_timeline(self, id):
+        '''
+        Provides the timeline recorded for the game with the given identifier.
+
+        Args:
+           id (string): The unique identifier of the game for which to get the
+                        timeline.
+
+        Returns:
+            timeline (Timeline): Returns the timeline of the game.
+        '''
+
+        if id in self.games:
+            return self.games[id]
+
+    def merge(self, other):
+
+        # Game identifiers are unique so timelines never overlap
+        for id, timeline in other.games.iteritems():
+            if not id in self.games:
+                self.games[id] = timeline
+
+    def on_death(self, e):
+        self._add('deaths', e.player, e.tick, 1)
+
+    def on_game_status(self, e):
+
+        if e.game == models.games.EMPTY:
+            return
+
+        # Create a timeline the first time a game is seen
+        # Games can report the same status several times
+        if not e.game.id in self.games:
+            self.games[e.game.id] = Timeline(e.game, e.tick)
+        self.timeline = self.games[e.game.id]
+        self.timeline.last_tick = max(self.timeline.last_tick, e.tick)
+
+        # Events after the end of the game do not extend its timeline
+        if e.game.ending:
+            self.timeline = None
+
+    def on_kill(self, e):
+
+        # Ignore suicides and team kills
+        if not e.valid_kill:
+            return
+
+        self._add('kills', e.attacker, e.tick, 1)
+
+    def on_score(self, e):
+        self._add('score', e.player, e.tick, e.value)
+
+    def _add(self, counter, player, tick, value):
+        if not self.timeline:
+            return
+
+        # Record the value for both the player and the current team
+        self.timeline.add(counter, player, tick, value)
+        team = model_mgr.get_team(player.team_id)
+        if team != models.teams.EMPTY:
+            self.timeline.add(counter, team, tick, value)
@@ -0,0 +1,170 @@
+
+from models.vehicles import HELICOPTER, JET
+from processors import BaseProcessor
+
+class Trajectory(object):
+    '''
+    Holds the movement of a single player. Distances are the sum of the
+    rounded distances between the positions reported by consecutive events.
+    Kill and death legs are straight line distances, so running around between
+    two kills does not make the leg any longer.
+    '''
+
+    def __init__(self, player):
+        self.player = player
+        self.pos = None
+        self.airborne = False
+
+        self.ground_distance = 0
+        self.air_distance = 0
+        self.life_distance = 0
+
+        # Position where the current kill or death leg started
+        self.kill_pos = None
+        self.death_pos = None
+
+        # Length of the leg that ended with the latest kill or death
+        self.kill_leg = None
+        self.death_leg = None
+
+class Processor(BaseProcessor):
+    '''
+    Tracks the trajectory of every player once per positioned event, so the
+    awards based on distance traveled only have to read it.
+    '''
+
+    def __init__(self):
+        BaseProcessor.__init__(self)
+
+        self.priority = 20
+        self.player_to_trajectory = dict()
+
+        # Trajectories that moved with the latest event
+        self.moved = list()
+
+    def get_trajectory(self, player):
+        '''
+        Provides the trajectory of the given player.
+
+        Args:
+           player (Player): The player to get the trajectory for.
+
+        Returns:
+            trajectory (Trajectory): The trajectory of the player or None when
+                    the player was never seen.
+        '''
+
+        if player in self.player_to_trajectory:
+            return self.player_to_trajectory[player]
+
+    def on_event(self, e):
+        del self.moved[:]
+
+    def on_ammo(self, e):
+        self._move(e.giver, e.giver_pos)
+        self._move(e.receiver, e.receiver_pos)
+
+    def on_assist(self, e):
+        self._move(e.player, e.player_pos)
+
+    def on_death(self, e):
+        self._move(e.player, e.player_pos)
+
+        # The first death only starts a leg
+        trajectory = self._get_trajectory(e.player)
+        trajectory.death_leg = None
+        self.revision += 1
+        if trajectory.death_pos:
+            trajectory.death_leg = self.stat_mgr.dist_3d(trajectory.death_pos,
+                    e.player_pos)
+        trajectory.death_pos = e.player_pos
+
+    def on_heal(self, e):
+        self._move(e.giver, e.giver_pos)
+        self._move(e.receiver, e.receiver_pos)
+
+    def on_kill(self, e):
+        self._move(e.attacker, e.attacker_pos)
+        self._move(e.victim, e.victim_pos)
+
+        # Only ground kills end a kill leg
+        trajectory = self._get_trajectory(e.attacker)
+        trajectory.kill_leg = None
+        self.revision += 1
+        if not e.valid_kill or e.attacker_airborne or not trajectory.kill_pos:
+            return
+
+        trajectory.kill_leg = self.stat_mgr.dist_3d(trajectory.kill_pos,
+                e.attacker_pos)
+        trajectory.kill_pos = e.attacker_pos
+
+    def on_kit_drop(self, e):
+        self._move(e.player, e.player_pos)
+
+    def on_kit_pickup(self, e):
+        self._move(e.player, e.player_pos)
+
+    def on_repair(self, e):
+        self._move(e.giver, e.giver_pos)
+
+    def on_revive(self, e):
+        self._move(e.giver, e.giver_pos)
+        self._move(e.receiver, e.receiver_pos)
+
+    def on_spawn(self, e):
+        trajectory = self._get_trajectory(e.player)
+        trajectory.pos = e.player_pos
+        trajectory.airborne = False
+        trajectory.life_distance = 0
+        trajectory.kill_pos = e.player_pos
+        self.revision += 1
+
+    def on_team_damage(self, e):
+        self._move(e.attacker, e.attacker_pos)
+        self._move(e.victim, e.victim_pos)
+
+    def on_vehicle_destroy(self, e):
+        self._move(e.attacker, e.attacker_pos)
+
+    def on_vehicle_enter(self, e):
+        self._move(e.player, e.player_pos)
+
+        vehicle_type = e.vehicle.vehicle_type
+        if vehicle_type == HELICOPTER or vehicle_type == JET:
+            self._get_trajectory(e.player).airborne = True
+            self.revision += 1
+
+    def on_vehicle_exit(self, e):
+        self._move(e.player, e.player_pos)
+        self._get_trajectory(e.player).airborne = False
+        self.revision += 1
+
+    def on_weapon(self, e):
+        self._move(e.player, e.player_pos)
+
+    def _get_trajectory(self, player):
+        if not player in self.player_to_trajectory:
+            self.player_to_trajectory[player] = Trajectory(player)
+        return self.player_to_trajectory[player]
+
+    def _move(self, player, pos):
+
+        # Players only have a position once they spawned
+        trajectory = self._get_trajectory(player)
+        if not trajectory.pos:
+            return
+
+        # Ignore events with an invalid position
+        distance = self.stat_mgr.dist_3d(trajectory.pos, pos)
+        if distance == None:
+            return
+
+        distance = round(distance)
+        if trajectory.airborne:
+            trajectory.air_distance += distance
+        else:
+            trajectory.ground_distance += distance
+        trajectory.life_distance += distance
+        trajectory.pos = pos
+        self.moved.append(trajectory)
+        self.revision += 1
@@ -0,0 +1,353 @@
+
+import difflib
+import glob
+import json
+import os
+import os.path
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# The current directory is needed to resolve the log and www folders
+current_dir = os.path.abspath(os.path.dirname(__file__))
+
+LOG_PATTERN = current_dir + '/logs/bf2_game_log*.txt'
+GOLDEN_DIR = current_dir + '/logs/golden'
+
+DIFF_LINES = 40
+
+# The number of errors reported while processing is recorded with the outputs
+ERRORS_KEY = 'errors'
+
+def run(log_paths=None, update=False):
+    '''
+    Ingests each of the given log files in a separate process and compares the
+    output of every service and the number of reported errors against the
+    golden files recorded for that log.
+
+    Args:
+        log_paths (list): The log files to ingest. None indicates every game log
+                in the logs folder should be used.
+        update (boolean): Whether the golden files should be overwritten with
+                the current output instead of being compared.
+
+    Returns:
+        failures (int): The number of logs whose output did not match.
+    '''
+
+    if not log_paths:
+        log_paths = sorted(glob.glob(LOG_PATTERN))
+
+    failures = 0
+    summary = list()
+    for log_path in log_paths:
+        log_name = os.path.splitext(os.path.basename(log_path))[0]
+        print 'Processing log: ', log_name
+
+        # Run the ingestion in a fresh interpreter since all managers are singletons
+        outputs, metrics = _run_child(log_path)
+        outputs[ERRORS_KEY] = metrics['errors']
+        golden_path = GOLDEN_DIR + '/' + log_name + '.json'
+
+        if update or not os.path.isfile(golden_path):
+            _write_golden(golden_path, outputs)
+            status = 'UPDATED'
+        elif _compare(_read_golden(golden_path), outputs):
+            status = 'OK'
+        else:
+            status = 'FAILED'
+            failures += 1
+        summary.append((log_name, status, metrics))
+
+    # Print the timing and memory usage recorded for each log
+    print
+    print '%-16s %-8s %8s %8s %10s %10s %10s' % ('Log', 'Status', 'Lines',
+            'Errors', 'Ingest ms', 'Export ms', 'Peak KB')
+    for log_name, status, metrics in summary:
+        print '%-16s %-8s %8i %8i %10i %10i %10s' % (log_name, status,
+                metrics['lines'], metrics['errors'], metrics['ingest_ms'],
+                metrics['export_ms'], metrics['peak_kb'])
+    return failures
+
+def ingest(log_path, merge_log_paths=None):
+    '''
+    Processes the given log file without starting the web server and collects
+    the output of every service. This must be called in a fresh process.
+
+    Args:
+        log_path (string): The log file to ingest.
+        merge_log_paths (list): The logs of other servers to process separately
+                and merge into the statistics of the log file.
+
+    Returns:
+        outputs (dict): A map of service path to normalized JSON value.
+        metrics (dict): The elapsed time and memory used to process the log.
+    '''
+
+    # Processors and player photos are resolved relative to the web application
+    os.chdir(current_dir)
+    sys.path.insert(0, current_dir)
+
+    import cherrypy
+    import plugin
+
+    # Drive the stats plugin directly instead of through the cherrypy engine
+    start_time = time.time()
+    stats_plugin = plugin.StatsPlugin(cherrypy.engine)
+    stats_plugin.log_file_path = log_path
+    stats_plugin.merge_file_paths = list(merge_log_paths or [])
+    stats_plugin.debug_enabled = False
+    stats_plugin.start()
+    stats_plugin.main()
+    ingest_time = time.time() - start_time
+
+    start_time = time.time()
+    outputs = _export()
+    export_time = time.time() - start_time
+
+    stats_plugin.stop()
+
+    from stats import stat_mgr
+    metrics = {
+        'lines': stat_mgr.get_stats().lines,
+        'ingest_ms': int(round(ingest_time * 1000)),
+        'export_ms': int(round(export_time * 1000)),
+        'peak_kb': _get_peak_memory()
+    }
+    return outputs, metrics
+
+def _export():
+    import services.awards
+    import services.games
+    import services.kits
+    import services.leaderboard
+    import services.maps
+    import services.overview
+    import services.players
+    import services.replays
+    import services.teams
+    import services.vehicles
+    import services.weapons
+
+    outputs = dict()
+
+    # Mirror the set of requests issued by the static exporter
+    awards = services.awards.Handler()
+    for model in _export_url(outputs, awards, 'awards', 'index.json'):
+        _export_url(outputs, awards, 'awards', model['id'] + '.json')
+
+    games = services.games.Handler()
+    replays = services.replays.Handler()
+    for model in _export_url(outputs, games, 'games', 'index.json'):
+        _export_url(outputs, games, 'games', model['id'] + '.json')
+        _export_url(outputs, games, 'games', model['id'], 'timeline.json')
+        _export_url(outputs, replays, 'replays', model['id'] + '.json')
+
+    _export_url(outputs, services.leaderboard.Handler(), 'leaderboard',
+            'index.json')
+    _export_url(outputs, services.overview.Handler(), 'overview', 'index.json')
+
+    players = services.players.Handler()
+    for model in _export_url(outputs, players, 'players', 'index.json'):
+        for data_type in ['statistics', 'enemies', 'games', 'kits', 'maps',
+                'teams', 'vehicles', 'weapons']:
+            _export_url(outputs, players, 'players', model['id'],
+                    data_type + '.json')
+
+    for service_id, module in [('kits', services.kits),
+            ('maps', services.maps), ('teams', services.teams),
+            ('vehicles', services.vehicles), ('weapons', services.weapons)]:
+        handler = module.Handler()
+        for model in _export_url(outputs, handler, service_id, 'index.json'):
+            _export_url(outputs, handler, service_id, model['id'] + '.json')
+    return outputs
+
+def _export_url(outputs, handler, service_id, *args):
+    import utils
+
+    # Encode the response exactly like the cherrypy JSON handler would
+    # Failed requests are recorded too since they are part of the output
+    try:
+        content = ''.join(utils.json_encode(handler.GET(*args)))
+        value = _normalize(json.loads(content))
+    except Exception, err:
+        value = { 'error': '%s: %s' % (err.__class__.__name__, err) }
+
+    outputs['/'.join(['services', service_id] + list(args))] = value
+    return value if isinstance(value, list) else []
+
+def _normalize(value):
+
+    # Recursively normalize nested values
+    if isinstance(value, list):
+        value = [_normalize(item) for item in value]
+
+        # Index entries with the same name are ordered by hash iteration
+        if value and all(isinstance(item, dict) and 'name' in item
+                for item in value):
+            return _sort_groups(value, lambda item: item['name'].lower())
+        return value
+    if not isinstance(value, dict):
+        return value
+    value = dict((key, _normalize(item)) for key, item in value.iteritems())
+
+    # Ties in a table are ordered by hash iteration, so order them by content
+    if 'columns' in value and isinstance(value.get('rows'), list):
+        value['rows'] = _normalize_rows(value['columns'], value['rows'])
+    return value
+
+def _normalize_rows(columns, rows):
+
+    # Find the column used to sort the table
+    sort_index = None
+    for index, column in enumerate(columns):
+        if isinstance(column, dict) and column.get('sorted') != None:
+            sort_index = index
+            break
+
+    # Tables without a sorted column are listed in hash iteration order
+    if sort_index == None:
+        return sorted(rows, key=_dump)
+    return _sort_groups(rows, lambda row: row[sort_index])
+
+def _sort_groups(items, key):
+
+    # Only reorder consecutive items that share the same sort value
+    results = list()
+    group = list()
+    for item in items:
+        if group and key(group[0]) != key(item):
+            results.extend(sorted(group, key=_dump))
+            group = list()
+        group.append(item)
+    results.extend(sorted(group, key=_dump))
+    return results
+
+class _ErrorCounter(object):
+
+    def __init__(self):
+        self.count = 0
+
+    def write(self, value):
+
+        # Count error messages and stack traces reported by the processors
+        if value.startswith('ERROR') or value.startswith('Traceback'):
+            self.count += 1
+
+    def flush(self):
+        pass
+
+def _compare(expected, actual):
+    matched = True
+    for key in sorted(set(expected) | set(actual)):
+        if not key in actual:
+            print 'MISSING - ', key
+            matched = False
+        elif not key in expected:
+            print 'UNEXPECTED - ', key
+            matched = False
+        elif expected[key] != actual[key]:
+            print 'CHANGED - ', key
+            diff = list(difflib.unified_diff(
+                    _dump(expected[key], 1).splitlines(),
+                    _dump(actual[key], 1).splitlines(), 'golden', 'actual',
+                    lineterm=''))
+            for line in diff[:DIFF_LINES]:
+                print '    ' + line
+            if len(diff) > DIFF_LINES:
+                print '    ...'
+            matched = False
+    return matched
+
+def _dump(value, indent=None):
+    return json.dumps(value, indent=indent, sort_keys=True)
+
+def _get_peak_memory():
+
+    # Prefer the Linux high water mark since maxrss includes the parent process
+    if os.path.isfile('/proc/self/status'):
+        status_file = open('/proc/self/status', 'r')
+        try:
+            for line in status_file:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+        finally:
+            status_file.close()
+
+    if not resource:
+        return None
+
+    # Linux reports kilobytes while Mac OS reports bytes
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak /= 1024
+    return peak
+
+def _read_golden(golden_path):
+    golden_file = open(golden_path, 'r')
+    try:
+        return json.load(golden_file)
+    finally:
+        golden_file.close()
+
+def _write_golden(golden_path, outputs):
+    if not os.path.exists(GOLDEN_DIR):
+        os.makedirs(GOLDEN_DIR)
+
+    golden_file = open(golden_path, 'w')
+    try:
+        json.dump(outputs, golden_file, indent=1, sort_keys=True)
+        golden_file.write('\n')
+    finally:
+        golden_file.close()
+
+def _run_child(log_path):
+    output_file, output_path = tempfile.mkstemp(suffix='.json')
+    os.close(output_file)
+    try:
+        subprocess.check_call([sys.executable, os.path.abspath(__file__),
+                '--child', os.path.abspath(log_path), output_path])
+
+        output_file = open(output_path, 'r')
+        try:
+            return json.load(output_file)
+        finally:
+            output_file.close()
+    finally:
+        os.remove(output_path)
+
+def _main_child(log_path, output_path):
+
+    # Keep the manager console output away from the harness summary
+    stdout = sys.stdout
+    stderr = sys.stderr
+    sys.stdout = sys.stderr = _ErrorCounter()
+    try:
+        outputs, metrics = ingest(log_path)
+        metrics['errors'] = sys.stdout.count
+    finally:
+        sys.stdout = stdout
+        sys.stderr = stderr
+
+    output_file = open(output_path, 'w')
+    try:
+        json.dump([outputs, metrics], output_file)
+    finally:
+        output_file.close()
+
+# Compare the service output for every game log against the golden files
+# Usage: regression.py [--update] [log_path ...]
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if args and args[0] == '--child':
+        _main_child(args[1], args[2])
+    else:
+        update = '--update' in args
+        log_paths = [arg for arg in args if arg != '--update']
+        sys.exit(1 if run(log_paths, update) else 0)
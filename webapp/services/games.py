@@ -11,7 +11,7 @@ from stats import stat_mgr
 @cherrypy.tools.json_out()
 class Handler:
 
-    def GET(self, id=None):
+    def GET(self, id=None, data_type=None, resolution=None):
         '''
         Provides an index of available games or details for a specific game
         based on the given game identifier.
@@ -19,12 +19,23 @@ class Handler:
         Args:
             id (string): The unique identifier of a game. None indicates an
                     index of all games should be returned.
+            data_type (string): The type of game data to return. None
+                    indicates the game results should be returned.
+            resolution (string): The number of ticks covered by each point of
+                    a timeline. None indicates the default resolution.
 
         Returns:
             games (list): Returns the list of all games.
             game (object): Detailed information for a specific game.
         '''
 
+        # Handle requests for specific game data
+        if id and data_type:
+            data_type = os.path.splitext(data_type.lower())[0]
+            if data_type == 'timeline':
+                return self.get_game_timeline(id, resolution)
+            raise cherrypy.HTTPError(404)
+
         # Handle requests for specific games
         if id and id != 'index.json':
             id = os.path.splitext(id)[0]
@@ -79,6 +90,62 @@ class Handler:
         return { 'id': game.id, 'name': map_obj.name, 'columns' : columns,
                 'rows': rows }
 
+    def get_game_timeline(self, id, resolution=None):
+        '''
+        Provides the running score, kills and deaths of every player and team
+        over the course of a specific game.
+
+        Args:
+           id (string): The unique identifier of a game.
+           resolution (string): The requested number of ticks covered by each
+                   point. The closest resolution that was recorded is used.
+
+        Returns:
+            timeline (object): Detailed timeline information for a game.
+        '''
+
+        # Get the model for the requested game
+        game = model_mgr.get_game(id)
+        if not game: raise cherrypy.HTTPError(404)
+
+        # Get the timeline recorded for the requested game
+        processor = stat_mgr.get_processor('timelines')
+        timeline = processor.get_timeline(game.id) if processor else None
+        if not timeline: raise cherrypy.HTTPError(404)
+
+        if resolution != None:
+            try:
+                resolution = int(resolution)
+            except ValueError:
+                raise cherrypy.HTTPError(400)
+        resolution = timeline.get_resolution(resolution)
+
+        # Build the series of every player and team in the game
+        players = list()
+        teams = list()
+        for model in timeline.get_models(resolution):
+            series = timeline.get_series(model, resolution)
+            series['id'] = model.id
+            series['name'] = model.name
+            if isinstance(model, models.teams.Team):
+                teams.append(series)
+            elif model != models.players.EMPTY:
+                series['photo'] = model.photo_s
+                players.append(series)
+
+        # Sort the series by final score and keep ties in a stable order
+        players.sort(key=lambda s: (-s['score'][-1], s['name'], s['id']))
+        teams.sort(key=lambda s: (-s['score'][-1], s['name'], s['id']))
+
+        # Provide the starting tick of each point relative to the game start
+        size = timeline.get_index(timeline.last_tick, resolution) + 1
+        ticks = [index * resolution for index in xrange(size)]
+
+        map_obj = model_mgr.get_map(game.map_id)
+        return { 'id': game.id, 'name': map_obj.name,
+                'resolution': resolution, 'ticks': ticks, 'players': players,
+                'teams': teams }
+
     def get_games(self):
         '''
         Provides an index of available games.
@@ -3,17 +3,20 @@ import cherrypy
 
 from models import model_mgr
 from stats import stat_mgr
+from timer import Timer
 
 @cherrypy.expose()
 @cherrypy.tools.json_out()
 class Handler:
 
-    def GET(self, id=None):
+    def GET(self, id=None, time_format=None):
         '''
         Provides statistics that represent the overall performance of all players.
 
         Args:
-           None
+           time_format (string): The format of time values. 'seconds' indicates
+                   raw seconds should be returned for clients that format the
+                   time locally. None indicates formatted clock times.
 
         Returns:
             leaders (object): Overall information for all players.
@@ -26,7 +29,10 @@ class Handler:
         columns.append({ 'name': 'Help', 'data': 'number' })
         columns.append({ 'name': 'Kills', 'data': 'number' })
         columns.append({ 'name': 'Deaths', 'data': 'number' })
-        columns.append({ 'name': 'Time', 'data': 'string' })
+        if time_format == Timer.SECONDS:
+            columns.append({ 'name': 'Time', 'data': 'number' })
+        else:
+            columns.append({ 'name': 'Time', 'data': 'string' })
 
         # Build a row of statistics for each player
         rows = list()
@@ -39,7 +45,8 @@ class Handler:
             }
             rows.append([player_tuple, player_stats.score_total,
                     player_stats.teamwork_total, player_stats.kills_total,
-                    player_stats.deaths_total, player_stats.play_time])
+                    player_stats.deaths_total,
+                    player_stats.play_time.format(time_format)])
 
         # Sort the results by score
         rows.sort(key=lambda r: r[1], reverse=True)
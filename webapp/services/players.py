@@ -6,6 +6,7 @@ import models.players
 
 from models import model_mgr
 from stats import PlayerStats, stat_mgr
+from timer import Timer
 
 @cherrypy.expose()
 @cherrypy.tools.json_out()
@@ -26,7 +27,7 @@ class Handler:
             'supplies_total', 'team_killed_total', 'team_kills_total',
             'teamwork_total', 'wins', 'wounds_total']
 
-    def GET(self, id=None, data_type=None):
+    def GET(self, id=None, data_type=None, time_format=None):
         '''
         Provides an index of available players or details for a specific player
         based on the given player identifier.
@@ -36,6 +37,10 @@ class Handler:
                     index of all players should be returned.
             data_type (string): The type of player data to return. None
                     indicates basic statistics should be returned.
+            time_format (string): The format of time values. 'seconds'
+                    indicates raw seconds should be returned for clients that
+                    format the time locally. None indicates formatted clock
+                    times.
 
         Returns:
             players (list): Returns the list of all players.
@@ -50,9 +55,11 @@ class Handler:
         if id and id != 'index.json':
             data_type = os.path.splitext(data_type)[0]
             if data_type == 'statistics':
-                return self.get_player_stats(id)
+                return self.get_player_stats(id, time_format)
             elif data_type == 'enemies':
                 return self.get_player_enemies(id)
+            elif data_type == 'games':
+                return self.get_player_games(id)
             elif data_type == 'kits':
                 return self.get_player_kits(id)
             elif data_type == 'maps':
@@ -69,13 +76,15 @@ class Handler:
         # Handle requests for the full player index
         return self.get_players()
 
-    def get_player_stats(self, id):
+    def get_player_stats(self, id, time_format=None):
         '''
         Provides a map of various statistics for a specific player based on the
         given player identifier.
 
         Args:
             id (string): The unique identifier of a player.
+            time_format (string): The format of time values or None for
+                    formatted clock times.
 
         Returns:
             statistics (tuple): Detailed statistics for a specific player.
@@ -93,7 +102,10 @@ class Handler:
         for key in Handler.MODEL_FIELDS:
             results.append({ 'key': key, 'value': player.__dict__[key] })
         for key in Handler.STATS_FIELDS:
-            results.append({ 'key': key, 'value': player_stats.__dict__[key] })
+            value = getattr(player_stats, key)
+            if isinstance(value, Timer):
+                value = value.format(time_format)
+            results.append({ 'key': key, 'value': value })
         results.sort(key=lambda r: r['key'])
         return results
 
@@ -113,8 +125,11 @@ class Handler:
         player = model_mgr.get_player(id)
         if not player: raise cherrypy.HTTPError(404)
 
-        # Get the stats for the requested player
-        player_stats = stat_mgr.get_player_stats(player)
+        # Get the head-to-head stats for the requested player
+        player_matrix = stat_mgr.player_matrix
+        deaths = player_matrix.get_values('deaths', player)
+        kills = player_matrix.get_values('kills', player)
+        wounds = player_matrix.get_values('wounds', player)
 
         # Build a list of column descriptors
         columns = [{ 'name': 'Players', 'data': 'player' },
@@ -124,22 +139,59 @@ class Handler:
 
         # Build a list of enemy statistics
         rows = list()
-        for player in player_stats.enemies:
-            if player != models.players.EMPTY:
-                object_stats = player_stats.enemies[player]
+        for enemy in player_matrix.get_enemies(player):
+            if enemy != models.players.EMPTY:
                 player_tuple = {
-                    'id': player.id,
-                    'name': player.name,
-                    'photo': player.photo_s
+                    'id': enemy.id,
+                    'name': enemy.name,
+                    'photo': enemy.photo_s
                 }
-                rows.append([player_tuple, object_stats.wounds,
-                        object_stats.deaths, object_stats.kills])
+                rows.append([player_tuple, wounds[enemy.ordinal],
+                        deaths[enemy.ordinal], kills[enemy.ordinal]])
 
         # Sort the results by deaths to enemies
         rows.sort(key=lambda r: r[1], reverse=True)
 
         return { 'columns' : columns, 'rows': rows }
 
+    def get_player_games(self, id):
+        '''
+        Provides game by game details for a specific player based on the given
+        player identifier. Only games that have finished are included.
+
+        Args:
+           id (string): The unique identifier of a player.
+
+        Returns:
+            games (object): Detailed game information for a specific player.
+        '''
+
+        # Get the model for the requested player
+        player = model_mgr.get_player(id)
+        if not player: raise cherrypy.HTTPError(404)
+
+        # Build a list of column descriptors
+        columns = [{ 'name': 'Games', 'data': 'game' },
+                { 'name': 'Place', 'data': 'number' },
+                { 'name': 'Score', 'data': 'number' },
+                { 'name': 'Help', 'data': 'number' },
+                { 'name': 'Kills', 'data': 'number' },
+                { 'name': 'Deaths', 'data': 'number' }]
+
+        # Build a list of game statistics from the stored snapshots
+        rows = list()
+        for snapshot in stat_mgr.get_player_games(player):
+            values = snapshot.get_values(player)
+            map_obj = model_mgr.get_map(snapshot.game.map_id)
+            game_tuple = {
+                'id': snapshot.game.id,
+                'name': map_obj.name if map_obj else snapshot.game.map_id
+            }
+            rows.append([game_tuple, values['place'], values['score'],
+                    values['teamwork'], values['kills'], values['deaths']])
+
+        return { 'columns' : columns, 'rows': rows }
+
     def get_player_kits(self, id):
         '''
         Provides kit details for a specific player based on the given player
@@ -167,12 +219,13 @@ class Handler:
 
         # Build a list of kit statistics
         rows = list()
-        for kit in player_stats.kits:
+        object_stats = player_stats.kits
+        for kit in object_stats:
             if kit != models.kits.EMPTY:
-                object_stats = player_stats.kits[kit]
                 kit_tuple = { 'id': kit.id, 'name': kit.name }
-                rows.append([kit_tuple, object_stats.score, object_stats.kills,
-                        object_stats.deaths])
+                rows.append([kit_tuple, object_stats.score[kit.ordinal],
+                        object_stats.kills[kit.ordinal],
+                        object_stats.deaths[kit.ordinal]])
 
         # Sort the results by score
         rows.sort(key=lambda r: r[1], reverse=True)
@@ -206,12 +259,13 @@ class Handler:
 
         # Build a list of map statistics
         rows = list()
-        for map_obj in player_stats.maps:
+        object_stats = player_stats.maps
+        for map_obj in object_stats:
             if map_obj != models.maps.EMPTY:
-                object_stats = player_stats.maps[map_obj]
                 map_tuple = { 'id': map_obj.id, 'name': map_obj.name }
-                rows.append([map_tuple, object_stats.score,
-                        object_stats.kills, object_stats.deaths])
+                rows.append([map_tuple, object_stats.score[map_obj.ordinal],
+                        object_stats.kills[map_obj.ordinal],
+                        object_stats.deaths[map_obj.ordinal]])
 
         # Sort the results by score
         rows.sort(key=lambda r: r[1], reverse=True)
@@ -245,12 +299,13 @@ class Handler:
 
         # Build a list of team statistics
         rows = list()
-        for team in player_stats.teams:
+        object_stats = player_stats.teams
+        for team in object_stats:
             if team != models.teams.EMPTY:
-                object_stats = player_stats.teams[team]
                 team_tuple = { 'id': team.id, 'name': team.name }
-                rows.append([team_tuple, object_stats.score, object_stats.kills,
-                        object_stats.deaths])
+                rows.append([team_tuple, object_stats.score[team.ordinal],
+                        object_stats.kills[team.ordinal],
+                        object_stats.deaths[team.ordinal]])
 
         # Sort the results by score
         rows.sort(key=lambda r: r[1], reverse=True)
@@ -284,12 +339,12 @@ class Handler:
 
         # Build a list of vehicle statistics
         rows = list()
-        for vehicle in player_stats.vehicles:
+        object_stats = player_stats.vehicles
+        for vehicle in object_stats:
             if vehicle != models.vehicles.EMPTY:
-                object_stats = player_stats.vehicles[vehicle]
                 vehicle_tuple = { 'id': vehicle.id, 'name': vehicle.name }
-                rows.append([vehicle_tuple, object_stats.kills,
-                        object_stats.deaths])
+                rows.append([vehicle_tuple, object_stats.kills[vehicle.ordinal],
+                        object_stats.deaths[vehicle.ordinal]])
 
         # Sort the results by kills
         rows.sort(key=lambda r: r[1], reverse=True)
@@ -323,12 +378,14 @@ class Handler:
 
         # Build a list of weapon statistics
         rows = list()
-        for weapon in player_stats.weapons:
+        object_stats = player_stats.weapons
+        for weapon in object_stats:
             if weapon != models.weapons.EMPTY:
-                object_stats = player_stats.weapons[weapon]
                 weapon_tuple = { 'id': weapon.id, 'name': weapon.name }
-                rows.append([weapon_tuple, object_stats.kills, object_stats.deaths,
-                        [object_stats.bullets_hit, object_stats.bullets_fired]])
+                rows.append([weapon_tuple, object_stats.kills[weapon.ordinal],
+                        object_stats.deaths[weapon.ordinal],
+                        [object_stats.bullets_hit[weapon.ordinal],
+                        object_stats.bullets_fired[weapon.ordinal]]])
 
         # Sort the results by kills
         rows.sort(key=lambda r: r[1], reverse=True)
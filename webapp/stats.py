@@ -2,21 +2,106 @@
 import math
 import traceback
 
+from array import array
 from events import DisconnectEvent, GameStatusEvent, ServerStatusEvent
+from models import grid, model_mgr
 from processors import BaseProcessor
 from timer import Timer, timer_mgr
 
+# NumPy is optional and only loaded once the batch geometry functions are used
+# None indicates it was not loaded yet and False that it is not installed
+numpy = None
+
+def merge_values(value, other_value):
+    '''
+    Combines two statistic values of the same kind. Objects with a merge
+    method combine themselves, dictionaries are combined key by key, lists item
+    by item, flags are combined with or and numbers are added.
+
+    Args:
+        value (object): The value to combine into.
+        other_value (object): The value to combine with.
+
+    Returns:
+        value (object): The combined value.
+    '''
+
+    if hasattr(value, 'merge'):
+        value.merge(other_value)
+        return value
+
+    if isinstance(value, dict):
+        for key, other_item in other_value.iteritems():
+            if key in value:
+                value[key] = merge_values(value[key], other_item)
+            elif isinstance(other_item, BaseStats):
+                value[key] = merge_values(other_item.__class__(), other_item)
+            else:
+                value[key] = other_item
+        return value
+
+    if isinstance(value, list):
+        return [merge_values(item, other_item)
+                for item, other_item in zip(value, other_value)]
+
+    if isinstance(value, bool):
+        return value or other_value
+    return value + other_value
+
 class BaseStats(object):
 
+    # Statistics objects are created per model and per player pairing, so they
+    # declare their attributes up front rather than carrying an instance dict
+    # The generation is the stats manager reset that the game values belong to
+    __slots__ = ('generation',)
+
+    # Values that keep the highest value when statistics are merged
+    MAXIMA = ()
+
+    # Values that are calculated from other values and are not merged
+    DERIVED = ()
+
+    # Values of the current game that are not merged
+    GAME = ()
+
     def __init__(self):
 
         # Make sure the resettable values are initialized
         self.reset()
 
+    def __repr__(self):
+        return dict((key, getattr(self, key)) for key in self.__slots__)
+
+    def merge(self, other):
+        '''
+        Combines the values of the given statistics into this object. Counters
+        are added, maxima keep the highest value and timers add their elapsed
+        time, so statistics can be merged in any order.
+
+        Args:
+            other (BaseStats): Statistics of the same type to combine.
+
+        Returns:
+            None
+        '''
+
+        for key in self.__slots__:
+            if key in self.DERIVED or key in self.GAME:
+                continue
+
+            value = getattr(self, key)
+            other_value = getattr(other, key)
+            if key in self.MAXIMA:
+                setattr(self, key, max(value, other_value))
+            else:
+                setattr(self, key, merge_values(value, other_value))
+
     def reset(self):
         pass
 
-class GameItemStats(object):
+class GameItemStats(BaseStats):
+
+    __slots__ = ('deaths', 'kills', 'score', 'teamwork')
 
     def __init__(self):
         self.deaths = 0
@@ -24,11 +109,10 @@ class GameItemStats(object):
         self.score = 0
         self.teamwork = 0
 
-    def __repr__(self):
-        return self.__dict__
-
 class GameStats(BaseStats):
 
+    __slots__ = ('deaths', 'kills', 'players', 'score', 'teamwork')
+
     def __init__(self):
         BaseStats.__init__(self)
 
@@ -38,21 +122,19 @@ class GameStats(BaseStats):
         self.score = 0
         self.teamwork = 0
 
-    def __repr__(self):
-        return self.__dict__
+class KitItemStats(BaseStats):
 
-class KitItemStats(object):
+    __slots__ = ('deaths', 'kills', 'score')
 
     def __init__(self):
         self.deaths = 0
         self.kills = 0
         self.score = 0
 
-    def __repr__(self):
-        return self.__dict__
-
 class KitStats(BaseStats):
 
+    __slots__ = ('deaths', 'kills', 'players', 'score')
+
     def __init__(self):
         BaseStats.__init__(self)
 
@@ -61,21 +143,19 @@ class KitStats(BaseStats):
         self.players = dict()
         self.score = 0
 
-    def __repr__(self):
-        return self.__dict__
+class MapItemStats(BaseStats):
 
-class MapItemStats(object):
+    __slots__ = ('deaths', 'kills', 'score')
 
     def __init__(self):
         self.deaths = 0
         self.kills = 0
         self.score = 0
 
-    def __repr__(self):
-        return self.__dict__
-
 class MapStats(BaseStats):
 
+    __slots__ = ('deaths', 'kills', 'players', 'score')
+
     def __init__(self):
         BaseStats.__init__(self)
 
@@ -84,10 +164,12 @@ class MapStats(BaseStats):
         self.players = dict()
         self.score = 0
 
-    def __repr__(self):
-        return self.__dict__
+class OverviewStats(BaseStats):
+
+    __slots__ = ('deaths', 'kills', 'lines', 'players', 'score')
 
-class OverviewStats(object):
+    # The most players connected at the same time
+    MAXIMA = ('players',)
 
     def __init__(self):
         self.deaths = 0
@@ -96,35 +178,450 @@ class OverviewStats(object):
         self.players = 0
         self.score = 0
 
+class PlayerGameStats(object):
+    '''
+    Holds the per-game values of every player that took part in a game, frozen
+    when the game ends. Each value is stored as a tuple ordered by player.
+    '''
+
+    FIELDS = ('assisted', 'assists', 'deaths', 'deaths_streak',
+            'flag_capture_assists', 'flag_captures', 'flag_defends',
+            'flag_neutralize_assists', 'flag_neutralizes', 'healed', 'heals',
+            'kills', 'kills_5', 'kills_10', 'kills_ratio', 'kills_streak',
+            'place', 'rank', 'repairs', 'revived', 'revives', 'score',
+            'suicides', 'supplied', 'supplies', 'team_killed', 'team_kills',
+            'teamwork', 'wounds')
+
+    __slots__ = ('game', 'players', 'player_to_index') + FIELDS
+
+    def __init__(self, game, player_to_stats):
+        self.game = game
+        self.players = tuple(player_to_stats)
+        self.player_to_index = dict((player, index)
+                for index, player in enumerate(self.players))
+        for field in self.FIELDS:
+            setattr(self, field, tuple(getattr(player_to_stats[player], field)
+                    for player in self.players))
+
+    def __contains__(self, player):
+        return player in self.player_to_index
+
     def __repr__(self):
-        return self.__dict__
+        return dict((player.id, self.get_values(player))
+                for player in self.players)
 
-class PlayerItemStats(object):
+    def get_values(self, player):
+        '''
+        Gets the per-game values recorded for the given player.
 
-    def __init__(self):
-        self.deaths = 0
-        self.kills = 0
-        self.score = 0
-        self.wounds = 0
+        Args:
+            player (Player): The player to get values for.
 
-    def __repr__(self):
-        return self.__dict__
+        Returns:
+            values (dict): A map of field name to value or None when the player
+                    did not take part in the game.
+        '''
 
-class PlayerWeaponStats(object):
+        if not player in self.player_to_index:
+            return None
 
-    def __init__(self):
-        self.deaths = 0
-        self.kills = 0
-        self.bullets_hit = 0
-        self.bullets_fired = 0
-        self._bullets_hit = 0
-        self._bullets_fired = 0
+        index = self.player_to_index[player]
+        return dict((field, getattr(self, field)[index])
+                for field in self.FIELDS)
+
+class PlayerItemTable(object):
+    '''
+    Holds the statistics of a player for every model of a given type. Each
+    statistic is a preallocated counter array indexed by the model ordinal that
+    is assigned by the model manager. The registry of the models is loaded once
+    when the model manager starts, so it must be loaded before any table is
+    created.
+    '''
+
+    COUNTERS = ('deaths', 'kills', 'score')
+
+    __slots__ = ('models', 'used') + COUNTERS
+
+    def __init__(self, models):
+
+        # A loaded registry always starts with the empty model
+        assert models, 'Player item table requires a loaded model registry.'
+
+        self.models = models
+        self.used = array('B', [0]) * len(models)
+        for counter in self.COUNTERS:
+            setattr(self, counter, array('l', [0]) * len(models))
+
+    def __contains__(self, model):
+        return bool(self.used[self.get_ordinal(model)])
+
+    def __iter__(self):
+
+        # Only models that have statistics recorded are included
+        for ordinal, used in enumerate(self.used):
+            if used:
+                yield self.models[ordinal]
 
     def __repr__(self):
-        return self.__dict__
+        results = dict()
+        for model in self:
+            results[model.id] = dict((counter, getattr(self, counter)[model.ordinal])
+                    for counter in self.COUNTERS)
+        return results
+
+    def merge(self, other):
+        '''
+        Adds the counters of the given table to this table.
+
+        Args:
+            other (PlayerItemTable): A table for the same type of model.
+
+        Returns:
+            None
+        '''
+
+        for ordinal, used in enumerate(other.used):
+            if not used:
+                continue
+
+            self.used[ordinal] = 1
+            for counter in self.COUNTERS:
+                getattr(self, counter)[ordinal] += getattr(other, counter)[ordinal]
+
+    def add(self, model):
+        '''
+        Marks the given model as having statistics for the player.
+
+        Args:
+            model (object): The kit, map, team, vehicle or weapon model.
+
+        Returns:
+            ordinal (int): The index of the model in the counter arrays.
+        '''
+
+        ordinal = self.get_ordinal(model)
+        self.used[ordinal] = 1
+        return ordinal
+
+    def get_ordinal(self, model):
+        '''
+        Gets the index of the given model in the counter arrays.
+
+        Args:
+            model (object): The kit, map, team, vehicle or weapon model. None
+                    is treated the same as the empty model.
+
+        Returns:
+            ordinal (int): The index of the model in the counter arrays.
+        '''
+
+        return model.ordinal if model else 0
+
+class PlayerWeaponTable(PlayerItemTable):
+    '''
+    Holds the weapon statistics of a player. Besides the totals, the bullets
+    reported for each weapon during the current life are kept so that every
+    accuracy event only adds the change since the previous report.
+    '''
+
+    COUNTERS = ('deaths', 'kills', 'bullets_hit', 'bullets_fired')
+
+    __slots__ = ('bullets_hit', 'bullets_fired', 'life_bullets_hit',
+            'life_bullets_fired', 'life_used')
+
+    def __init__(self, models):
+        PlayerItemTable.__init__(self, models)
+
+        # The life values are not counters so they are never merged
+        self.life_bullets_hit = array('l', [0]) * len(models)
+        self.life_bullets_fired = array('l', [0]) * len(models)
+        self.life_used = list()
+
+    def add_accuracy(self, model, bullets_hit, bullets_fired):
+        '''
+        Updates the totals of a weapon from the bullets reported so far in the
+        current life of the player.
+
+        Args:
+            model (Weapon): The weapon that was used.
+            bullets_hit (int): The bullets that hit during the current life.
+            bullets_fired (int): The bullets fired during the current life.
+
+        Returns:
+            delta (tuple): The bullets hit and fired since the last report.
+        '''
+
+        ordinal = self.add(model)
+        if not self.life_bullets_hit[ordinal] and not self.life_bullets_fired[ordinal]:
+            self.life_used.append(ordinal)
+
+        hit_delta = bullets_hit - self.life_bullets_hit[ordinal]
+        fired_delta = bullets_fired - self.life_bullets_fired[ordinal]
+        self.life_bullets_hit[ordinal] = bullets_hit
+        self.life_bullets_fired[ordinal] = bullets_fired
+        self.bullets_hit[ordinal] += hit_delta
+        self.bullets_fired[ordinal] += fired_delta
+        return (hit_delta, fired_delta)
+
+    def reset_life(self):
+        '''
+        Starts a new life for the player, after which the game reports the
+        bullets of every weapon from zero again.
+
+        Args:
+            None
+
+        Returns:
+            None
+        '''
+
+        # Only the weapons reported during the last life need to be cleared
+        for ordinal in self.life_used:
+            self.life_bullets_hit[ordinal] = 0
+            self.life_bullets_fired[ordinal] = 0
+        self.life_used = list()
+
+class PlayerMatrix(object):
+    '''
+    Holds the head-to-head statistics between every pair of players. Each
+    statistic is a flat counter array with a row for each player and a column
+    for each enemy, both indexed by the player ordinal. The arrays grow by a
+    block of players at a time as new players join. Wounds are the kills of
+    the enemy against the player, so they are read from the kills with the row
+    and column swapped. The enemy with the highest value of every player is
+    kept up to date as values are added, so it never needs to be searched for.
+    '''
+
+    COUNTERS = ('deaths', 'kills')
+
+    # Number of players the matrix grows by when a new player does not fit
+    BLOCK_SIZE = 32
+
+    __slots__ = ('players', 'size', 'counter_to_max') + COUNTERS
+
+    def __init__(self, players):
+        self.players = players
+        self.size = 0
+        for counter in self.COUNTERS:
+            setattr(self, counter, array('l'))
+
+        # Ordinal of the enemy with the highest value for each player
+        # Negative ordinals indicate that no values were added yet
+        self.counter_to_max = dict((counter, array('l'))
+                for counter in self.COUNTERS + ('wounds',))
+
+    def add(self, counter, player, enemy, value):
+        '''
+        Adds the given value to a statistic of the player against the enemy.
+
+        Args:
+            counter (string): The deaths or kills statistic.
+            player (Player): The player the value belongs to.
+            enemy (Player): The enemy the value was recorded against.
+            value (int): The amount to add.
+
+        Returns:
+            None
+        '''
+
+        self._grow(max(player.ordinal, enemy.ordinal) + 1)
+        getattr(self, counter)[player.ordinal * self.size + enemy.ordinal] += value
+
+        # The kills of the player are also the wounds of the enemy
+        self._update_max(counter, player.ordinal, enemy.ordinal, value)
+        if counter == 'kills':
+            self._update_max('wounds', enemy.ordinal, player.ordinal, value)
+
+    def get(self, counter, player, enemy):
+        '''
+        Gets a statistic of the player against the enemy.
+
+        Args:
+            counter (string): The deaths, kills or wounds statistic.
+            player (Player): The player to get the value for.
+            enemy (Player): The enemy to get the value against.
+
+        Returns:
+            value (int): The current value of the statistic.
+        '''
+
+        if max(player.ordinal, enemy.ordinal) >= self.size:
+            return 0
+
+        if counter == 'wounds':
+            return self.kills[enemy.ordinal * self.size + player.ordinal]
+        return getattr(self, counter)[player.ordinal * self.size + enemy.ordinal]
+
+    def get_enemies(self, player):
+        '''
+        Gets the enemies the player has any statistics recorded against.
+
+        Args:
+            player (Player): The player to get enemies for.
+
+        Returns:
+            enemies (list): The enemy models ordered by ordinal.
+        '''
+
+        deaths = self.get_values('deaths', player)
+        kills = self.get_values('kills', player)
+        wounds = self.get_values('wounds', player)
+        return [self.players[ordinal] for ordinal in xrange(len(kills))
+                if deaths[ordinal] or kills[ordinal] or wounds[ordinal]]
+
+    def get_max(self, counter, player):
+        '''
+        Gets the enemy with the highest value of a statistic for the player. For
+        example the most kills gives the favorite victim of the player and the
+        most deaths gives the nemesis of the player.
+
+        Args:
+            counter (string): The deaths, kills or wounds statistic.
+            player (Player): The player to get the enemy for.
+
+        Returns:
+            enemy (tuple): The enemy with the lowest ordinal among the highest
+                    values and the value, or None and 0 when there are no
+                    values.
+        '''
+
+        if player.ordinal >= self.size:
+            return (None, 0)
+
+        ordinal = self.counter_to_max[counter][player.ordinal]
+        value = self._get_value(counter, player.ordinal, ordinal) if ordinal >= 0 else 0
+        if not value:
+            return (None, 0)
+        return (self.players[ordinal], value)
+
+    def get_values(self, counter, player):
+        '''
+        Gets a statistic of the player against every enemy.
+
+        Args:
+            counter (string): The deaths, kills or wounds statistic.
+            player (Player): The player to get values for.
+
+        Returns:
+            values (array): The values indexed by enemy ordinal.
+        '''
+
+        ordinal = player.ordinal
+        if ordinal >= self.size:
+            return array('l')
+
+        if counter == 'wounds':
+            return self.kills[ordinal::self.size]
+        start = ordinal * self.size
+        return getattr(self, counter)[start:start + self.size]
+
+    def merge(self, other):
+        '''
+        Adds the statistics of the given matrix to this matrix.
+
+        Args:
+            other (PlayerMatrix): A matrix for the same players.
+
+        Returns:
+            None
+        '''
+
+        self._grow(other.size)
+        for counter in self.COUNTERS:
+            values = getattr(self, counter)
+            other_values = getattr(other, counter)
+            for row in xrange(other.size):
+                start = row * self.size
+                other_start = row * other.size
+                for column in xrange(other.size):
+                    values[start + column] += other_values[other_start + column]
+
+        # Search the highest values again from the combined values
+        for counter, maxima in self.counter_to_max.iteritems():
+            for row in xrange(self.size):
+                maxima[row] = self._find_max(counter, row)
+
+    def _find_max(self, counter, row):
+        if counter == 'wounds':
+            values = self.kills[row::self.size]
+        else:
+            values = getattr(self, counter)[row * self.size:(row + 1) * self.size]
+        return values.index(max(values)) if values else -1
+
+    def _get_value(self, counter, row, column):
+        if counter == 'wounds':
+            return self.kills[column * self.size + row]
+        return getattr(self, counter)[row * self.size + column]
+
+    def _grow(self, size):
+        if size <= self.size:
+            return
+
+        # Copy each existing row to the start of the matching row in the new arrays
+        new_size = (size + self.BLOCK_SIZE - 1) // self.BLOCK_SIZE * self.BLOCK_SIZE
+        for counter in self.COUNTERS:
+            values = getattr(self, counter)
+            new_values = array('l', [0]) * (new_size * new_size)
+            for row in xrange(self.size):
+                new_values[row * new_size:row * new_size + self.size] = (
+                        values[row * self.size:(row + 1) * self.size])
+            setattr(self, counter, new_values)
+        for maxima in self.counter_to_max.itervalues():
+            maxima.extend([-1] * (new_size - self.size))
+        self.size = new_size
+
+    def _update_max(self, counter, row, column, value):
+        maxima = self.counter_to_max[counter]
+        max_column = maxima[row]
+
+        # A lower value only matters when it belonged to the current maximum
+        if value < 0:
+            if max_column == column:
+                maxima[row] = self._find_max(counter, row)
+            return
+
+        # Ties keep the enemy with the lowest ordinal
+        if max_column < 0:
+            maxima[row] = column
+            return
+        new_value = self._get_value(counter, row, column)
+        max_value = self._get_value(counter, row, max_column)
+        if new_value > max_value or (new_value == max_value and column < max_column):
+            maxima[row] = column
 
 class PlayerStats(BaseStats):
 
+    # Game values only describe the current game of each stats manager
+    GAME = ('assisted', 'assists', 'deaths', 'deaths_streak',
+            'flag_capture_assists', 'flag_captures', 'flag_defends',
+            'flag_neutralize_assists', 'flag_neutralizes', 'healed', 'heals',
+            'kills', 'kills_5', 'kills_10', 'kills_ratio', 'kills_streak',
+            'place', 'played', 'rank', 'repairs', 'revived', 'revives',
+            'score', 'suicides', 'supplied', 'supplies', 'team_killed',
+            'team_kills', 'teamwork', 'trend', 'wounds')
+
+    __slots__ = (
+
+        # Cumulative values
+        'assisted_total', 'assists_total', 'bullets_fired', 'bullets_hit',
+        'commander_time', 'deaths_total', 'deaths_streak_max', 'games',
+        'flag_capture_assists_total', 'flag_captures_total',
+        'flag_defends_total', 'flag_neutralize_assists_total',
+        'flag_neutralizes_total', 'healed_total', 'heals_total',
+        'kills_5_total', 'kills_10_total', 'kills_ratio_max',
+        'kills_ratio_total', 'kills_streak_max', 'kills_total', 'kits',
+        'leader_time', 'losses', 'maps', 'place_overall', 'play_time',
+        'repairs_total', 'revived_total', 'revives_total', 'score_total',
+        'spec_time', 'squad_time', 'suicides_total', 'supplied_total',
+        'supplies_total', 'team_killed_total', 'team_kills_total', 'teams',
+        'teamwork_total', 'vehicles', 'weapons', 'wins', 'wounds_total'
+    ) + GAME
+
+    MAXIMA = ('deaths_streak_max', 'kills_streak_max')
+
+    # The player scores processor calculates these again from the merged totals
+    DERIVED = ('kills_ratio_max', 'kills_ratio_total', 'place_overall')
+
     def __init__(self):
         BaseStats.__init__(self)
 
@@ -136,7 +633,6 @@ class PlayerStats(BaseStats):
         self.commander_time = Timer()
         self.deaths_total = 0
         self.deaths_streak_max = 0
-        self.enemies = dict()
         self.games = 0
         self.flag_capture_assists_total = 0
         self.flag_captures_total = 0
@@ -147,13 +643,14 @@ class PlayerStats(BaseStats):
         self.heals_total = 0
         self.kills_5_total = 0
         self.kills_10_total = 0
+        self.kills_ratio_max = 0.0
         self.kills_ratio_total = 0.0
         self.kills_streak_max = 0
         self.kills_total = 0
-        self.kits = dict()
+        self.kits = PlayerItemTable(model_mgr.ordinal_to_kit)
         self.leader_time = Timer()
         self.losses = 0
-        self.maps = dict()
+        self.maps = PlayerItemTable(model_mgr.ordinal_to_map)
         self.place_overall = 0
         self.play_time = Timer()
         self.repairs_total = 0
@@ -167,16 +664,13 @@ class PlayerStats(BaseStats):
         self.supplies_total = 0
         self.team_killed_total = 0
         self.team_kills_total = 0
-        self.teams = dict()
+        self.teams = PlayerItemTable(model_mgr.ordinal_to_team)
         self.teamwork_total = 0
-        self.vehicles = dict()
-        self.weapons = dict()
+        self.vehicles = PlayerItemTable(model_mgr.ordinal_to_vehicle)
+        self.weapons = PlayerWeaponTable(model_mgr.ordinal_to_weapon)
         self.wins = 0
         self.wounds_total = 0
 
-    def __repr__(self):
-        return self.__dict__
-
     def reset(self):
 
         # Game values
@@ -212,18 +706,19 @@ class PlayerStats(BaseStats):
         self.trend = ''
         self.wounds = 0
 
-class TeamItemStats(object):
+class TeamItemStats(BaseStats):
+
+    __slots__ = ('deaths', 'kills', 'score')
 
     def __init__(self):
         self.deaths = 0
         self.kills = 0
         self.score = 0
 
-    def __repr__(self):
-        return self.__dict__
-
 class TeamStats(BaseStats):
 
+    __slots__ = ('deaths', 'kills', 'players', 'score')
+
     def __init__(self):
         BaseStats.__init__(self)
 
@@ -232,20 +727,18 @@ class TeamStats(BaseStats):
         self.players = dict()
         self.score = 0
 
-    def __repr__(self):
-        return self.__dict__
+class VehicleItemStats(BaseStats):
 
-class VehicleItemStats(object):
+    __slots__ = ('deaths', 'kills')
 
     def __init__(self):
         self.deaths = 0
         self.kills = 0
 
-    def __repr__(self):
-        return self.__dict__
-
 class VehicleStats(BaseStats):
 
+    __slots__ = ('deaths', 'kills', 'players')
+
     def __init__(self):
         BaseStats.__init__(self)
 
@@ -253,40 +746,47 @@ class VehicleStats(BaseStats):
         self.kills = 0
         self.players = dict()
 
-    def __repr__(self):
-        return self.__dict__
+class WeaponItemStats(BaseStats):
 
-class WeaponItemStats(object):
+    __slots__ = ('deaths', 'kills')
 
     def __init__(self):
         self.deaths = 0
         self.kills = 0
 
-    def __repr__(self):
-        return self.__dict__
-
 class WeaponStats(BaseStats):
 
+    __slots__ = ('bullets_fired', 'bullets_hit', 'deaths', 'kills', 'players')
+
     def __init__(self):
         BaseStats.__init__(self)
 
+        self.bullets_fired = 0
+        self.bullets_hit = 0
         self.deaths = 0
         self.kills = 0
         self.players = dict()
 
-    def __repr__(self):
-        return self.__dict__
-
 class StatManager(object):
 
     def __init__(self):
         self.processors = list()
+        self.dispatch_processors = list()
         self.id_to_processor = dict()
         self.type_to_processors = dict()
 
         self.game = None
         self.type_to_stats = dict()
         self.overview_stats = OverviewStats()
+        self.game_snapshots = dict()
+        self.player_matrix = PlayerMatrix(model_mgr.ordinal_to_player)
+
+        # Incremented every time the game values of the statistics are reset
+        self.generation = 0
+
+        # Incremented every time processors may have changed their results
+        # outside of the normal event callbacks
+        self.revision = 0
 
     # This method will be called to initialize the manager
     def start(self):
@@ -296,6 +796,10 @@ class StatManager(object):
         # Sort the log processors by priority
         self.processors.sort(key=lambda p: p.priority)
 
+        # Only pass events to the processors that handle them directly
+        self.dispatch_processors = [processor for processor in self.processors
+                if processor.dispatched]
+
         # Start all the log processors
         for processor in self.processors:
             processor.start()
@@ -312,10 +816,44 @@ class StatManager(object):
 
         print 'STATS MANAGER - STOPPED'
 
+    def merge(self, other):
+        '''
+        Combines the statistics and award results of another stats manager,
+        such as one that processed the log of a different server, into this
+        one. Both managers must share the model manager so that the statistics
+        of the same player are combined. Post processing should be run again
+        on the combined results.
+
+        Args:
+            other (StatManager): The stats manager to combine with this one.
+
+        Returns:
+            None
+        '''
+
+        for stats_type, model_to_stats in other.type_to_stats.iteritems():
+            for model in model_to_stats:
+                self._get_stats(model, stats_type).merge(
+                        other._get_stats(model, stats_type))
+        self.overview_stats.merge(other.overview_stats)
+        self.player_matrix.merge(other.player_matrix)
+
+        # Game identifiers are unique so snapshots never overlap
+        for game_id, snapshot in other.game_snapshots.iteritems():
+            if not game_id in self.game_snapshots:
+                self.game_snapshots[game_id] = snapshot
+
+        # Processors are merged after the statistics they may depend on
+        for processor in other.processors:
+            if processor.id in self.id_to_processor:
+                self.id_to_processor[processor.id].merge(processor)
+        self.revision += 1
+
     def add_processor(self, processor):
         '''
         Registers the given processor instance so that it can be used to
-        calculate statistics.
+        calculate statistics. The processor updates the statistics of this
+        manager from then on.
 
         Args:
             processor (BaseProcessor): The processor instance to register.
@@ -329,6 +867,7 @@ class StatManager(object):
         assert not processor.id in self.id_to_processor, 'Duplicate processor registration: %s' % id
         assert isinstance(processor, BaseProcessor), 'Must inherit BaseProcessor: %s' % processor
 
+        processor.stat_mgr = self
         self.processors.append(processor)
         self.id_to_processor[processor.id] = processor
 
@@ -402,14 +941,17 @@ class StatManager(object):
 
         # Reset the stats and timers when a new game starts
         # Store a reference to the current game
+        # Keep the values of the last game in case it never ended properly
         if isinstance(event, GameStatusEvent) and event.game.starting:
+            if self.game:
+                self.snapshot_stats(self.game)
             self.game = event.game
             self.reset_stats()
             timer_mgr.reset_timers()
 
         # Allow each processor to handle the event
         if event and event.CALLBACK:
-            for processor in self.processors:
+            for processor in self.dispatch_processors:
 
                 # Terminate processing if the event was consumed
                 if self._process_event(processor, event):
@@ -424,9 +966,11 @@ class StatManager(object):
         if isinstance(event, DisconnectEvent):
             timer_mgr.stop_player(event.player, event.tick)
 
-        # Reset timers when a game ends
+        # Reset timers and keep the player values when a game ends
         if isinstance(event, GameStatusEvent) and event.game.ending:
             timer_mgr.reset_timers()
+            if self.game:
+                self.snapshot_stats(self.game)
 
     def post_process(self):
         '''
@@ -449,11 +993,14 @@ class StatManager(object):
                         % (processor.__class__.__module__,
                         processor.__class__.__name__))
                 traceback.print_exc(err)
+        self.revision += 1
 
     def reset_stats(self):
         '''
         Resets all the statistic models. This is typically only called when a
-        new game starts.
+        new game starts. The game values of each statistics object are reset
+        the first time it is requested after the reset, so only the models used
+        in the new game pay for it.
 
         Args:
             None
@@ -462,9 +1009,34 @@ class StatManager(object):
             None
         '''
 
-        for model_to_stats in self.type_to_stats.itervalues():
-            for model_stats in model_to_stats.itervalues():
-                model_stats.reset()
+        self.generation += 1
+
+    def snapshot_stats(self, game):
+        '''
+        Stores the per-game values of every player that took part in the given
+        game so they are available after the statistics are reset. Only the
+        first snapshot of a game is kept.
+
+        Args:
+            game (Game): The game whose player values should be stored.
+
+        Returns:
+            None
+        '''
+
+        if not game or game.id in self.game_snapshots:
+            return
+
+        # Find the players that spawned during the game
+        # Statistics from an earlier generation were not used in the game
+        player_to_stats = dict()
+        if PlayerStats in self.type_to_stats:
+            for player, player_stats in self.type_to_stats[PlayerStats].iteritems():
+                if player_stats.generation == self.generation and player_stats.played:
+                    player_to_stats[player] = player_stats
+
+        if player_to_stats:
+            self.game_snapshots[game.id] = PlayerGameStats(game, player_to_stats)
 
     def get_stats(self, stats_type=None):
         '''
@@ -482,7 +1054,8 @@ class StatManager(object):
             return self.overview_stats
 
         if stats_type in self.type_to_stats:
-            return self.type_to_stats[stats_type].values()
+            return [self._get_stats(model, stats_type)
+                    for model in self.type_to_stats[stats_type]]
         return []
 
     def get_game_stats(self, game):
@@ -540,6 +1113,23 @@ class StatManager(object):
 
         return self._get_stats(player, PlayerStats)
 
+    def get_player_games(self, player):
+        '''
+        Gets the stored per-game values for the given player model.
+
+        Args:
+            player (Player): Object representation of a player.
+
+        Returns:
+            games (list): A list of game snapshots that include the player,
+                    ordered by game.
+        '''
+
+        snapshots = [snapshot for snapshot in self.game_snapshots.itervalues()
+                if player in snapshot]
+        snapshots.sort(key=lambda s: int(s.game.id))
+        return snapshots
+
     def get_team_stats(self, team):
         '''
         Gets the statistics object for the given team model.
@@ -609,12 +1199,8 @@ class StatManager(object):
             distance (float): The distance between two points using the x, y, and z coordinates.
         '''
 
-        # Formula: sqrt((x2 - x1)^2 + (y2 - y1)^2 + (z2 - z1)^2)
         if pos1 and len(pos1) == 4 and pos2 and len(pos2) == 4:
-            x_dist = math.pow(pos2[0] - pos1[0], 2)
-            y_dist = math.pow(pos2[2] - pos1[2], 2)
-            z_dist = math.pow(pos2[1] - pos1[1], 2)
-            return math.sqrt(x_dist + y_dist + z_dist)
+            return grid.dist_3d(pos1, pos2)
 
     def dist_alt(self, pos1, pos2):
         '''
@@ -683,6 +1269,130 @@ class StatManager(object):
         angle_diff = self.angle_diff(pos1, pos2)
         return angle_diff >= 300 or angle_diff <= 60
 
+    def dist_2d_all(self, pos, positions):
+        '''
+        Calculates the distances between a position and many other positions
+        in 2-dimensional space. Every position must have all four values.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a], or a list of
+                    such arrays to compare each of them with all the positions.
+            positions (list): A list of arrays of points in the form [x, z, y, a].
+
+        Returns:
+            distances (list): The distance to each of the positions, or a list
+                    of such lists when a list of positions was given.
+        '''
+
+        return self._apply_all(pos, positions, _dist_2d_all, self.dist_2d)
+
+    def dist_3d_all(self, pos, positions):
+        '''
+        Calculates the distances between a position and many other positions
+        in 3-dimensional space. Every position must have all four values.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a], or a list of
+                    such arrays to compare each of them with all the positions.
+            positions (list): A list of arrays of points in the form [x, z, y, a].
+
+        Returns:
+            distances (list): The distance to each of the positions, or a list
+                    of such lists when a list of positions was given.
+        '''
+
+        return self._apply_all(pos, positions, _dist_3d_all, self.dist_3d)
+
+    def dist_alt_all(self, pos, positions):
+        '''
+        Calculates the altitude distances between a position and many other
+        positions. Every position must have all four values.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a], or a list of
+                    such arrays to compare each of them with all the positions.
+            positions (list): A list of arrays of points in the form [x, z, y, a].
+
+        Returns:
+            distances (list): The distance to each of the positions, or a list
+                    of such lists when a list of positions was given.
+        '''
+
+        return self._apply_all(pos, positions, _dist_alt_all, self.dist_alt)
+
+    def angle_diff_all(self, pos, positions):
+        '''
+        Calculates the differences between the angle of a position and the
+        angles of many other positions. Every position must have all four
+        values.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a], or a list of
+                    such arrays to compare each of them with all the positions.
+            positions (list): A list of arrays of points in the form [x, z, y, a].
+
+        Returns:
+            differences (list): The difference with each of the positions, or a
+                    list of such lists when a list of positions was given.
+        '''
+
+        return self._apply_all(pos, positions, _angle_diff_all, self.angle_diff)
+
+    def angle_same_all(self, pos, positions):
+        '''
+        Calculates whether the angle of a position points in the same general
+        direction as the angles of many other positions. Every position must
+        have all four values.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a], or a list of
+                    such arrays to compare each of them with all the positions.
+            positions (list): A list of arrays of points in the form [x, z, y, a].
+
+        Returns:
+            angles same (list): A flag for each of the positions, or a list of
+                    such lists when a list of positions was given.
+        '''
+
+        return self._apply_all(pos, positions, _angle_same_all, self.angle_same)
+
+    def angle_opp_all(self, pos, positions):
+        '''
+        Calculates whether the angle of a position points in the opposite
+        general direction as the angles of many other positions. Every position
+        must have all four values.
+
+        Args:
+            pos (array): Array of points in the form [x, z, y, a], or a list of
+                    such arrays to compare each of them with all the positions.
+            positions (list): A list of arrays of points in the form [x, z, y, a].
+
+        Returns:
+            angles opposite (list): A flag for each of the positions, or a list
+                    of such lists when a list of positions was given.
+        '''
+
+        return self._apply_all(pos, positions, _angle_opp_all, self.angle_opp)
+
+    def _apply_all(self, pos, positions, batch_function, function):
+        many = not pos or isinstance(pos[0], (list, tuple))
+        origins = (pos or []) if many else [pos]
+
+        # Reject incomplete positions so the results do not depend on NumPy
+        _check_positions(origins)
+        _check_positions(positions)
+
+        # Fall back to the functions for a single pair of positions
+        if not _import_numpy():
+            results = [[function(p1, p2) for p2 in positions] for p1 in origins]
+            return results if many else results[0]
+
+        # Compare every origin with every target by broadcasting the arrays
+        origins = numpy.array(origins, dtype=float).reshape(-1, 1, 4)
+        targets = numpy.array(positions, dtype=float).reshape(1, -1, 4)
+        results = batch_function(origins, targets).tolist()
+        return results if many else results[0]
+
     def _get_stats(self, model, stats_type):
         if not (model and stats_type): return
 
@@ -693,8 +1403,17 @@ class StatManager(object):
 
         # Make sure there is a mapping for the given model
         if not model in model_to_stats:
-            model_to_stats[model] = stats_type()
-        return model_to_stats[model]
+            model_stats = stats_type()
+            model_stats.generation = self.generation
+            model_to_stats[model] = model_stats
+            return model_stats
+
+        # Reset statistics that were not used since the last reset
+        model_stats = model_to_stats[model]
+        if model_stats.generation != self.generation:
+            model_stats.generation = self.generation
+            model_stats.reset()
+        return model_stats
 
     def _process_event(self, processor, event):
 
@@ -723,5 +1442,54 @@ class StatManager(object):
             print 'ERROR - Missing callback: %s.%s[%s]' % (processor.__class__.__module__,
                     processor.__class__.__name__, event.CALLBACK)
 
+def _import_numpy():
+    global numpy
+    if numpy == None:
+        try:
+            import numpy as numpy_module
+            numpy = numpy_module
+        except ImportError:
+            numpy = False
+    return numpy
+
+def _check_positions(positions):
+    try:
+        invalid = set(map(len, positions)) - set([4])
+    except TypeError:
+
+        # Missing positions have no length
+        invalid = True
+    if invalid:
+        raise ValueError('Every position must have all four values')
+
+def _dist_2d_all(origins, targets):
+    deltas = targets - origins
+    return numpy.sqrt(deltas[..., 0] ** 2 + deltas[..., 2] ** 2)
+
+def _dist_3d_all(origins, targets):
+    deltas = targets - origins
+    return numpy.sqrt(deltas[..., 0] ** 2 + deltas[..., 1] ** 2
+            + deltas[..., 2] ** 2)
+
+def _dist_alt_all(origins, targets):
+    return numpy.abs(targets[..., 1] - origins[..., 1])
+
+def _angle_diff_all(origins, targets):
+
+    # Negative angles are converted to the 0-360 degrees range
+    origin_angles = origins[..., 3]
+    origin_angles = numpy.where(origin_angles >= 0, origin_angles, origin_angles + 360)
+    target_angles = targets[..., 3]
+    target_angles = numpy.where(target_angles >= 0, target_angles, target_angles + 360)
+    return numpy.abs(target_angles - origin_angles)
+
+def _angle_same_all(origins, targets):
+    angle_diffs = _angle_diff_all(origins, targets)
+    return (angle_diffs >= 120) & (angle_diffs <= 240)
+
+def _angle_opp_all(origins, targets):
+    angle_diffs = _angle_diff_all(origins, targets)
+    return (angle_diffs >= 300) | (angle_diffs <= 60)
+
 # Create a shared singleton instance of the stats manager
 stat_mgr = StatManager()
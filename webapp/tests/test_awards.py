@@ -0,0 +1,122 @@
+
+import json
+import os
+import os.path
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# The web application folder holds the logs and the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+import regression
+
+LOG_PATH = current_dir + '/logs/bf2_game_log%i.txt'
+
+# The main log is checked every few lines and the other log is merged into it
+MAIN_LOG = 6
+MERGE_LOG = 7
+
+# Lines of the main log between two checks of the cached rows
+CHECK_INTERVAL = 50
+
+class AwardCacheTest(unittest.TestCase):
+    '''
+    Processes a log and compares the cached result rows of every award with
+    rows built from its current results, while the log is processed and after
+    another log was merged into it. The log is processed in a separate
+    interpreter since all the managers are singletons.
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        output_file, output_path = tempfile.mkstemp(suffix='.json')
+        os.close(output_file)
+        try:
+            subprocess.check_call([sys.executable, os.path.abspath(__file__),
+                    '--child', output_path])
+
+            output_file = open(output_path, 'r')
+            try:
+                cls.checks = json.load(output_file)
+            finally:
+                output_file.close()
+        finally:
+            os.remove(output_path)
+
+    def test_processed(self):
+        self.assertTrue(self.checks['count'] > 0)
+        self.assertEqual(self.checks['processed'], {})
+
+    def test_merged(self):
+        self.assertEqual(self.checks['merged'], [])
+
+    def test_copied(self):
+        self.assertEqual(self.checks['copied'], [])
+
+def _get_stale(awards):
+    return [award.id for award in awards
+            if award.get_results() != award._dict_to_rows(award.results)]
+
+def _main_child(output_path):
+
+    # Processors and player photos are resolved relative to the web application
+    os.chdir(current_dir)
+
+    # Keep the manager console output away from the test results
+    stdout = sys.stdout
+    stderr = sys.stderr
+    sys.stdout = sys.stderr = regression._ErrorCounter()
+    try:
+        import cherrypy
+        import plugin
+        from stats import stat_mgr
+
+        stats_plugin = plugin.StatsPlugin(cherrypy.engine)
+        stats_plugin.log_file_path = LOG_PATH % MAIN_LOG
+        stats_plugin.merge_file_paths = [LOG_PATH % MERGE_LOG]
+        stats_plugin.debug_enabled = False
+        stats_plugin.start()
+        awards = stat_mgr.get_processors('awards')
+
+        # Remember the first line each award was stale after
+        count = 0
+        processed = dict()
+        for index, line in enumerate(stats_plugin.log_file):
+            line = line.strip()
+            if not line:
+                continue
+
+            stats_plugin._process(line)
+            if index % CHECK_INTERVAL == 0:
+                count += 1
+                for award_id in _get_stale(awards):
+                    processed.setdefault(award_id, index + 1)
+
+        # Merging and post processing change the results without any events
+        stats_plugin.main()
+        merged = _get_stale(awards)
+
+        # Changing the returned rows must not change the cached rows
+        for award in awards:
+            del award.get_results()[:]
+        copied = _get_stale(awards)
+        stats_plugin.stop()
+    finally:
+        sys.stdout = stdout
+        sys.stderr = stderr
+
+    output_file = open(output_path, 'w')
+    try:
+        json.dump({'count': count, 'processed': processed, 'merged': merged,
+                'copied': copied}, output_file)
+    finally:
+        output_file.close()
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        _main_child(sys.argv[2])
+    else:
+        unittest.main()
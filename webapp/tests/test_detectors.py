@@ -0,0 +1,211 @@
+
+import os
+import os.path
+import sys
+import unittest
+
+# The web application folder holds the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+from detectors import Intervals, LastSeen, Streak, Window
+
+class StreakTest(unittest.TestCase):
+    '''
+    Checks the streaks of consecutive matching values of each key.
+    '''
+
+    def test_add(self):
+        streak = Streak()
+        self.assertEqual(streak.add('a', 'x'), 1)
+        self.assertEqual(streak.add('a', 'x'), 2)
+        self.assertEqual(streak.add('a', 'x'), 3)
+
+        # A different value starts a new streak without affecting other keys
+        self.assertEqual(streak.add('b', 'x'), 1)
+        self.assertEqual(streak.add('a', 'y'), 1)
+        self.assertEqual(streak.add('a', 'y'), 2)
+        self.assertEqual(streak.add('b', 'x'), 2)
+
+    def test_add_without_value(self):
+        streak = Streak()
+        self.assertEqual(streak.add('a'), 1)
+        self.assertEqual(streak.add('a'), 2)
+
+    def test_get(self):
+        streak = Streak()
+        self.assertEqual(streak.get('a'), 0)
+        streak.add('a', 'x')
+        streak.add('a', 'x')
+        self.assertEqual(streak.get('a'), 2)
+
+        # Getting the streak does not extend it
+        self.assertEqual(streak.get('a'), 2)
+        self.assertEqual(streak.get('b'), 0)
+
+    def test_reset(self):
+        streak = Streak()
+        streak.add('a', 'x')
+        streak.add('a', 'x')
+        streak.reset('a')
+        self.assertEqual(streak.get('a'), 0)
+        self.assertEqual(streak.add('a', 'x'), 1)
+
+        # Resetting a key without a streak is ignored
+        streak.reset('b')
+
+class WindowTest(unittest.TestCase):
+    '''
+    Checks the event counts of each key within the sliding window.
+    '''
+
+    def test_add(self):
+        window = Window(10)
+        self.assertEqual(window.add('a', 100), 1)
+        self.assertEqual(window.add('a', 105), 2)
+        self.assertEqual(window.add('b', 105), 1)
+
+        # Events exactly at the edge of the window still count
+        self.assertEqual(window.add('a', 110), 3)
+        self.assertEqual(window.add('a', 111), 3)
+        self.assertEqual(window.add('a', 130), 1)
+
+    def test_add_same_tick(self):
+        window = Window(0)
+        self.assertEqual(window.add('a', 100), 1)
+        self.assertEqual(window.add('a', 100), 2)
+        self.assertEqual(window.add('a', 101), 1)
+
+    def test_get(self):
+        window = Window(10)
+        self.assertEqual(window.get('a', 100), 0)
+        window.add('a', 100)
+        window.add('a', 108)
+        self.assertEqual(window.get('a', 108), 2)
+        self.assertEqual(window.get('a', 115), 1)
+        self.assertEqual(window.get('a', 119), 0)
+
+        # Dropped events do not come back
+        self.assertEqual(window.add('a', 119), 1)
+
+    def test_clock_restart(self):
+        window = Window(10)
+        window.add('a', 100)
+        window.add('a', 105)
+        window.add('b', 100)
+
+        # Events from before the restart are dropped instead of counted
+        self.assertEqual(window.get('a', 3), 0)
+        self.assertEqual(window.add('b', 3), 1)
+        self.assertEqual(window.add('b', 5), 2)
+
+    def test_reset(self):
+        window = Window(10)
+        window.add('a', 100)
+        window.reset('a')
+        self.assertEqual(window.get('a', 100), 0)
+        self.assertEqual(window.add('a', 101), 1)
+        window.reset('b')
+
+class IntervalsTest(unittest.TestCase):
+    '''
+    Checks the running interval statistics of each key and how they merge.
+    '''
+
+    def test_add(self):
+        intervals = Intervals()
+        self.assertEqual(intervals.add('a', 100), None)
+        self.assertEqual(intervals.add('a', 110), 10)
+        self.assertEqual(intervals.add('a', 140), 30)
+        self.assertEqual(intervals.add('b', 140), None)
+        self.assertEqual(intervals.add('a', 140), 0)
+
+        _assert_stats(self, intervals.get('a'), 140, 4, 40, 1000)
+        _assert_stats(self, intervals.get('b'), 140, 1, 0, 0)
+        self.assertEqual(intervals.get('c'), None)
+
+    def test_clock_restart(self):
+        intervals = Intervals()
+        intervals.add('a', 100)
+        intervals.add('a', 110)
+
+        # The first event after a restart has no interval to the previous one
+        self.assertEqual(intervals.add('a', 5), None)
+        _assert_stats(self, intervals.get('a'), 5, 3, 10, 100)
+        self.assertEqual(intervals.add('a', 25), 20)
+        _assert_stats(self, intervals.get('a'), 25, 4, 30, 500)
+
+    def test_merge(self):
+        intervals = Intervals()
+        intervals.add('a', 100)
+        intervals.add('a', 110)
+        intervals.add('b', 100)
+
+        other = Intervals()
+        other.add('a', 50)
+        other.add('a', 70)
+        other.add('a', 100)
+        other.add('c', 10)
+        other.add('c', 13)
+
+        intervals.merge(other)
+        _assert_stats(self, intervals.get('a'), 110, 5, 60, 1400)
+        _assert_stats(self, intervals.get('b'), 100, 1, 0, 0)
+        _assert_stats(self, intervals.get('c'), 13, 2, 3, 9)
+
+        # The merged statistics are copies that do not change the other instance
+        intervals.add('c', 20)
+        _assert_stats(self, other.get('c'), 13, 2, 3, 9)
+
+    def test_merge_empty(self):
+        intervals = Intervals()
+        intervals.add('a', 100)
+        intervals.add('a', 110)
+        intervals.merge(Intervals())
+        _assert_stats(self, intervals.get('a'), 110, 2, 10, 100)
+
+class LastSeenTest(unittest.TestCase):
+    '''
+    Checks the ticks since the latest event of each key.
+    '''
+
+    def test_add(self):
+        last_seen = LastSeen()
+        self.assertEqual(last_seen.add('a', 100), None)
+        self.assertEqual(last_seen.add('a', 130), 30)
+        self.assertEqual(last_seen.add('a', 130), 0)
+        self.assertEqual(last_seen.add('b', 130), None)
+
+    def test_get_elapsed(self):
+        last_seen = LastSeen()
+        self.assertEqual(last_seen.get_elapsed('a', 100), None)
+        last_seen.add('a', 100)
+        self.assertEqual(last_seen.get_elapsed('a', 100), 0)
+        self.assertEqual(last_seen.get_elapsed('a', 125), 25)
+
+        # Getting the elapsed ticks does not move the latest event
+        self.assertEqual(last_seen.get_elapsed('a', 150), 50)
+
+    def test_clock_restart(self):
+        last_seen = LastSeen()
+        last_seen.add('a', 100)
+
+        # Events from before the restart do not count
+        self.assertEqual(last_seen.get_elapsed('a', 20), None)
+        self.assertEqual(last_seen.add('a', 20), None)
+        self.assertEqual(last_seen.get_elapsed('a', 30), 10)
+
+    def test_reset(self):
+        last_seen = LastSeen()
+        last_seen.add('a', 100)
+        last_seen.reset('a')
+        self.assertEqual(last_seen.get_elapsed('a', 110), None)
+        self.assertEqual(last_seen.add('a', 110), None)
+        last_seen.reset('b')
+
+def _assert_stats(test, stats, last_tick, count, total, total_squares):
+    test.assertEqual((stats.last_tick, stats.count, stats.total,
+            stats.total_squares), (last_tick, count, total, total_squares))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+
+import os
+import os.path
+import random
+import sys
+import unittest
+
+# The web application folder holds the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+import stats
+from stats import stat_mgr
+
+FUNCTION_NAMES = ('angle_diff', 'angle_opp', 'angle_same', 'dist_2d', 'dist_3d',
+        'dist_alt')
+
+class GeometryTest(unittest.TestCase):
+    '''
+    Compares the batch geometry functions of the stats manager with the
+    functions for a single pair of positions, both with NumPy and with the
+    fallback that is used when NumPy is not installed.
+    '''
+
+    def setUp(self):
+        self.numpy = stats.numpy
+        rand = random.Random(1)
+        self.positions = [[rand.uniform(-500, 500), rand.uniform(0, 100),
+                rand.uniform(-500, 500), rand.uniform(-180, 180)]
+                for i in xrange(40)]
+
+        # Include integer positions and the edges of the angle ranges
+        self.positions.append([0, 0, 0, 0])
+        self.positions.append([10, 5, -10, -180])
+        self.positions.append([-10, 5, 10, 180])
+        self.positions.append([3, 4, 0, 120])
+        self.positions.append([0, 0, 0, -60])
+
+    def tearDown(self):
+        stats.numpy = self.numpy
+
+    def test_numpy(self):
+        if not stats._import_numpy():
+            self.skipTest('NumPy is not installed')
+        self._check_parity()
+
+    def test_fallback(self):
+        stats.numpy = False
+        self._check_parity()
+
+    def test_invalid_numpy(self):
+        if not stats._import_numpy():
+            self.skipTest('NumPy is not installed')
+        self._check_invalid()
+
+    def test_invalid_fallback(self):
+        stats.numpy = False
+        self._check_invalid()
+
+    def _check_parity(self):
+        origins = self.positions[:8]
+        for name in FUNCTION_NAMES:
+            function = getattr(stat_mgr, name)
+            batch_function = getattr(stat_mgr, name + '_all')
+
+            # A single origin gets a list and many origins get a list of lists
+            for origin in origins:
+                _assert_values(self, batch_function(origin, self.positions),
+                        [function(origin, p) for p in self.positions], name)
+            many = batch_function(origins, self.positions)
+            self.assertEqual(len(many), len(origins))
+            for origin, values in zip(origins, many):
+                _assert_values(self, values,
+                        [function(origin, p) for p in self.positions], name)
+
+            self.assertEqual(batch_function(origins[0], []), [])
+            self.assertEqual(batch_function([], self.positions), [])
+            self.assertEqual(batch_function(origins, []), [[]] * len(origins))
+
+    def _check_invalid(self):
+        for name in FUNCTION_NAMES:
+            batch_function = getattr(stat_mgr, name + '_all')
+            for invalid in (None, [], [1, 2, 3], [1, 2, 3, 4, 5]):
+                self.assertRaises(ValueError, batch_function, self.positions[0],
+                        [self.positions[1], invalid])
+                self.assertRaises(ValueError, batch_function,
+                        [self.positions[0], invalid], self.positions)
+            self.assertRaises(ValueError, batch_function, [1, 2, 3],
+                    self.positions)
+
+def _assert_values(test, values, expected, name):
+    test.assertEqual(len(values), len(expected), name)
+    for value, expected_value in zip(values, expected):
+
+        # Flags must stay booleans so they can be used like the scalar results
+        if isinstance(expected_value, bool):
+            test.assertTrue(isinstance(value, bool), name)
+            test.assertEqual(value, expected_value, name)
+        else:
+            test.assertAlmostEqual(value, expected_value, 9, name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+
+import os
+import os.path
+import random
+import sys
+import unittest
+
+# The web application folder holds the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+from models.grid import Grid, dist_3d
+from models.manager import ModelManager
+from models.players import Player
+
+CELL_SIZE = 50
+MODEL_COUNT = 300
+
+class GridTest(unittest.TestCase):
+    '''
+    Compares the proximity lookups of the grid with a scan of every indexed
+    position, including models that moved between cells or were removed.
+    '''
+
+    def setUp(self):
+        self.random = random.Random(1)
+        self.grid = Grid(CELL_SIZE)
+        self.model_to_pos = dict()
+        for model in xrange(MODEL_COUNT):
+            self._set_pos(model, self._get_random_pos())
+
+    def test_get_near(self):
+        for pos in self._get_search_positions():
+            for radius in (0, 1, 25, CELL_SIZE, 130, 600, 5000):
+                self.assertEqual(sorted(self.grid.get_near(pos, radius)),
+                        sorted(_get_near(self.model_to_pos, pos, radius)),
+                        '%s %s' % (pos, radius))
+
+    def test_get_nearest(self):
+        for pos in self._get_search_positions():
+            for count in (0, 1, 2, 10, 75, MODEL_COUNT, MODEL_COUNT + 10):
+                self.assertEqual(self.grid.get_nearest(pos, count),
+                        _get_nearest(self.model_to_pos, pos, count),
+                        '%s %s' % (pos, count))
+
+    def test_moved_models(self):
+
+        # Move some models within their cell and others across the map
+        for model in xrange(0, MODEL_COUNT, 3):
+            pos = self.model_to_pos[model]
+            self._set_pos(model, [pos[0] + 1, pos[1], pos[2] - 1, pos[3]])
+        for model in xrange(1, MODEL_COUNT, 3):
+            self._set_pos(model, self._get_random_pos())
+        for model in xrange(2, MODEL_COUNT, 6):
+            self.grid.remove(model)
+            del self.model_to_pos[model]
+
+        self.assertEqual(len(self.grid), len(self.model_to_pos))
+        for pos in self._get_search_positions():
+            self.assertEqual(sorted(self.grid.get_near(pos, 200)),
+                    sorted(_get_near(self.model_to_pos, pos, 200)))
+            self.assertEqual(self.grid.get_nearest(pos, 20),
+                    _get_nearest(self.model_to_pos, pos, 20))
+
+    def test_clear(self):
+        self.grid.clear()
+        self.assertEqual(len(self.grid), 0)
+        self.assertEqual(self.grid.get_near([0, 0, 0, 0], 5000), [])
+        self.assertEqual(self.grid.get_nearest([0, 0, 0, 0], 10), [])
+
+    def _get_random_pos(self):
+        return [self.random.uniform(-1000, 1000), self.random.uniform(0, 200),
+                self.random.uniform(-1000, 1000), self.random.uniform(-180, 180)]
+
+    def _get_search_positions(self):
+
+        # Search from random spots, indexed models, cell corners and off the map
+        positions = [self._get_random_pos() for i in xrange(20)]
+        positions.extend(self.model_to_pos[model]
+                for model in sorted(self.model_to_pos)[:5])
+        positions.append([0, 0, 0, 0])
+        positions.append([CELL_SIZE, 0, -CELL_SIZE, 0])
+        positions.append([4000, 0, -4000, 0])
+        return positions
+
+    def _set_pos(self, model, pos):
+        self.grid.set_pos(model, pos)
+        self.model_to_pos[model] = pos
+
+class ModelManagerTest(unittest.TestCase):
+    '''
+    Compares the nearby player lookups of the model manager with a scan of the
+    positions of the connected players.
+    '''
+
+    def setUp(self):
+        self.random = random.Random(2)
+        self.model_mgr = ModelManager()
+        self.players = list()
+        for i in xrange(100):
+            player = Player('10.0.0.%i' % i, 'Player %i' % i)
+            self.model_mgr.set_player_connected(player, True)
+            self.model_mgr.set_player_pos(player, [
+                    self.random.uniform(-500, 500), self.random.uniform(0, 100),
+                    self.random.uniform(-500, 500), 0])
+            self.players.append(player)
+
+        # Disconnected players are no longer indexed
+        for player in self.players[::4]:
+            self.model_mgr.set_player_connected(player, False)
+
+    def test_get_nearest_players(self):
+        id_to_pos = self._get_connected_positions()
+        for player in self.players[:10]:
+            for count in (1, 5, 100):
+                self.assertEqual(_get_ids(self.model_mgr.get_nearest_players(
+                        player.pos, count)),
+                        _get_nearest(id_to_pos, player.pos, count))
+
+    def test_get_players_near(self):
+        id_to_pos = self._get_connected_positions()
+        for player in self.players[:10]:
+            for radius in (10, 100, 1000):
+                self.assertEqual(sorted(_get_ids(self.model_mgr.get_players_near(
+                        player.pos, radius))),
+                        sorted(_get_near(id_to_pos, player.pos, radius)))
+
+    def test_reset_models(self):
+        self.model_mgr.reset_models()
+        self.assertEqual(self.model_mgr.get_nearest_players([0, 0, 0, 0], 10), [])
+        self.assertEqual(self.model_mgr.get_players_near([0, 0, 0, 0], 5000), [])
+
+    def _get_connected_positions(self):
+        return dict((player.id, player.pos) for player in self.players
+                if player.connected)
+
+def _get_ids(players):
+
+    # Players are compared by id since their representation is not a string
+    return [player.id for player in players]
+
+def _get_near(model_to_pos, pos, radius):
+    return [model for model, model_pos in model_to_pos.iteritems()
+            if dist_3d(pos, model_pos) < radius]
+
+def _get_nearest(model_to_pos, pos, count):
+    models = sorted(model_to_pos, key=lambda m: dist_3d(pos, model_to_pos[m]))
+    return models[:max(count, 0)]
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+
+import json
+import os
+import os.path
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# The web application folder holds the logs and the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+import regression
+
+LOG_PATH = current_dir + '/logs/bf2_game_log%i.txt'
+
+# The first log is ingested for merging and the second one is processed after it
+MERGE_LOG = 7
+MAIN_LOG = 5
+
+# Lines of the main log before its first game is playing
+MAIN_LOG_SKIPPED = 3
+
+class IngestTest(unittest.TestCase):
+    '''
+    Ingests one log for merging and then processes a second log that starts in
+    the middle of a game. The second log must not continue the game, players or
+    rosters of the first one. The logs are processed in a separate interpreter
+    since all the managers are singletons.
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        output_file, output_path = tempfile.mkstemp(suffix='.json')
+        os.close(output_file)
+        try:
+            subprocess.check_call([sys.executable, os.path.abspath(__file__),
+                    '--child', output_path])
+
+            output_file = open(output_path, 'r')
+            try:
+                cls.states = json.load(output_file)
+            finally:
+                output_file.close()
+        finally:
+            os.remove(output_path)
+
+    def test_models_after_ingest(self):
+        state = self.states['ingested']
+        self.assertEqual(state['connected'], [])
+        self.assertEqual(state['teams'], 0)
+        self.assertEqual(state['squads'], 0)
+        self.assertEqual(state['positions'], 0)
+        self.assertEqual(state['game_map'], '')
+        self.assertTrue(state['games'])
+
+    def test_games_after_main(self):
+        ingested = self.states['ingested']
+        state = self.states['processed']
+
+        # The main log starts a game of its own and leaves the merged games alone
+        self.assertFalse(state['game'] in ingested['games'])
+        self.assertEqual(state['games'][:len(ingested['games'])],
+                ingested['games'])
+        self.assertEqual(state['game_maps'][:len(ingested['game_maps'])],
+                ingested['game_maps'])
+        self.assertEqual(state['game_maps'][len(ingested['game_maps'])],
+                'daqing_oilfields')
+
+    def test_players_after_main(self):
+        state = self.states['processed']
+
+        # Only players of the main log can be connected
+        self.assertTrue(set(state['connected']) <= set(state['main_players']))
+        self.assertEqual(state['errors'], 0)
+
+def _get_state(model_mgr):
+    return {
+        'connected': sorted(p.name for p in model_mgr.get_players(True)),
+        'teams': len(model_mgr.team_to_players),
+        'squads': len(model_mgr.squad_to_players),
+        'positions': len(model_mgr.player_grid),
+        'game': model_mgr.get_game().id,
+        'game_map': model_mgr.get_game().map_id,
+        'games': [game.id for game in model_mgr.get_games()],
+        'game_maps': [game.map_id for game in model_mgr.get_games()]
+    }
+
+def _main_child(output_path):
+
+    # Processors and player photos are resolved relative to the web application
+    os.chdir(current_dir)
+
+    # Keep the manager console output away from the test results
+    stdout = sys.stdout
+    stderr = sys.stderr
+    sys.stdout = sys.stderr = regression._ErrorCounter()
+    log_file, log_path = tempfile.mkstemp(suffix='.txt')
+    os.close(log_file)
+    try:
+        import cherrypy
+        import plugin
+        from models import model_mgr
+
+        # Start the main log in the middle of its first game
+        main_file = open(LOG_PATH % MAIN_LOG, 'r')
+        try:
+            lines = main_file.readlines()
+        finally:
+            main_file.close()
+        log_file = open(log_path, 'w')
+        try:
+            log_file.writelines(lines[MAIN_LOG_SKIPPED:])
+        finally:
+            log_file.close()
+
+        stats_plugin = plugin.StatsPlugin(cherrypy.engine)
+        stats_plugin.log_file_path = log_path
+        stats_plugin.merge_file_paths = [LOG_PATH % MERGE_LOG]
+        stats_plugin.debug_enabled = False
+        stats_plugin.start()
+        ingested = _get_state(model_mgr)
+
+        stats_plugin.main()
+        processed = _get_state(model_mgr)
+        processed['main_players'] = sorted(set(line.split(';')[3].strip()
+                for line in lines if line.split(';')[1] == 'CN'))
+        processed['errors'] = sys.stdout.count
+        stats_plugin.stop()
+    finally:
+        sys.stdout = stdout
+        sys.stderr = stderr
+        os.remove(log_path)
+
+    output_file = open(output_path, 'w')
+    try:
+        json.dump({'ingested': ingested, 'processed': processed}, output_file)
+    finally:
+        output_file.close()
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        _main_child(sys.argv[2])
+    else:
+        unittest.main()
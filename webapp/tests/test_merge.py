@@ -0,0 +1,144 @@
+
+import json
+import os
+import os.path
+import sys
+import unittest
+
+# The web application folder holds the logs and the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+import regression
+
+LOG_PATH = current_dir + '/logs/bf2_game_log%i.txt'
+GOLDEN_PATH = current_dir + '/logs/golden/bf2_game_log%i.json'
+
+# Both logs were played by Jimini and Luda
+MAIN_LOG = 5
+MERGE_LOG = 7
+
+class MergeTest(unittest.TestCase):
+    '''
+    Ingests one log into the shared stats manager and another log into a
+    separate stats manager, merges them and compares the combined output with
+    the golden output of each log on its own.
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+
+        # Keep the manager console output away from the test results
+        stdout = sys.stdout
+        stderr = sys.stderr
+        sys.stdout = sys.stderr = regression._ErrorCounter()
+        try:
+            cls.outputs, metrics = regression.ingest(LOG_PATH % MAIN_LOG,
+                    [LOG_PATH % MERGE_LOG])
+            cls.errors = sys.stdout.count
+        finally:
+            sys.stdout = stdout
+            sys.stderr = stderr
+
+        cls.goldens = [_read_golden(MAIN_LOG), _read_golden(MERGE_LOG)]
+
+    def test_errors(self):
+        self.assertEqual(self.errors, 0)
+
+    def test_overview(self):
+        overview = self.outputs['services/overview/index.json']
+        golden_overviews = [golden['services/overview/index.json']
+                for golden in self.goldens]
+
+        for key in ('deaths', 'kills', 'lines', 'score'):
+            self.assertEqual(overview[key], sum(golden_overview[key]
+                    for golden_overview in golden_overviews), key)
+        self.assertEqual(overview['players'], max(golden_overview['players']
+                for golden_overview in golden_overviews))
+
+    def test_games(self):
+        games = self.outputs['services/games/index.json']
+        self.assertEqual(len(games), sum(len(golden['services/games/index.json'])
+                for golden in self.goldens))
+
+    def test_player_totals(self):
+        name_to_stats = _get_player_stats(self.outputs)
+        golden_stats = [_get_player_stats(golden) for golden in self.goldens]
+        self.assertEqual(sorted(name_to_stats), sorted(set(golden_stats[0])
+                | set(golden_stats[1])))
+
+        for name, player_stats in name_to_stats.iteritems():
+            played = [stats[name] for stats in golden_stats if name in stats]
+
+            # Counters and timers add up across the logs
+            for key in ('deaths_total', 'games', 'kills_total', 'losses',
+                    'score_total', 'suicides_total', 'wins', 'wounds_total'):
+                self.assertEqual(player_stats[key], sum(values[key]
+                        for values in played), '%s %s' % (name, key))
+            for key in ('play_time', 'spec_time'):
+                self.assertEqual(_get_seconds(player_stats[key]),
+                        sum(_get_seconds(values[key]) for values in played),
+                        '%s %s' % (name, key))
+
+            # Streaks keep the best run of any log
+            for key in ('deaths_streak_max', 'kills_streak_max'):
+                self.assertEqual(player_stats[key], max(values[key]
+                        for values in played), '%s %s' % (name, key))
+
+            # Ratios are calculated again from the combined totals
+            kills = player_stats['kills_total']
+            deaths = player_stats['deaths_total']
+            if deaths:
+                ratio = round(float(kills) / float(deaths), 2)
+            else:
+                ratio = 1.0 if kills else 0.0
+            self.assertEqual(player_stats['kills_ratio_total'], ratio, name)
+
+    def test_player_places(self):
+        name_to_stats = _get_player_stats(self.outputs)
+
+        # Tied players share the best place
+        for name, player_stats in name_to_stats.iteritems():
+            higher = [other for other in name_to_stats.itervalues()
+                    if other['score_total'] > player_stats['score_total']]
+            self.assertEqual(player_stats['place_overall'], len(higher) + 1,
+                    name)
+
+    def test_award_counts(self):
+
+        # Counting awards add the results of each player
+        for award_id in ('unabomber', 'watch_your_step'):
+            path = 'services/awards/%s.json' % award_id
+            name_to_value = _get_award_values(self.outputs[path])
+            golden_values = [_get_award_values(golden[path])
+                    for golden in self.goldens]
+            for name, value in name_to_value.iteritems():
+                self.assertEqual(value, sum(values.get(name, 0)
+                        for values in golden_values), '%s %s' % (award_id, name))
+
+def _get_award_values(award):
+    return dict((row[0]['name'], row[1]) for row in award['rows'])
+
+def _get_player_stats(outputs):
+
+    # Player identifiers depend on the order the players were first seen
+    name_to_stats = dict()
+    for player in outputs['services/players/index.json']:
+        path = 'services/players/%s/statistics.json' % player['id']
+        name_to_stats[player['name']] = dict((item['key'], item['value'])
+                for item in outputs[path])
+    return name_to_stats
+
+def _get_seconds(clock):
+    hours, minutes, seconds = clock.split(':')
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+def _read_golden(log_number):
+    golden_file = open(GOLDEN_PATH % log_number, 'r')
+    try:
+        return json.load(golden_file)
+    finally:
+        golden_file.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+
+import json
+import os
+import os.path
+import sys
+import unittest
+
+# The web application folder holds the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+from models import (control_points, kits, maps, players, squads, teams,
+        vehicles, weapons)
+from utils import JsonEncoder
+
+class ModelTest(unittest.TestCase):
+    '''
+    Serializes every type of model and checks that the bookkeeping of the model
+    manager is left out while the model values are kept.
+    '''
+
+    def test_bookkeeping(self):
+        for module in (control_points, kits, maps, players, squads, teams,
+                vehicles, weapons):
+            model = json.loads(json.dumps(module.EMPTY, cls=JsonEncoder))
+            self.assertFalse('ordinal' in model, module.__name__)
+            self.assertFalse('generation' in model, module.__name__)
+            self.assertTrue('id' in model, module.__name__)
+
+    def test_player(self):
+        player = players.Player('10.0.0.1', 'Player')
+        player.ordinal = 3
+        player.generation = 2
+        model = json.loads(json.dumps(player, cls=JsonEncoder))
+        self.assertEqual(model['name'], 'Player')
+        self.assertEqual(model['address'], '10.0.0.1')
+        self.assertEqual(model['photo_s'], player.photo_s)
+        self.assertFalse('ordinal' in model)
+        self.assertFalse('generation' in model)
+
+if __name__ == '__main__':
+    unittest.main()
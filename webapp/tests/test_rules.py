@@ -0,0 +1,109 @@
+
+import collections
+import os
+import os.path
+import sys
+import unittest
+
+# The web application folder holds the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+from processors.awards import Rule
+
+class Event(object):
+
+    CALLBACK = 'on_test'
+
+    def __init__(self, player, value=None, channel='global', text=''):
+        self.player = player
+        self.value = value
+        self.channel = channel
+        self.text = text
+
+class RuleTest(unittest.TestCase):
+    '''
+    Applies rules to simple events and checks the combined, merged and
+    formatted values of each aggregate.
+    '''
+
+    def test_count(self):
+        rule = Rule(Event, 'player', filters={'value': lambda v: v > 1})
+        results = _apply(rule, [Event('a', 1), Event('a', 2), Event('a', 3),
+                Event('b', 5)])
+        self.assertEqual(results, {'a': 2, 'b': 1})
+
+    def test_sum(self):
+        rule = Rule(Event, 'player', Rule.SUM, 'value')
+        results = _apply(rule, [Event('a', 1), Event('a', 2), Event('b', 5),
+                Event('b', None)])
+        self.assertEqual(results, {'a': 3, 'b': 5})
+        self.assertEqual(rule.merge_value(results['a'], results['b']), 8)
+
+    def test_max(self):
+        rule = Rule(Event, 'player', Rule.MAX, 'value')
+        results = _apply(rule, [Event('a', 4), Event('a', 2), Event('b', 0)])
+
+        # Values that do not beat the default are left out like the original awards
+        self.assertEqual(results, {'a': 4})
+        self.assertEqual(rule.merge_value(4, 7), 7)
+
+    def test_average(self):
+        rule = Rule(Event, 'player', Rule.AVERAGE, 'value')
+        results = _apply(rule, [Event('a', 10), Event('a', 15), Event('a', None),
+                Event('b', 3)])
+        self.assertEqual(results, {'a': [25, 2], 'b': [3, 1]})
+        self.assertEqual(rule.format_value(results['a']), 13)
+
+        # Averages are calculated again from the combined totals
+        merged = rule.merge_value(results['a'], results['b'])
+        self.assertEqual(merged, [28, 3])
+        self.assertEqual(rule.format_value(merged), 9)
+
+    def test_ratio(self):
+        rule = Rule(Event, 'player', Rule.RATIO, 'value')
+        results = _apply(rule, [Event('a', (1, 4)), Event('a', (2, 2)),
+                Event('b', (0, 3))])
+        self.assertEqual(results, {'a': [3, 6], 'b': [0, 3]})
+
+        # Ratios keep both totals for percent columns
+        self.assertEqual(rule.format_value(results['a']), [3, 6])
+        self.assertEqual(rule.merge_value(results['a'], results['b']), [3, 9])
+
+    def test_distinct(self):
+        rule = Rule(Event, 'player', Rule.SUM, lambda e: len(e.text),
+                filters={
+                        'channel': lambda c: not 'server' in c,
+                        'text': lambda t: len(t) >= 2},
+                distinct='text')
+        results = _apply(rule, [Event('a', text='hello'),
+                Event('a', text='hello'), Event('b', text='hello'),
+                Event('a', text='x'), Event('a', channel='server', text='bye'),
+                Event('b', text='bye'), Event('a', text='hello')])
+        self.assertEqual(results, {'a': 10, 'b': 3})
+
+    def test_distinct_filtered(self):
+        rule = Rule(Event, 'player', filters={'value': True}, distinct='text')
+        results = collections.Counter()
+        rule.apply(results, Event('a', True, text='hi'))
+
+        # Events rejected by the filters do not become the previous event
+        for i in xrange(3):
+            rule.apply(results, Event('a', False, text='other'))
+        rule.apply(results, Event('a', True, text='hi'))
+        rule.apply(results, Event('a', True, text='other'))
+        self.assertEqual(results, {'a': 2})
+
+    def test_missing_field(self):
+        rule = Rule(Event, 'player', filters={'value.name': 'x'})
+        results = _apply(rule, [Event('a', None)])
+        self.assertEqual(results, {})
+
+def _apply(rule, events):
+    results = collections.Counter()
+    for event in events:
+        rule.apply(results, event)
+    return results
+
+if __name__ == '__main__':
+    unittest.main()
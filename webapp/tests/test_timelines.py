@@ -0,0 +1,79 @@
+
+import os
+import os.path
+import sys
+import unittest
+
+# The web application folder holds the modules under test
+current_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, current_dir)
+
+from models.games import Game
+from models.players import Player
+from processors.core.timelines import Processor
+
+RESOLUTION = 30
+
+class Event(object):
+
+    def __init__(self, tick, **values):
+        self.tick = tick
+        self.__dict__.update(values)
+
+class TimelineTest(unittest.TestCase):
+    '''
+    Records scores for the games of a processor and checks the buckets of the
+    timelines, which cover each game from its start until it ends.
+    '''
+
+    def setUp(self):
+        self.processor = Processor()
+        self.player = Player('10.0.0.1', 'Player')
+
+    def test_buckets(self):
+        game = self._set_status(Game('pre', 'map', 0, 0), Game.STARTING, 100)
+        self._set_status(game, Game.PLAYING, 110)
+        self._score(120, 1)
+        self._score(150, 2)
+        self._score(185, 4)
+
+        timeline = self.processor.get_timeline(game.id)
+        self.assertEqual(timeline.get_series(self.player, RESOLUTION)['score'],
+                [1, 3, 7])
+
+    def test_game_end(self):
+        game = self._set_status(Game('pre', 'map', 0, 0), Game.STARTING, 100)
+        self._set_status(game, Game.PLAYING, 110)
+        self._score(120, 1)
+        self._set_status(game, Game.ENDING, 150)
+
+        # Scores after the end of the game are not part of its timeline
+        self._score(250, 5)
+        timeline = self.processor.get_timeline(game.id)
+        self.assertEqual(timeline.last_tick, 150)
+        self.assertEqual(timeline.get_series(self.player, RESOLUTION)['score'],
+                [1, 1])
+
+        # The next game starts a timeline of its own
+        next_game = self._set_status(Game('pre', 'map', 0, 0), Game.STARTING,
+                300)
+        self._score(310, 2)
+        self.assertEqual(timeline.get_series(self.player, RESOLUTION)['score'],
+                [1, 1])
+        next_timeline = self.processor.get_timeline(next_game.id)
+        self.assertEqual(next_timeline.get_series(self.player,
+                RESOLUTION)['score'], [2])
+
+    def _score(self, tick, value):
+        self.processor.on_score(Event(tick, player=self.player, value=value))
+
+    def _set_status(self, game, status, tick):
+        game.status = status
+        game.starting = (status == Game.STARTING)
+        game.playing = (status == Game.PLAYING)
+        game.ending = (status == Game.ENDING)
+        self.processor.on_game_status(Event(tick, game=game))
+        return game
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,34 +4,28 @@ from datetime import date, datetime, time, timedelta
 class TimerManager(object):
 
     def __init__(self):
-        self.enabled_timers = dict()
-        self.disabled_timers = dict()
+        self.arena = 0
+        self.arena_ticks = dict()
+        self.player_to_timers = dict()
         self.last_tick = None
+        self.tick_count = 0
 
     def reset_timers(self):
-        self.last_tick = None
 
-        # Reset the state of each enabled timer
-        for timer in self.enabled_timers.iterkeys():
-            timer._reset()
+        # Remember the final tick of the current timer arena
+        self.arena_ticks[self.arena] = (self.last_tick, self.tick_count)
 
-        # Disable all timers
-        self.disabled_timers.update(self.enabled_timers)
-        self.enabled_timers.clear()
+        # Drop all the running timers at once
+        # Each timer settles its elapsed time the next time it is accessed
+        self.arena += 1
+        self.player_to_timers = dict()
+        self.last_tick = None
 
     def stop_player(self, player, tick):
 
-        # Find all the timers associated with the given player
-        stop_timers = None
-        for timer in self.enabled_timers.iterkeys():
-            if timer.player == player:
-                if not stop_timers:
-                    stop_timers = list()
-                stop_timers.append(timer)
-
-        # Stop all the timers for the player
-        if stop_timers:
-            for timer in stop_timers:
+        # Stop all the running timers associated with the player
+        if player in self.player_to_timers:
+            for timer in self.player_to_timers[player].keys():
                 timer.stop(tick)
 
     def apply_tick(self, tick):
@@ -40,41 +34,57 @@ class TimerManager(object):
         if self.last_tick == tick: return
         self.last_tick = tick
 
-        # Add elapsed time to each enabled timer
-        for timer in self.enabled_timers.iterkeys():
-            timer.update(tick)
+        # Running timers calculate their elapsed time from the latest tick
+        self.tick_count += 1
 
     def _update_timer(self, timer):
-        if not timer: return
+
+        # Only timers owned by a player need to be indexed
+        if not timer or not timer.player: return
 
         if timer.running:
-            if timer in self.disabled_timers:
-                del self.disabled_timers[timer]
-            self.enabled_timers[timer] = True
-        else:
-            if timer in self.enabled_timers:
-                del self.enabled_timers[timer]
-            self.disabled_timers[timer] = True
+            if not timer.player in self.player_to_timers:
+                self.player_to_timers[timer.player] = dict()
+            self.player_to_timers[timer.player][timer] = True
+        elif timer.player in self.player_to_timers:
+            player_timers = self.player_to_timers[timer.player]
+            if timer in player_timers:
+                del player_timers[timer]
+                if not player_timers:
+                    del self.player_to_timers[timer.player]
 
 timer_mgr = TimerManager()
 
 class Timer(object):
 
+    # Format constants
+    CLOCK = 'clock'
+    SECONDS = 'seconds'
+
     _BASE_TIME = datetime.combine(date.today(), time())
 
     def __init__(self, player=None):
         self.player = player
 
         self.executed = False
-        self.running = False
         self.start_tick = None
         self.last_tick = None
         self.stop_tick = None
-        self.elapsed = 0
+        self._arena = None
+        self._elapsed = 0
+        self._running = False
+        self._tick_count = None
+        self._clock = None
+        self._clock_elapsed = None
 
     def __repr__(self):
-        delta_time = timedelta(seconds=self.elapsed)
-        return str((Timer._BASE_TIME + delta_time).time())
+
+        # Only format the elapsed time again when it has changed
+        elapsed = self.elapsed
+        if elapsed != self._clock_elapsed:
+            self._clock = Timer._format_clock(elapsed)
+            self._clock_elapsed = elapsed
+        return self._clock
 
     def __lt__(self, other):
         return self.elapsed < other.elapsed
@@ -94,13 +104,61 @@ class Timer(object):
     def __ge__(self, other):
         return self.elapsed >= other.elapsed
 
+    @property
+    def elapsed(self):
+        self._apply_tick()
+        return self._elapsed
+
+    @elapsed.setter
+    def elapsed(self, value):
+        self._apply_tick()
+        self._elapsed = value
+
+    @property
+    def running(self):
+        self._apply_tick()
+        return self._running
+
+    def format(self, time_format=None):
+        '''
+        Formats the elapsed time of this timer for display.
+
+        Args:
+            time_format (string): The format to use. SECONDS returns the raw
+                    number of seconds for clients that format the time locally.
+                    None or CLOCK returns the time as a string of hours, minutes
+                    and seconds.
+
+        Returns:
+            value (object): The formatted elapsed time.
+        '''
+
+        if time_format == Timer.SECONDS:
+            return self.elapsed
+        return self.__repr__()
+
+    def merge(self, other):
+        '''
+        Adds the elapsed time of the given timer to this timer.
+
+        Args:
+            other (Timer): The timer to combine with this one.
+
+        Returns:
+            None
+        '''
+
+        self.elapsed += other.elapsed
+
     def start(self, tick):
         if self.running: return
 
         self.start_tick = tick
         self.last_tick = tick
-        self.running = True
         self.executed = True
+        self._arena = timer_mgr.arena
+        self._running = True
+        self._tick_count = timer_mgr.tick_count
 
         timer_mgr._update_timer(self)
 
@@ -112,7 +170,7 @@ class Timer(object):
         if tick < self.last_tick:
             print 'WARNING - Elapsed time is going backwards'
 
-        self.elapsed += (tick - self.last_tick)
+        self._elapsed += (tick - self.last_tick)
         self.last_tick = tick
 
     def stop(self, tick):
@@ -120,23 +178,50 @@ class Timer(object):
 
         self.stop_tick = tick
         self.update(tick)
-        self.running = False
+        self._running = False
 
         timer_mgr._update_timer(self)
 
     def reset(self):
         self.executed = False
-        self.running = False
         self.start_tick = None
         self.last_tick = None
         self.stop_tick = None
-        self.elapsed = 0
+        self._elapsed = 0
+        self._running = False
 
         timer_mgr._update_timer(self)
 
-    def _reset(self):
-        self.executed = False
-        self.running = False
-        self.start_tick = None
-        self.last_tick = None
-        self.stop_tick = None
+    @staticmethod
+    def _format_clock(elapsed):
+
+        # Whole seconds can be formatted directly as the time of day
+        if isinstance(elapsed, (int, long)):
+            seconds = elapsed % 86400
+            return '%02i:%02i:%02i' % (seconds / 3600, seconds / 60 % 60,
+                    seconds % 60)
+
+        delta_time = timedelta(seconds=elapsed)
+        return str((Timer._BASE_TIME + delta_time).time())
+
+    def _apply_tick(self):
+        if not self._running: return
+
+        if self._arena != timer_mgr.arena:
+
+            # Settle the time up to the reset that dropped the timer arena
+            last_tick, tick_count = timer_mgr.arena_ticks[self._arena]
+            if self._tick_count != tick_count:
+                self._elapsed += (last_tick - self.last_tick)
+
+            self.executed = False
+            self.start_tick = None
+            self.last_tick = None
+            self.stop_tick = None
+            self._running = False
+        elif self._tick_count != timer_mgr.tick_count:
+
+            # Accumulate the time that elapsed since the timer was last updated
+            self._elapsed += (timer_mgr.last_tick - self.last_tick)
+            self.last_tick = timer_mgr.last_tick
+            self._tick_count = timer_mgr.tick_count
@@ -350,6 +350,8 @@ $.widget('ui.table', {
    _formatSortValue: function(column, value) {
       if (column.data == 'string') {
          return value.toLowerCase();
+      } else if (column.data == 'game') {
+         return parseInt(value.id);
       } else if (column.data == 'kit' || column.data == 'map'
             || column.data == 'player' || column.data == 'team'
             || column.data == 'vehicle' || column.data == 'weapon') {
@@ -367,9 +369,9 @@ $.widget('ui.table', {
          return '<a href="players.html#id=' + value.id + '">'
                + '<img src="' + value.photo + '"/>'
                + '<span>' + value.name + '</span></a>';
-      } else if (column.data == 'kit' || column.data == 'map'
-            || column.data == 'team' || column.data == 'vehicle'
-            || column.data == 'weapon') {
+      } else if (column.data == 'game' || column.data == 'kit'
+            || column.data == 'map' || column.data == 'team'
+            || column.data == 'vehicle' || column.data == 'weapon') {
          return '<a href="' + column.data + 's.html#id=' + value.id + '">'
                + value.name + '</a>';
       } else if (column.data == 'percent' && value.length == 2) {